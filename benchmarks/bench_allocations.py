@@ -0,0 +1,133 @@
+"""
+Profiles the memory allocated by Word2Num with tracemalloc, per parse and per instance, and checks it against a baseline.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_allocations [--languages en es] [--count 500] [--record] [--tolerance 0.1]
+
+For each language, it reports:
+
+- the peak memory of building an instance and warming it up, and the memory the warm instance keeps;
+- the peak memory allocated by a single parse above what was allocated before it, averaged over the phrases,
+  in exact mode (correctly spelled phrases at fuzzy threshold 100), fuzzy mode (misspelled phrases) and
+  bulk mode (parse_many on all misspelled phrases at once, divided by the number of phrases);
+- the memory still allocated after parsing every phrase once more, which grows if parses leak.
+
+tracemalloc tracks live memory blocks rather than counting allocations, so a temporary such as a dictionary
+rebuilt on every access shows up as peak memory. The results are compared with the baseline in
+allocation_baseline.json, and the command exits with status 1 if any of them exceeds its baseline by more than
+the tolerance. Measurements depend on the Python version, so record the baseline with --record on the
+Python version the check runs on.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+from word2num import Word2Num
+
+from .bench_scorers import NUMERIC_PHRASES, generate_phrases
+
+BASELINE_PATH = Path(__file__).with_name("allocation_baseline.json")
+
+# Measurements may exceed their baseline by this many bytes on top of the relative tolerance, to absorb noise in small values.
+SLACK_BYTES = 512
+
+
+def measure_instance(language_code, fuzzy_threshold, phrases):
+    """Measures the peak memory of building and warming up an instance, and the memory the warm instance keeps."""
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    w2n = Word2Num(language_code=language_code, fuzzy_threshold=fuzzy_threshold)
+    for phrase in phrases:
+        w2n.parse(phrase)
+    current, peak = tracemalloc.get_traced_memory()
+    return w2n, {"instance_peak_bytes": peak - start, "instance_bytes": current - start}
+
+
+def measure_parses(w2n, phrases):
+    """Measures the mean peak memory of parsing each phrase, and the memory left allocated by parsing them all."""
+    start = tracemalloc.get_traced_memory()[0]
+    total_peak = 0
+    for phrase in phrases:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        w2n.parse(phrase)
+        total_peak += tracemalloc.get_traced_memory()[1] - before
+    retained = tracemalloc.get_traced_memory()[0] - start
+    return total_peak // len(phrases), retained
+
+
+def measure_bulk(w2n, phrases):
+    """Measures the peak memory of parsing all phrases with parse_many, per phrase."""
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    w2n.parse_many(phrases)
+    return (tracemalloc.get_traced_memory()[1] - before) // len(phrases)
+
+
+def profile(language_code, count):
+    """Profiles the exact, fuzzy and bulk modes of one language."""
+    exact_phrases = [NUMERIC_PHRASES[language_code][i % len(NUMERIC_PHRASES[language_code])] for i in range(count)]
+    fuzzy_phrases = generate_phrases(language_code, count)
+    results = {}
+
+    # Fill process-wide caches, such as those of compiled regular expressions, so that no instance is charged for them.
+    measure_instance(language_code, 80, exact_phrases + fuzzy_phrases)
+
+    exact_w2n, instance = measure_instance(language_code, 100, exact_phrases)
+    results.update({f"exact_{name}": value for name, value in instance.items()})
+    results["exact_parse_peak_bytes"], results["exact_parse_retained_bytes"] = measure_parses(exact_w2n, exact_phrases)
+
+    fuzzy_w2n, instance = measure_instance(language_code, 80, fuzzy_phrases)
+    results.update({f"fuzzy_{name}": value for name, value in instance.items()})
+    results["fuzzy_parse_peak_bytes"], results["fuzzy_parse_retained_bytes"] = measure_parses(fuzzy_w2n, fuzzy_phrases)
+
+    results["bulk_parse_peak_bytes"] = measure_bulk(fuzzy_w2n, fuzzy_phrases)
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Lists the measurements that exceed their baseline by more than the tolerance."""
+    exceeded = []
+    for language_code, measurements in results.items():
+        for name, value in measurements.items():
+            expected = baseline.get(language_code, {}).get(name)
+            if expected is not None and value > expected * (1 + tolerance) + SLACK_BYTES:
+                exceeded.append(f"{language_code} {name}: {value} bytes, baseline {expected} bytes")
+    return exceeded
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--languages", nargs="+", default=sorted(NUMERIC_PHRASES), choices=sorted(NUMERIC_PHRASES))
+    argument_parser.add_argument("--count", type=int, default=500)
+    argument_parser.add_argument("--record", action="store_true", help="record the results as the new baseline")
+    argument_parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative increase over the baseline")
+    arguments = argument_parser.parse_args()
+
+    tracemalloc.start()
+    results = {language_code: profile(language_code, arguments.count) for language_code in arguments.languages}
+    tracemalloc.stop()
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    for language_code, measurements in results.items():
+        print(f"{language_code}:")
+        for name, value in measurements.items():
+            expected = baseline.get(language_code, {}).get(name)
+            print(f"  {name:>28}: {value:>9} bytes" + (f" (baseline {expected})" if expected is not None else ""))
+
+    if arguments.record:
+        BASELINE_PATH.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"Recorded the baseline in {BASELINE_PATH.name}")
+        return
+
+    exceeded = regressions(results, baseline, arguments.tolerance)
+    if exceeded:
+        print("Allocations regressed:\n  " + "\n  ".join(exceeded))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmarks Word2Num.parse_nbest against parsing each hypothesis of an n-best list with Word2Num.parse.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_nbest [--language en] [--count 500] [--hypotheses 5] [--repeat 5]
+
+Like the n-best list of a speech recognizer, the hypotheses of an utterance are the distinct combinations
+of a few alternative spellings of its words, so most of their words are shared. The best time of several
+runs is reported, together with how many fuzzy scores each way calculates, confidences included.
+"""
+import argparse
+import itertools
+import random
+import time
+
+from word2num import Word2Num
+from word2num.word_matching.scorers import TheFuzzScorer
+
+from .bench_scorers import NUMERIC_PHRASES, misspell
+
+
+class CountingScorer(TheFuzzScorer):
+    """The default scorer, counting the scores it calculates."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, a, b, cutoff=0):
+        self.calls += 1
+        return super().score(a, b, cutoff)
+
+
+def generate_utterances(language_code, count, hypotheses, seed=0):
+    """Generates n-best lists whose hypotheses misspell some words of a phrase in the same ways."""
+    rng = random.Random(seed)
+    utterances = []
+    for _ in range(count):
+        words = " ".join(rng.sample(NUMERIC_PHRASES[language_code], 2)).split()
+        spellings = [[word, misspell(word, rng)] if rng.random() < 0.4 else [word] for word in words]
+        combinations = [" ".join(combination) for combination in itertools.product(*spellings)]
+        rng.shuffle(combinations)
+        utterances.append(combinations[:hypotheses])
+    return utterances
+
+
+def run(language_code, utterances, use_nbest):
+    scorer = CountingScorer()
+    w2n = Word2Num(language_code, scorer=scorer)
+    w2n.parse(utterances[0][0])
+    scorer.calls = 0
+    start = time.perf_counter()
+    if use_nbest:
+        values = [[reading.value for reading in w2n.parse_nbest(utterance)] for utterance in utterances]
+    else:
+        values = [[w2n.parse(hypothesis) for hypothesis in utterance] for utterance in utterances]
+    return values, time.perf_counter() - start, scorer.calls
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--language", default="en", choices=sorted(NUMERIC_PHRASES))
+    argument_parser.add_argument("--count", type=int, default=500)
+    argument_parser.add_argument("--hypotheses", type=int, default=5)
+    argument_parser.add_argument("--repeat", type=int, default=5)
+    arguments = argument_parser.parse_args()
+
+    utterances = generate_utterances(arguments.language, arguments.count, arguments.hypotheses)
+    hypotheses = sum(len(utterance) for utterance in utterances)
+    print(f"{arguments.count} utterances, {hypotheses} hypotheses ({arguments.language})")
+
+    results = {}
+    for name, use_nbest in [("parse", False), ("parse_nbest", True)]:
+        runs = [run(arguments.language, utterances, use_nbest) for _ in range(arguments.repeat)]
+        values, _, calls = runs[0]
+        seconds = min(seconds for _, seconds, _ in runs)
+        results[name] = values
+        print(f"{name:>11}: {seconds * 1000:8.1f} ms, {calls} fuzzy scores")
+
+    if results["parse"] != results["parse_nbest"]:
+        raise SystemExit("parse_nbest returned different values than parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmarks Word2Num.parse on mostly non-numeric traffic, with and without the vocabulary prefilter.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_prefilter [--language en] [--count 5000] [--numeric-share 0.1] [--random-words]
+
+With --random-words, the non-numeric texts are made of random pseudo-words instead of a small
+set of common words, so that almost every token misses the prefilter's memo of recent tokens.
+"""
+import argparse
+import random
+import string
+import time
+
+from thefuzz import fuzz
+
+from word2num import Word2Num
+
+NON_NUMERIC_WORDS = {
+    "en": [
+        "the", "customer", "asked", "about", "delivery", "please", "confirm",
+        "address", "weather", "tomorrow", "account", "thanks", "order", "status",
+        "payment", "received", "hello", "support", "ticket", "closed", "refund",
+    ],
+    "es": [
+        "el", "cliente", "preguntó", "por", "entrega", "favor", "confirmar",
+        "dirección", "mañana", "cuenta", "gracias", "pedido", "estado", "pago",
+        "recibido", "hola", "soporte", "cerrado", "reembolso", "tiempo",
+    ],
+}
+
+NUMERIC_PHRASES = {
+    "en": ["twenty three", "one hundred and five", "negative eight", "three quarters", "fourty two"],
+    "es": ["veintitrés", "ciento cinco", "menos ocho", "tres cuartos", "cuarenta y dos"],
+}
+
+
+def generate_traffic(language_code, count, numeric_share, random_words=False, seed=0):
+    rng = random.Random(seed)
+    words = NON_NUMERIC_WORDS[language_code]
+
+    def non_numeric_word():
+        if random_words:
+            return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+        return rng.choice(words)
+
+    traffic = []
+    for _ in range(count):
+        if rng.random() < numeric_share:
+            traffic.append(rng.choice(NUMERIC_PHRASES[language_code]))
+        else:
+            traffic.append(" ".join(non_numeric_word() for _ in range(rng.randint(1, 6))))
+    return traffic
+
+
+def run(w2n, traffic):
+    comparisons = 0
+    ratio = fuzz.ratio
+
+    def counting_ratio(*args, **kwargs):
+        nonlocal comparisons
+        comparisons += 1
+        return ratio(*args, **kwargs)
+
+    fuzz.ratio = counting_ratio
+    try:
+        start = time.perf_counter()
+        results = [w2n.parse(text) for text in traffic]
+        elapsed = time.perf_counter() - start
+    finally:
+        fuzz.ratio = ratio
+
+    return results, elapsed, comparisons
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--language", default="en", choices=sorted(NON_NUMERIC_WORDS))
+    argument_parser.add_argument("--count", type=int, default=5000)
+    argument_parser.add_argument("--numeric-share", type=float, default=0.1)
+    argument_parser.add_argument("--random-words", action="store_true")
+    arguments = argument_parser.parse_args()
+
+    traffic = generate_traffic(
+        arguments.language, arguments.count, arguments.numeric_share, arguments.random_words
+    )
+
+    filtered = Word2Num(language_code=arguments.language)
+    unfiltered = Word2Num(language_code=arguments.language)
+    for parser in (unfiltered.exact_converter, unfiltered.fuzzy_converter):
+        parser.use_prefilter = False
+
+    # Warm up both instances so that building the prefilter isn't part of the measurement.
+    run(filtered, traffic[:10])
+    run(unfiltered, traffic[:10])
+
+    filtered_results, filtered_time, filtered_comparisons = run(filtered, traffic)
+    unfiltered_results, unfiltered_time, unfiltered_comparisons = run(unfiltered, traffic)
+    assert filtered_results == unfiltered_results, "the prefilter changed parse results"
+
+    print(f"{len(traffic)} texts, {arguments.numeric_share:.0%} numeric, language {arguments.language}")
+    print(f"without prefilter: {unfiltered_time:.3f}s, {unfiltered_comparisons} fuzzy comparisons")
+    print(f"with prefilter:    {filtered_time:.3f}s, {filtered_comparisons} fuzzy comparisons")
+    print(f"speedup: {unfiltered_time / filtered_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmarks forked worker processes with and without preloading Word2Num in their parent.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_preload [--languages en es] [--workers 4] [--count 200]
+
+Like a pre-forking server, each mode starts a parent process that forks the workers. Without preloading,
+each worker builds its instances on its first request. With preloading, the parent calls
+word2num.preload.preload before forking, with and without gc.freeze. Each worker reports the latency of
+its first request per language and of the rest of its first batch of misspelled phrases, and how much of
+its memory is still shared with the parent and how much is private after the batch, as reported by
+/proc/self/smaps_rollup.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+from word2num.preload import memory_usage, preload, preloaded
+
+from .bench_scorers import NUMERIC_PHRASES, generate_phrases
+
+MODES = {
+    "cold": None,
+    "preloaded": False,
+    "preloaded+frozen": True,
+}
+
+
+def work(language_codes, phrases):
+    """Serves a worker's first requests of each language, and measures their latency and the worker's memory."""
+    first_seconds = batch_seconds = 0
+    for language_code in language_codes:
+        start = time.perf_counter()
+        w2n = preloaded(language_code)
+        w2n.parse(phrases[language_code][0])
+        first_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for phrase in phrases[language_code][1:]:
+            w2n.parse(phrase)
+        batch_seconds += time.perf_counter() - start
+    usage = memory_usage()
+    return {"first_seconds": first_seconds, "batch_seconds": batch_seconds, **(usage._asdict() if usage else {})}
+
+
+def fork_workers(language_codes, phrases, workers):
+    """Forks the workers of the current process and collects their measurements."""
+    pipes = []
+    for _ in range(workers):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            with os.fdopen(write_end, "w") as f:
+                f.write(json.dumps(work(language_codes, phrases)))
+            os._exit(0)
+        os.close(write_end)
+        pipes.append((pid, read_end))
+
+    results = []
+    for pid, read_end in pipes:
+        with os.fdopen(read_end) as f:
+            results.append(json.loads(f.read()))
+        os.waitpid(pid, 0)
+    return results
+
+
+def run_mode(freeze, language_codes, phrases, workers):
+    """Runs one mode in a fresh parent process, so that no mode sees another's instances or frozen objects."""
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        if freeze is not None:
+            preload(language_codes, freeze=freeze)
+        with os.fdopen(write_end, "w") as f:
+            f.write(json.dumps(fork_workers(language_codes, phrases, workers)))
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as f:
+        results = json.loads(f.read())
+    os.waitpid(pid, 0)
+    return results
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--languages", nargs="+", default=sorted(NUMERIC_PHRASES), choices=sorted(NUMERIC_PHRASES))
+    argument_parser.add_argument("--workers", type=int, default=4)
+    argument_parser.add_argument("--count", type=int, default=200)
+    arguments = argument_parser.parse_args()
+
+    phrases = {language_code: generate_phrases(language_code, arguments.count) for language_code in arguments.languages}
+    print(f"{arguments.workers} workers, first {arguments.count} requests per language ({', '.join(arguments.languages)})")
+    for mode, freeze in MODES.items():
+        results = run_mode(freeze, arguments.languages, phrases, arguments.workers)
+        line = (
+            f"{mode:>17}: first request {statistics.mean(r['first_seconds'] for r in results) * 1000:6.2f} ms"
+            f", rest of batch {statistics.mean(r['batch_seconds'] for r in results) * 1000:7.1f} ms"
+        )
+        if "shared" in results[0]:
+            line += (
+                f", shared {statistics.mean(r['shared'] for r in results) / 2 ** 20:6.1f} MiB"
+                f", private {statistics.mean(r['private'] for r in results) / 2 ** 20:6.1f} MiB"
+                f", pss {statistics.mean(r['pss'] for r in results) / 2 ** 20:6.1f} MiB"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
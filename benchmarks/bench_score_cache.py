@@ -0,0 +1,71 @@
+"""
+Benchmarks several Word2Num instances at different fuzzy thresholds, as for different tenants, parsing the same
+misspelled phrases with and without a shared cache of ranked scores.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_score_cache [--language en] [--count 2000] [--thresholds 70 80 90]
+"""
+import argparse
+import time
+
+from word2num import Word2Num
+from word2num.word_matching import RankedScoreCache, TheFuzzScorer
+
+from .bench_scorers import NUMERIC_PHRASES, generate_phrases
+
+
+class CountingScorer(TheFuzzScorer):
+    """Counts the fuzzy scores it calculates."""
+
+    def __init__(self):
+        self.count = 0
+
+    def score(self, a, b, cutoff=0):
+        self.count += 1
+        return super().score(a, b, cutoff)
+
+
+def run(tenants, phrases):
+    start = time.perf_counter()
+    results = [[w2n.parse(phrase) for phrase in phrases] for w2n in tenants]
+    return results, time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--language", default="en", choices=sorted(NUMERIC_PHRASES))
+    argument_parser.add_argument("--count", type=int, default=2000)
+    argument_parser.add_argument("--thresholds", type=int, nargs="+", default=[70, 80, 90])
+    arguments = argument_parser.parse_args()
+
+    phrases = generate_phrases(arguments.language, arguments.count)
+    print(f"{len(phrases)} misspelled phrases, language {arguments.language}, thresholds {arguments.thresholds}")
+
+    expected = None
+    for name, score_cache in [("no cache", False), ("shared cache", RankedScoreCache())]:
+        scorer = CountingScorer()
+        tenants = [
+            Word2Num(
+                language_code=arguments.language,
+                fuzzy_threshold=threshold,
+                scorer=scorer,
+                score_cache=score_cache,
+            )
+            for threshold in arguments.thresholds
+        ]
+        # Warm up each tenant's prefilter on other phrases, so that only matching is compared.
+        run(tenants, generate_phrases(arguments.language, arguments.count, seed=1))
+        if score_cache:
+            score_cache.clear()
+        scorer.count = 0
+
+        results, elapsed = run(tenants, phrases)
+        if expected is None:
+            expected = results
+        assert results == expected, f"{name} changed parse results"
+        print(f"{name:>12}: {elapsed:.3f}s, {scorer.count} fuzzy scores")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmarks Word2Num.parse on misspelled number phrases with each fuzzy scorer backend.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scorers [--language en] [--count 2000]
+
+Every phrase needs the fuzzy parser, so the time is dominated by fuzzy matching.
+"""
+import argparse
+import random
+import time
+
+from word2num import Word2Num
+from word2num.word_matching.scorers import scorers
+
+NUMERIC_PHRASES = {
+    "en": [
+        "twenty three", "one hundred and five", "negative eight", "three quarters", "fifty seven thousand",
+        "two million four hundred", "nine point five", "one and a half", "seventeen billion", "sixty one",
+    ],
+    "es": [
+        "veintitrés", "ciento cinco", "menos ocho", "tres cuartos", "cincuenta y siete mil",
+        "dos millones cuatrocientos", "nueve punto cinco", "uno y medio", "diecisiete mil", "sesenta y uno",
+    ],
+}
+
+
+def misspell(word, rng):
+    characters = list(word)
+    position = rng.randrange(len(characters))
+    operation = rng.choice(["insert", "delete", "replace"])
+    if operation == "insert":
+        characters.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+    elif operation == "delete" and len(characters) > 3:
+        del characters[position]
+    else:
+        characters[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(characters)
+
+
+def generate_phrases(language_code, count, seed=0):
+    rng = random.Random(seed)
+    phrases = []
+    for _ in range(count):
+        words = rng.choice(NUMERIC_PHRASES[language_code]).split()
+        index = rng.randrange(len(words))
+        words[index] = misspell(words[index], rng)
+        phrases.append(" ".join(words))
+    return phrases
+
+
+def run(w2n, phrases):
+    start = time.perf_counter()
+    results = [w2n.parse(phrase) for phrase in phrases]
+    return results, time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--language", default="en", choices=sorted(NUMERIC_PHRASES))
+    argument_parser.add_argument("--count", type=int, default=2000)
+    arguments = argument_parser.parse_args()
+
+    phrases = generate_phrases(arguments.language, arguments.count)
+    print(f"{len(phrases)} misspelled phrases, language {arguments.language}")
+
+    expected = None
+    for name in scorers:
+        w2n = Word2Num(language_code=arguments.language, scorer=name)
+        run(w2n, phrases[:10])
+        results, elapsed = run(w2n, phrases)
+        if expected is None:
+            expected = results
+        assert results == expected, f"the {name} scorer changed parse results"
+        print(f"{name:>12}: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
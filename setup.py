@@ -3,9 +3,13 @@ from setuptools import find_packages, setup
 with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
 
+version = {}
+with open("word2num/version.py", "r", encoding="utf-8") as f:
+    exec(f.read(), version)
+
 setup(
     name="word2num",
-    version="0.1.2",
+    version=version["__version__"],
     author="Bryson Thill",
     author_email="bryson@streamliners.dev",
     description="Converts numbers expressed in words to numerical values.",
@@ -15,6 +19,11 @@ setup(
     license="MIT",
     packages=find_packages(),
     install_requires=["thefuzz>=0.19.0", "python-Levenshtein>=0.20.4"],
+    extras_require={
+        "pandas": ["pandas>=1.1", "numpy>=1.17"],
+        "arrow": ["pyarrow>=7.0"],
+        "rapidfuzz": ["rapidfuzz>=2.0"],
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from word2num import Word2Num
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+@unittest.skipUnless(pa is not None, "requires pyarrow")
+class TestArrowConversion(unittest.TestCase):
+    def test_string_array(self):
+        from word2num.columnar import convert_arrow_array
+
+        array = pa.array(["one", None, "twenty three", "jirafa", "one"])
+        result = convert_arrow_array(array)
+
+        self.assertEqual(result.type, pa.float64())
+        self.assertEqual(result.to_pylist(), [1, None, 23, None, 1])
+        self.assertEqual(result.null_count, 2)
+
+    def test_dictionary_array(self):
+        from word2num.columnar import convert_arrow_array
+
+        array = pa.array(["dos", "tres", "dos", None]).dictionary_encode()
+        result = convert_arrow_array(array, w2n=Word2Num(language_code="es"))
+
+        self.assertEqual(result.to_pylist(), [2, 3, 2, None])
+
+    def test_chunked_array(self):
+        from word2num.columnar import convert_arrow_array
+
+        array = pa.chunked_array([["one", "two"], ["two", "half"]])
+        result = convert_arrow_array(array)
+
+        self.assertIsInstance(result, pa.ChunkedArray)
+        self.assertEqual(result.to_pylist(), [1, 2, 2, 0.5])
+
+    def test_distinct_values_parsed_once(self):
+        from word2num.columnar import ArrowConverter
+
+        calls = []
+        w2n = Word2Num()
+        parse_many = w2n.parse_many
+
+        def counting_parse_many(texts, processes=None):
+            calls.extend(texts)
+            return parse_many(texts, processes=processes)
+
+        w2n.parse_many = counting_parse_many
+        converter = ArrowConverter(w2n)
+        converter.convert(pa.array(["six", "six", "ten"]))
+        converter.convert(pa.array(["ten", "six", "nine"]))
+
+        self.assertEqual(sorted(calls), ["nine", "six", "ten"])
+
+    def test_cache_limit(self):
+        from word2num.columnar import ArrowConverter
+
+        converter = ArrowConverter(max_cached_values=2)
+        self.assertEqual(converter.convert(pa.array(["one", "two"])).to_pylist(), [1, 2])
+        self.assertEqual(
+            converter.convert(pa.array(["three", "one"])).to_pylist(), [3, 1]
+        )
+
+    def test_parquet_column(self):
+        from word2num.columnar import convert_parquet_column
+
+        table = pa.table(
+            {
+                "id": list(range(6)),
+                "text": ["one", "two", None, "three", "nope", "one"],
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "numbers.parquet")
+            pq.write_table(table, path)
+            batches = list(convert_parquet_column(path, "text", batch_size=4))
+
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+        self.assertEqual(
+            [value for batch in batches for value in batch.to_pylist()],
+            [1, 2, None, 3, None, 1],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from word2num import Word2Num
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+@unittest.skipUnless(np is not None, "requires NumPy")
+class TestConvertNumpyColumn(unittest.TestCase):
+    def test_float_array(self):
+        from word2num.columnar import convert_column
+
+        column = np.array(["one", "two hundred", "jirafa", None, "one"], dtype=object)
+        result = convert_column(column)
+
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[1], 200)
+        self.assertTrue(np.isnan(result[2]))
+        self.assertTrue(np.isnan(result[3]))
+        self.assertEqual(result[4], 1)
+
+    def test_language(self):
+        from word2num.columnar import convert_column
+
+        column = np.array(["siete mil", "medio"], dtype=object)
+        result = convert_column(column, w2n=Word2Num(language_code="es"))
+
+        self.assertEqual(list(result), [7000, 0.5])
+
+    def test_distinct_values_parsed_once(self):
+        from word2num.columnar import convert_column
+
+        calls = []
+        w2n = Word2Num()
+        parse_many = w2n.parse_many
+
+        def counting_parse_many(texts, processes=None):
+            calls.extend(texts)
+            return parse_many(texts, processes=processes)
+
+        w2n.parse_many = counting_parse_many
+        convert_column(np.array(["six", "six", "ten", "six"], dtype=object), w2n=w2n)
+
+        self.assertEqual(sorted(calls), ["six", "ten"])
+
+
+@unittest.skipUnless(pd is not None, "requires pandas")
+class TestConvertPandasColumn(unittest.TestCase):
+    def test_series_keeps_index(self):
+        from word2num.columnar import convert_column
+
+        series = pd.Series(["three", "minus eight", "nope"], index=[10, 20, 30], name="amount")
+        result = convert_column(series)
+
+        self.assertIsInstance(result, pd.Series)
+        self.assertEqual(list(result.index), [10, 20, 30])
+        self.assertEqual(result.name, "amount")
+        self.assertEqual(result[10], 3)
+        self.assertEqual(result[20], -8)
+        self.assertTrue(np.isnan(result[30]))
+
+    def test_nullable_integers(self):
+        from word2num.columnar import convert_column
+
+        series = pd.Series(["forty two", "one half", None, "seven"])
+        result = convert_column(series, dtype="Int64")
+
+        self.assertEqual(str(result.dtype), "Int64")
+        self.assertEqual(result[0], 42)
+        self.assertIs(result[1], pd.NA)
+        self.assertIs(result[2], pd.NA)
+        self.assertEqual(result[3], 7)
+
+    def test_processes(self):
+        from word2num.columnar import convert_column
+
+        series = pd.Series(["one", "two", "three", "four"] * 3)
+        result = convert_column(series, processes=2)
+
+        self.assertEqual(list(result), [1, 2, 3, 4] * 3)
+
+    def test_unsupported_dtype(self):
+        from word2num.columnar import convert_column
+
+        with self.assertRaises(ValueError):
+            convert_column(pd.Series(["one"]), dtype="int8")
+
+
+if __name__ == "__main__":
+    unittest.main()
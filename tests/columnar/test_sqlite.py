@@ -0,0 +1,66 @@
+import sqlite3
+import unittest
+
+from word2num import Word2Num
+from word2num.columnar import register_sqlite_function
+
+
+class TestSqliteFunction(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        register_sqlite_function(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def query(self, sql, *parameters):
+        return self.connection.execute(sql, parameters).fetchone()[0]
+
+    def test_values(self):
+        self.assertEqual(self.query("SELECT word2num('twenty three')"), 23)
+        self.assertEqual(self.query("SELECT typeof(word2num('twenty three'))"), "integer")
+        self.assertEqual(self.query("SELECT word2num('one and a half')"), 1.5)
+        self.assertEqual(self.query("SELECT typeof(word2num('one and a half'))"), "real")
+        self.assertEqual(self.query("SELECT word2num('seventeen billion')"), 17000000000)
+        self.assertIsNone(self.query("SELECT word2num('jirafa')"))
+        self.assertIsNone(self.query("SELECT word2num(NULL)"))
+        self.assertEqual(self.query("SELECT word2num(42)"), 42)
+
+    def test_language_and_threshold(self):
+        self.assertEqual(self.query("SELECT word2num('ciento cinco', 'es')"), 105)
+        self.assertEqual(self.query("SELECT word2num('veintitrés', 'auto')"), 23)
+        self.assertEqual(self.query("SELECT word2num('twnety three', 'en', 80)"), 23)
+        self.assertIsNone(self.query("SELECT word2num('twnety three', 'en', 100)"))
+        self.assertEqual(self.query("SELECT word2num(?, ?, ?)", "tres", "es", 90), 3)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            self.query("SELECT word2num('one', 'xx')")
+
+    def test_update_in_place(self):
+        self.connection.execute("CREATE TABLE amounts (text TEXT, value NUMERIC)")
+        texts = ["one", "twenty three", None, "jirafa", "one", "minus two point five"]
+        self.connection.executemany("INSERT INTO amounts (text) VALUES (?)", [(text,) for text in texts])
+
+        self.connection.execute("UPDATE amounts SET value = word2num(text)")
+
+        values = [row[0] for row in self.connection.execute("SELECT value FROM amounts ORDER BY rowid")]
+        self.assertEqual(values, [1, 23, None, None, 1, -2.5])
+
+    def test_deterministic(self):
+        # Only deterministic functions may be used in index expressions.
+        self.connection.execute("CREATE TABLE amounts (text TEXT)")
+        self.connection.execute("CREATE INDEX amounts_value ON amounts (word2num(text))")
+        self.connection.executemany("INSERT INTO amounts VALUES (?)", [("two",), ("one",), ("three",)])
+
+        rows = self.connection.execute("SELECT text FROM amounts WHERE word2num(text) > 1 ORDER BY word2num(text)")
+        self.assertEqual([row[0] for row in rows], ["two", "three"])
+
+    def test_instance_and_name(self):
+        register_sqlite_function(self.connection, w2n=Word2Num(language_code="es"), name="palabras_a_numero")
+
+        self.assertEqual(self.query("SELECT palabras_a_numero('dos mil')"), 2000)
+        self.assertEqual(self.query("SELECT word2num('two thousand')"), 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
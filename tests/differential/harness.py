@@ -0,0 +1,459 @@
+"""
+Differential fuzzing harness: generates noisy number phrases from the vocabularies, parses them with
+every engine configuration and compares the results with the reference oracle.
+
+Run a long fuzzing session from the repository root:
+
+    python -m tests.differential.harness [--language en] [--count 10000] [--seed 0] [--threshold 80]
+
+Each disagreement is reported with a minimized phrase that reproduces it.
+"""
+import argparse
+import random
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from word2num import ParseBudget, Word2Num
+from word2num.languages.packs import LanguagePack
+from word2num.tokenization import SimpleTokenizer
+from word2num.word_matching import AliasTable, RankedScoreCache, VocabularyRegistry
+
+from .reference import AUTO_LANGUAGE_CODE, REFERENCE_LANGUAGES, ExtraWord, reference_parse
+
+Engine = Callable[[str], Optional[float]]
+
+# Words added to each language's vocabulary by the extended vocabulary engine and its reference.
+EXTRA_WORDS: Dict[str, Tuple[ExtraWord, ...]] = {
+    "en": (("units", "grand", 1000), ("whole_numbers", "dozen", 12)),
+    "es": (("units", "millar", 1000), ("whole_numbers", "docena", 12)),
+}
+
+JUNK_WORDS = ["giraffe", "the", "walrus", "xyz", "ok", "tree", "once", "ten", "sin", "y", "and"]
+
+
+def _default_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    return Word2Num(language_code, fuzzy_threshold).parse
+
+
+def _no_prefilter_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    w2n = Word2Num(language_code, fuzzy_threshold)
+    for parser in (w2n.exact_converter, w2n.fuzzy_converter):
+        if parser:
+            parser.use_prefilter = False
+    return w2n.parse
+
+
+def _parse_tokens_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    w2n = Word2Num(language_code, fuzzy_threshold)
+    return lambda text: w2n.parse_tokens(SimpleTokenizer().tokenize(text))
+
+
+def _auto_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    # Compared with the reference's detection of the language, which isn't always the language of the phrase.
+    return Word2Num(AUTO_LANGUAGE_CODE, fuzzy_threshold).parse
+
+
+class _ParseManyEngine:
+    """
+    Parses with Word2Num.parse_many, which only spreads the work across workers when there are several distinct texts.
+    So the phrases being compared are parsed as one batch up front, and any other phrase, such as a minimized one,
+    is parsed together with its uppercase form, which is a distinct text with the same value.
+    """
+
+    def __init__(self, w2n: Word2Num, **workers: int):
+        self.w2n = w2n
+        self.workers = workers
+        self.values: Dict[str, Optional[float]] = {}
+
+    def prepare(self, texts: List[str]) -> None:
+        """Parses the given phrases as one batch. If one of them raises an exception, each is parsed on its own instead."""
+        texts = list(dict.fromkeys(texts))
+        try:
+            self.values.update(zip(texts, self.w2n.parse_many(texts, **self.workers)))
+        except Exception:
+            pass
+
+    def __call__(self, text: str) -> Optional[float]:
+        if text in self.values:
+            return self.values[text]
+        return self.w2n.parse_many([text, text.upper()], **self.workers)[0]
+
+
+def _parse_many_engine(**workers: int) -> Callable[[str, float], Engine]:
+    def create_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+        return _ParseManyEngine(Word2Num(language_code, fuzzy_threshold), **workers)
+
+    return create_engine
+
+
+def _extended_vocabulary_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    # Compared with a reference that has the same extra words, which its own registry keeps from the other engines.
+    w2n = Word2Num(language_code, fuzzy_threshold, vocabulary_registry=VocabularyRegistry())
+    for category, word, value in EXTRA_WORDS[language_code]:
+        w2n.add_words(category, {word: value})
+    return w2n.parse
+
+
+def _language_pack_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    language_pack = LanguagePack.from_bytes(LanguagePack.compile(language_code).to_bytes())
+    # A pack with the constructor's options, including a budget that is never exceeded.
+    budget = ParseBudget(max_tokens=1000, max_fuzzy_comparisons=10 ** 9, timeout=60)
+    return Word2Num.from_language_pack(language_pack, fuzzy_threshold, budget=budget, scorer="bitparallel").parse
+
+
+def _budget_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    budget = ParseBudget(max_tokens=1000, max_fuzzy_comparisons=10 ** 9, timeout=60)
+    return Word2Num(language_code, fuzzy_threshold, budget=budget).parse
+
+
+def _trace_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    w2n = Word2Num(language_code, fuzzy_threshold)
+    return lambda text: w2n.trace(text).value
+
+
+def _incremental_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    w2n = Word2Num(language_code, fuzzy_threshold)
+
+    def parse(text: str) -> Optional[float]:
+        parser = w2n.incremental()
+        for word in SimpleTokenizer().tokenize(text):
+            parser.push(word)
+        return parser.value
+
+    return parse
+
+
+def _scorer_engine(scorer_name: str) -> Callable[[str, float], Engine]:
+    def create_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+        return Word2Num(language_code, fuzzy_threshold, scorer=scorer_name).parse
+
+    return create_engine
+
+
+def _score_cache_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    # The cache is shared with instances at a higher and a lower threshold, which rank each phrase's words first.
+    score_cache = RankedScoreCache()
+    others = [
+        Word2Num(language_code, min(fuzzy_threshold + 10, 99), score_cache=score_cache),
+        Word2Num(language_code, max(fuzzy_threshold - 20, 0), score_cache=score_cache),
+    ]
+    w2n = Word2Num(language_code, fuzzy_threshold, score_cache=score_cache)
+
+    def parse(text: str) -> Optional[float]:
+        for other in others:
+            outcome(other.parse, text)
+        return w2n.parse(text)
+
+    return parse
+
+
+def _aliases_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    # Every fuzzy match becomes an alias the first time it is made, so the second parse of each phrase looks its aliases up.
+    w2n = Word2Num(language_code, fuzzy_threshold, aliases=AliasTable(min_count=1, min_score=0))
+
+    def parse(text: str) -> Optional[float]:
+        outcome(w2n.parse, text)
+        return w2n.parse(text)
+
+    return parse
+
+
+def _nbest_engine(language_code: str, fuzzy_threshold: float) -> Engine:
+    # The phrase is the top hypothesis, followed by variants that share its words, as a speech recognizer's would be.
+    w2n = Word2Num(language_code, fuzzy_threshold)
+
+    def parse(text: str) -> Optional[float]:
+        words = text.split()
+        variants = [" ".join(words[:index] + words[index + 1 :]) for index in range(min(len(words), 3))]
+        return w2n.parse_nbest([text, *variants, *reversed(variants)])[0].value
+
+    return parse
+
+
+# Every engine configuration that must agree with the reference, keyed by name.
+ENGINES: Dict[str, Callable[[str, float], Engine]] = {
+    "default": _default_engine,
+    "parse_tokens": _parse_tokens_engine,
+    "auto": _auto_engine,
+    "parse_many_threads": _parse_many_engine(threads=2),
+    "parse_many_processes": _parse_many_engine(processes=2),
+    "extended_vocabulary": _extended_vocabulary_engine,
+    "no_prefilter": _no_prefilter_engine,
+    "language_pack": _language_pack_engine,
+    "budget": _budget_engine,
+    "trace": _trace_engine,
+    "incremental": _incremental_engine,
+    "rapidfuzz_scorer": _scorer_engine("rapidfuzz"),
+    "bitparallel_scorer": _scorer_engine("bitparallel"),
+    "score_cache": _score_cache_engine,
+    "aliases": _aliases_engine,
+    "nbest": _nbest_engine,
+}
+
+
+def _reference(language_code: str, fuzzy_threshold: float) -> Engine:
+    return lambda text: reference_parse(text, language_code, fuzzy_threshold)
+
+
+def _auto_reference(language_code: str, fuzzy_threshold: float) -> Engine:
+    return lambda text: reference_parse(text, AUTO_LANGUAGE_CODE, fuzzy_threshold)
+
+
+def _extended_vocabulary_reference(language_code: str, fuzzy_threshold: float) -> Engine:
+    return lambda text: reference_parse(text, language_code, fuzzy_threshold, EXTRA_WORDS[language_code])
+
+
+# References of the engines that aren't compared with the plain reference of the phrases' language, keyed by engine name.
+REFERENCES: Dict[str, Callable[[str, float], Engine]] = {
+    "auto": _auto_reference,
+    "extended_vocabulary": _extended_vocabulary_reference,
+}
+
+
+class Disagreement(NamedTuple):
+    """A phrase that an engine parses differently from the reference."""
+
+    engine: str
+    language_code: str
+    fuzzy_threshold: float
+    text: str
+    expected: object
+    actual: object
+
+    def __str__(self) -> str:
+        return (
+            f"{self.engine} ({self.language_code}, threshold {self.fuzzy_threshold}) parsed {self.text!r} "
+            f"as {self.actual!r}, the reference as {self.expected!r}"
+        )
+
+
+def outcome(parse: Engine, text: str) -> object:
+    """The result of parsing a text, or the type of the exception it raised, so that crashes are compared too."""
+    try:
+        return parse(text)
+    except Exception as error:
+        return type(error).__name__
+
+
+class PhraseGenerator:
+    """
+    Generates number phrases from a language's vocabulary: mostly well-formed sequences of
+    number words, with misspellings, numerals, junk words and shuffled word order mixed in.
+    """
+
+    def __init__(self, language_code: str, seed: int = 0):
+        """
+        :param language_code: The language whose vocabulary to draw words from.
+        :param seed: Seed of the random number generator, so that runs are reproducible.
+        """
+        self.rng = random.Random(seed)
+        language = REFERENCE_LANGUAGES[language_code]
+        vocabulary = language.vocabulary
+
+        self.digits = list(vocabulary.digits)
+        self.whole_numbers = [word for word in vocabulary.whole_numbers if word not in vocabulary.units]
+        self.units = list(vocabulary.units)
+        self.denominators = [
+            *vocabulary.irregular_denominators,
+            *(word + "s" for word in vocabulary.irregular_denominators),
+            *(word + language.regular_denominator_suffix for word in self.whole_numbers),
+        ]
+        self.negative_signifiers = list(vocabulary.negative_signifiers)
+        self.decimal_separators = list(vocabulary.decimal_separators)
+        self.fraction_separators = list(vocabulary.fraction_separators)
+        self.indefinite_articles = list(vocabulary.indefinite_articles)
+        self.ignored_words = list(language.ignored_words)
+        self.decimal_mark = language.decimal_mark
+        self.grouping_mark = language.grouping_mark
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            yield self.phrase()
+
+    def phrase(self) -> str:
+        """Generates one phrase."""
+        rng = self.rng
+        words: List[str] = []
+
+        if rng.random() < 0.15:
+            words.append(rng.choice(self.negative_signifiers))
+
+        for _ in range(rng.randint(1, 3)):
+            words.extend(self._group())
+            if rng.random() < 0.6:
+                words.append(rng.choice(self.units))
+
+        if rng.random() < 0.15:
+            words.append(rng.choice(self.decimal_separators))
+            # Decimal digits are digit words, numerals, or both.
+            words.extend(
+                rng.choice(self.digits) if rng.random() < 0.7 else str(rng.randint(0, 99)) for _ in range(rng.randint(0, 3))
+            )
+        elif rng.random() < 0.15:
+            if rng.random() < 0.5:
+                words.append(rng.choice(self.fraction_separators))
+            words.append(rng.choice([*self.indefinite_articles, *self.digits]))
+            words.append(rng.choice(self.denominators))
+
+        if rng.random() < 0.05:
+            words.append(rng.choice(self.negative_signifiers))
+        if rng.random() < 0.2:
+            rng.shuffle(words)
+
+        return " ".join(self._add_noise(word) for word in words)
+
+    def _group(self) -> List[str]:
+        rng = self.rng
+        choice = rng.random()
+        if choice < 0.4:
+            return [rng.choice(self.whole_numbers)]
+        if choice < 0.6:
+            return [rng.choice(self.digits) for _ in range(rng.randint(2, 4))]
+        if choice < 0.8:
+            return [rng.choice(self.digits), rng.choice(self.ignored_words), rng.choice(self.whole_numbers)]
+        return [self._numeral()]
+
+    def _numeral(self) -> str:
+        rng = self.rng
+        integer = rng.choice([str(rng.randint(0, 999)), f"{rng.randint(1, 999)}{self.grouping_mark}{rng.randint(0, 999):03}"])
+        if rng.random() < 0.3:
+            integer += self.decimal_mark + str(rng.randint(0, 99))
+        return integer
+
+    def _add_noise(self, word: str) -> str:
+        rng = self.rng
+        choice = rng.random()
+        if choice < 0.7 or not word.isalpha():
+            return word
+        if choice < 0.8:
+            return rng.choice(JUNK_WORDS)
+
+        characters = list(word)
+        position = rng.randrange(len(characters))
+        if choice < 0.85:
+            del characters[position]
+        elif choice < 0.9:
+            characters.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+        elif choice < 0.95:
+            characters[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        elif position + 1 < len(characters):
+            characters[position], characters[position + 1] = characters[position + 1], characters[position]
+        return "".join(characters) or word
+
+
+def minimize(text: str, disagrees: Callable[[str], bool]) -> str:
+    """
+    Shrinks a phrase while it still makes an engine disagree with the reference:
+    first by dropping whole words, then by dropping single characters of the remaining words.
+
+    :param text: A phrase the engine disagrees on.
+    :param disagrees: Checks whether the engine still disagrees on a phrase.
+    :return: A phrase that can't be shrunk any further this way.
+    """
+    words = text.split()
+
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for i in range(len(words)):
+            candidate = words[:i] + words[i + 1 :]
+            if candidate and disagrees(" ".join(candidate)):
+                words = candidate
+                shrunk = True
+                break
+
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for i, word in enumerate(words):
+            for j in range(len(word)):
+                candidate_word = word[:j] + word[j + 1 :]
+                if not candidate_word:
+                    continue
+                candidate = words[:i] + [candidate_word] + words[i + 1 :]
+                if disagrees(" ".join(candidate)):
+                    words = candidate
+                    shrunk = True
+                    break
+            if shrunk:
+                break
+
+    return " ".join(words)
+
+
+def find_disagreements(
+    language_code: str,
+    fuzzy_threshold: float,
+    texts: List[str],
+    engines: Optional[Dict[str, Callable[[str, float], Engine]]] = None,
+    max_reports: int = 10,
+) -> List[Disagreement]:
+    """
+    Parses texts with every engine and compares the results with the reference.
+
+    :param language_code: The language of the texts.
+    :param fuzzy_threshold: The minimum score for fuzzy string matching.
+    :param texts: The phrases to parse.
+    :param engines: Engine factories keyed by name (default: every engine configuration).
+    :param max_reports: Maximum number of disagreements to minimize and report.
+    :return: The disagreements, each with a minimized phrase.
+    """
+    engines = ENGINES if engines is None else engines
+    parsers = {name: factory(language_code, fuzzy_threshold) for name, factory in engines.items()}
+    for parse in parsers.values():
+        if isinstance(parse, _ParseManyEngine):
+            parse.prepare(texts)
+
+    reference = _reference(language_code, fuzzy_threshold)
+    references = {
+        name: REFERENCES[name](language_code, fuzzy_threshold) if name in REFERENCES else reference for name in parsers
+    }
+    # Reference outcomes keyed by the reference and the text, since most engines share the same reference.
+    reference_outcomes: Dict[Tuple[Engine, str], object] = {}
+
+    def expected(name: str, text: str) -> object:
+        key = (references[name], text)
+        if key not in reference_outcomes:
+            reference_outcomes[key] = outcome(references[name], text)
+        return reference_outcomes[key]
+
+    disagreements = []
+    for text in texts:
+        for name, parse in parsers.items():
+            if outcome(parse, text) == expected(name, text):
+                continue
+
+            minimized = minimize(text, lambda candidate: outcome(parse, candidate) != expected(name, candidate))
+            disagreements.append(
+                Disagreement(
+                    name, language_code, fuzzy_threshold, minimized, expected(name, minimized), outcome(parse, minimized)
+                )
+            )
+            if len(disagreements) >= max_reports:
+                return disagreements
+
+    return disagreements
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(
+        description="Compares every parsing engine with the reference oracle on random noisy phrases."
+    )
+    argument_parser.add_argument("--language", default="en", choices=sorted(REFERENCE_LANGUAGES))
+    argument_parser.add_argument("--count", type=int, default=10_000)
+    argument_parser.add_argument("--seed", type=int, default=0)
+    argument_parser.add_argument("--threshold", type=int, default=80)
+    argument_parser.add_argument("--engine", action="append", choices=sorted(ENGINES), help="Only compare these engines.")
+    arguments = argument_parser.parse_args()
+
+    engines = {name: ENGINES[name] for name in arguments.engine} if arguments.engine else ENGINES
+    generator = iter(PhraseGenerator(arguments.language, arguments.seed))
+    texts = [next(generator) for _ in range(arguments.count)]
+
+    disagreements = find_disagreements(arguments.language, arguments.threshold, texts, engines)
+    for disagreement in disagreements:
+        print(disagreement)
+    print(f"{len(disagreements)} disagreements in {len(texts)} phrases")
+
+
+if __name__ == "__main__":
+    main()
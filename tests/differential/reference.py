@@ -0,0 +1,392 @@
+"""
+Reference oracle for differential testing.
+
+This is a frozen, deliberately unoptimized copy of the parsing algorithm of `StandardParser` and `WordMatcher`:
+words are matched with a linear scan of plain `fuzz.ratio` scores, denominator forms are recomputed on every use,
+and there is no prefilter, index or cache of any kind. Optimized engines must give the same answers.
+
+The language of a phrase is detected the same way, with a linear scan of every vocabulary word of every language.
+
+Misspelled words are only matched where the number grammar allows them: words that are exactly whole number words
+are never mistaken for a unit. After a tens word, a misspelled word read as a whole number other than a digit
+makes the phrase unparseable, and after a decimal separator, misspelled words can only be digits.
+
+Change this module only when the intended behavior of the parser changes, never to make an optimization pass.
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from thefuzz import fuzz
+
+from word2num.languages.en.vocabulary import EnglishVocabulary
+from word2num.languages.es.vocabulary import SpanishVocabulary
+from word2num.word_matching.vocabulary import Vocabulary
+
+AUTO_LANGUAGE_CODE = "auto"
+TOKEN_PATTERN = re.compile(r"(?:(?<!\w)-)?\d+(?:[.,]\d+)*|[A-Za-zÀ-ÖØ-öø-ÿ]+")
+
+
+class ReferenceLanguage(NamedTuple):
+    """The language-specific rules of the parser."""
+
+    vocabulary: Vocabulary
+    ignored_words: Tuple[str, ...]
+    decimal_mark: str
+    grouping_mark: str
+    # Pattern that extracts the whole number of a regular denominator, and the suffix that forms one.
+    regular_denominator_pattern: str
+    regular_denominator_suffix: str
+    # Whether a negative signifier may also follow the number (as in "dos negativo").
+    trailing_negative_signifier: bool
+
+
+# A word added to the vocabulary: its category (digits, whole numbers, units or irregular denominators), the word and its value.
+ExtraWord = Tuple[str, str, int]
+
+REFERENCE_LANGUAGES = {
+    "en": ReferenceLanguage(
+        vocabulary=EnglishVocabulary(),
+        ignored_words=("and",),
+        decimal_mark=".",
+        grouping_mark=",",
+        regular_denominator_pattern=r"([A-Z]+)ths?",
+        regular_denominator_suffix="th",
+        trailing_negative_signifier=False,
+    ),
+    "es": ReferenceLanguage(
+        vocabulary=SpanishVocabulary(),
+        ignored_words=("y",),
+        decimal_mark=",",
+        grouping_mark=".",
+        regular_denominator_pattern=r"([A-Z]+)avos?",
+        regular_denominator_suffix="avo",
+        trailing_negative_signifier=True,
+    ),
+}
+
+
+class ReferenceParser:
+    """The reference implementation of parsing a number phrase in one language at one fuzzy threshold."""
+
+    def __init__(self, language_code: str, fuzzy_threshold: float, extra_words: Tuple[ExtraWord, ...] = ()):
+        self.language = REFERENCE_LANGUAGES[language_code]
+        self.fuzzy_threshold = fuzzy_threshold
+
+        vocabulary = self.language.vocabulary
+        self.digits: Dict[str, int] = vocabulary.digits
+        self.whole_numbers: Dict[str, int] = vocabulary.whole_numbers
+        self.units: Dict[str, int] = vocabulary.units
+        self.irregular_denominators: Dict[str, int] = vocabulary.irregular_denominators
+        self.fraction_separators: List[str] = list(vocabulary.fraction_separators)
+        self.decimal_separators: List[str] = list(vocabulary.decimal_separators)
+        self.negative_signifiers: List[str] = list(vocabulary.negative_signifiers)
+        self.indefinite_articles: List[str] = list(vocabulary.indefinite_articles)
+
+        for category, word, value in extra_words:
+            # Digits and units are whole numbers too.
+            for name in (category, "whole_numbers") if category in ("digits", "units") else (category,):
+                setattr(self, name, {**getattr(self, name), word: value})
+
+    # Matching
+
+    def match(self, word: str, candidates) -> Optional[str]:
+        if word in candidates:
+            return word
+        if self.fuzzy_threshold >= 100:
+            return None
+
+        best_score = 0
+        best_match = None
+        for candidate in candidates:
+            score = fuzz.ratio(word, candidate)
+            if score == 100:
+                return word
+            if score > best_score:
+                best_score = score
+                best_match = candidate
+
+        return best_match if best_score >= self.fuzzy_threshold else None
+
+    def denominator_form(self, word: str) -> str:
+        irregular_words = {value: name for name, value in self.irregular_denominators.items()}
+        value = self.whole_numbers[word]
+        if value in irregular_words:
+            return irregular_words[value]
+        return word + self.language.regular_denominator_suffix
+
+    def match_denominator(self, word: str) -> Optional[float]:
+        irregular_value, irregular_score = None, 0
+        singular_word = word.rstrip("s")
+        irregular_match = self.match(singular_word, self.irregular_denominators)
+        if irregular_match:
+            irregular_value = self.irregular_denominators[irregular_match]
+            irregular_score = fuzz.ratio(singular_word, irregular_match)
+
+        regular_value, regular_score = None, 0
+        pattern_match = re.match(self.language.regular_denominator_pattern, word, flags=re.IGNORECASE)
+        base_word = self.match(pattern_match.group(1), self.whole_numbers) if pattern_match else None
+        if base_word:
+            score = fuzz.ratio(word, self.denominator_form(base_word))
+            if score >= self.fuzzy_threshold:
+                regular_value, regular_score = self.whole_numbers[base_word], score
+
+        if irregular_score and regular_score:
+            return irregular_value if irregular_score > regular_score else regular_value
+        if irregular_score:
+            return irregular_value
+        if regular_score:
+            return regular_value
+        return None
+
+    # Numerals
+
+    def parse_numeral(self, word: str) -> Optional[float]:
+        if not word[:1].isdecimal():
+            return None
+        integer_part, decimal_mark, decimal_part = word.partition(self.language.decimal_mark)
+        groups = integer_part.split(self.language.grouping_mark)
+        if not all(group.isdecimal() for group in groups):
+            return None
+        if len(groups) > 1 and (len(groups[0]) > 3 or any(len(group) != 3 for group in groups[1:])):
+            return None
+        if decimal_mark and not decimal_part.isdecimal():
+            return None
+        return float("".join(groups) + "." + decimal_part if decimal_mark else "".join(groups))
+
+    def parse_signed_numeral(self, word: str) -> Optional[float]:
+        if word.startswith("-"):
+            value = self.parse_numeral(word[1:])
+            return -value if value is not None else None
+        return self.parse_numeral(word)
+
+    # Parsing
+
+    def parse(self, text: str) -> Optional[float]:
+        return self.parse_words(TOKEN_PATTERN.findall(text.lower()))
+
+    def parse_words(self, words: List[str]) -> Optional[float]:
+        if not words:
+            return None
+
+        if len(words) == 1:
+            value = self.parse_signed_numeral(words[0])
+            if value is not None:
+                return value
+
+        is_negative, words = self.remove_negative_signifier(words)
+        if not words:
+            return None
+
+        if self.find_decimal_separator(words):
+            result = self.parse_decimal_number(words)
+        else:
+            result = self.parse_non_decimal_number(words)
+
+        if result is None:
+            return None
+        return -result if is_negative else result
+
+    def remove_negative_signifier(self, words: List[str]) -> tuple:
+        if self.language.trailing_negative_signifier:
+            is_negative = self.match(words[-1], self.negative_signifiers)
+            if is_negative:
+                return is_negative, words[:-1]
+
+        if words[0].startswith("-") and self.parse_numeral(words[0][1:]) is not None:
+            return True, [words[0][1:], *words[1:]]
+
+        is_negative = self.match(words[0], self.negative_signifiers)
+        if is_negative:
+            return is_negative, words[1:]
+        return is_negative, words
+
+    def find_decimal_separator(self, words: List[str]) -> Optional[str]:
+        for word in words:
+            if self.match(word, self.decimal_separators):
+                return word
+        return None
+
+    def parse_decimal_number(self, words: List[str]) -> Optional[float]:
+        separator_index = words.index(self.find_decimal_separator(words))
+        integer_part = self.parse_whole_number(words[:separator_index])
+        decimal_part = self.parse_decimal_part(words[separator_index + 1 :])
+        if integer_part is None or decimal_part is None:
+            return None
+        decimal_value, decimal_length = decimal_part
+        return integer_part + decimal_value / (10 ** decimal_length)
+
+    def parse_decimal_part(self, words: List[str]) -> Optional[Tuple[float, int]]:
+        # Digits and numerals are one string of digits, other whole number words are added up and take a place each.
+        number_words = [word for word in words if word not in self.language.ignored_words]
+        if all(word in self.digits or word.isdecimal() for word in number_words):
+            digit_string = "".join(word if word.isdecimal() else str(self.digits[word]) for word in number_words)
+        elif all(word in self.whole_numbers for word in number_words):
+            value = self.parse_whole_number(number_words)
+            return None if value is None else (value, len(words))
+        else:
+            digit_string = ""
+            for word in number_words:
+                if word.isdecimal():
+                    digit_string += word
+                elif not word[:1].isdecimal() and self.match(word, self.digits):
+                    digit_string += str(self.digits[self.match(word, self.digits)])
+                else:
+                    return None
+        return (float(digit_string), len(digit_string)) if digit_string else (0, 0)
+
+    def parse_whole_number(self, words: List[str]) -> Optional[float]:
+        words = [word for word in words if word not in self.language.ignored_words]
+        if not words:
+            return 0
+
+        if all(self.match(word, self.digits) for word in words):
+            return float("".join(str(self.digits[self.match(word, self.digits)]) for word in words))
+
+        misspelled_words = [word for word in words if word not in self.whole_numbers and not word[:1].isdecimal()]
+        for unit_name, unit_value in sorted(self.units.items(), key=lambda item: -item[1]):
+            word_match = unit_name if unit_name in words else self.match(unit_name, misspelled_words)
+            if word_match:
+                index = words.index(word_match)
+                left_value = self.parse_whole_number(words[:index])
+                right_value = self.parse_whole_number(words[index + 1 :])
+                if None in {left_value, right_value}:
+                    return None
+                return left_value * unit_value + right_value
+
+        total = 0
+        after_tens = False
+        for word in words:
+            numeral_value = self.parse_numeral(word)
+            if numeral_value is not None:
+                # A numeral only combines with units.
+                if len(words) > 1:
+                    return None
+                total += numeral_value
+                continue
+            match = self.match(word, self.whole_numbers)
+            if not match or (after_tens and match != word and match not in self.digits):
+                return None
+            total += self.whole_numbers[match]
+            after_tens = self.whole_numbers[match] in (20, 30, 40, 50, 60, 70, 80, 90)
+        return total
+
+    def parse_non_decimal_number(self, words: List[str]) -> Optional[float]:
+        whole_words, fraction_words = words, []
+        if self.match_denominator(words[-1]) is not None:
+            whole_words, fraction_words = self.split_at_fraction_separator(words)
+
+        whole_part = self.parse_whole_number(whole_words)
+        fraction_part = self.parse_fraction(fraction_words)
+        if None in {whole_part, fraction_part}:
+            return None
+        return whole_part + fraction_part
+
+    def split_at_fraction_separator(self, words: List[str]) -> Tuple[List[str], List[str]]:
+        for i in range(len(words) - 1, -1, -1):
+            if self.match(words[i], self.fraction_separators):
+                return words[:i], words[i + 1 :]
+        return [], words
+
+    def parse_fraction(self, words: List[str]) -> Optional[float]:
+        if not words:
+            return 0
+
+        for i, word in enumerate(words):
+            denominator = self.match_denominator(word)
+            if denominator is not None:
+                numerator = self.parse_numerator(words[:i])
+                if numerator is None or not denominator:
+                    return None
+                return numerator / denominator
+        return None
+
+    def parse_numerator(self, words: List[str]) -> Optional[float]:
+        if not words:
+            return 1
+        if len(words) == 1 and self.match(words[0], self.indefinite_articles):
+            return 1
+        return self.parse_whole_number(words)
+
+
+class ReferenceDetector:
+    """The reference implementation of detecting the language of a number phrase at one fuzzy threshold."""
+
+    def __init__(self, fuzzy_threshold: float):
+        self.fuzzy_threshold = fuzzy_threshold
+
+        # Every word of each language's vocabulary, including the singular denominator forms, in order of preference.
+        self.words: Dict[str, set] = {}
+        for language_code in REFERENCE_LANGUAGES:
+            parser = ReferenceParser(language_code, fuzzy_threshold)
+            self.words[language_code] = {
+                *parser.digits,
+                *parser.whole_numbers,
+                *parser.units,
+                *parser.irregular_denominators,
+                *parser.fraction_separators,
+                *parser.decimal_separators,
+                *parser.negative_signifiers,
+                *parser.indefinite_articles,
+                *(parser.denominator_form(word) for word in parser.whole_numbers),
+            }
+
+    def detect(self, words: List[str]) -> Optional[str]:
+        # Each language is ranked by the number of words that are exactly in its vocabulary, then by the sum of
+        # the best fuzzy scores of the words that are in no vocabulary. Numerals count for no language.
+        numerals = [word for word in words if word.lstrip("-")[:1].isdecimal()]
+        words = [word for word in words if word not in numerals]
+        ranks = {}
+        for language_code, vocabulary_words in self.words.items():
+            exact_count, fuzzy_score = 0, 0
+            for word in words:
+                if word in vocabulary_words:
+                    exact_count += 1
+                elif self.fuzzy_threshold < 100 and not any(word in other_words for other_words in self.words.values()):
+                    best_score = max(fuzz.ratio(word, candidate) for candidate in vocabulary_words)
+                    if best_score >= self.fuzzy_threshold:
+                        fuzzy_score += best_score
+            ranks[language_code] = (exact_count, fuzzy_score)
+
+        # Earlier languages win ties.
+        best_language = max(self.words, key=lambda language_code: ranks[language_code])
+        if ranks[best_language] == (0, 0) and not numerals:
+            return None
+        return best_language
+
+
+def reference_parse(
+    text: str,
+    language_code: str,
+    fuzzy_threshold: float,
+    extra_words: Tuple[ExtraWord, ...] = (),
+    _parsers: Dict[tuple, tuple] = {},
+) -> Optional[float]:
+    """
+    Parses a text the way Word2Num.parse does: exactly first, then fuzzily if that fails.
+
+    :param text: A text representation of a number.
+    :param language_code: The language of the text, or "auto" to detect it first.
+    :param fuzzy_threshold: The minimum score for fuzzy string matching.
+    :param extra_words: Words added to the vocabulary of the language, which can't be detected then.
+    :return: The reference value of the text.
+    """
+    if language_code == AUTO_LANGUAGE_CODE:
+        key = (language_code, fuzzy_threshold)
+        if key not in _parsers:
+            _parsers[key] = ReferenceDetector(fuzzy_threshold)
+        language_code = _parsers[key].detect(TOKEN_PATTERN.findall(text.lower()))
+        if language_code is None:
+            return None
+
+    key = (language_code, fuzzy_threshold, extra_words)
+    if key not in _parsers:
+        _parsers[key] = (
+            ReferenceParser(language_code, 100, extra_words),
+            ReferenceParser(language_code, fuzzy_threshold, extra_words) if fuzzy_threshold < 100 else None,
+        )
+    exact_parser, fuzzy_parser = _parsers[key]
+
+    result = exact_parser.parse(text)
+    if result or not fuzzy_parser:
+        return result
+    return fuzzy_parser.parse(text)
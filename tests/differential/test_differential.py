@@ -0,0 +1,114 @@
+import itertools
+import unittest
+
+from word2num import Word2Num
+
+from .harness import ENGINES, PhraseGenerator, find_disagreements, minimize, outcome
+from .reference import reference_parse
+
+# Phrases per language and threshold in the test suite; run the harness module directly for longer sessions.
+PHRASE_COUNT = 200
+
+
+class TestReferenceOracle(unittest.TestCase):
+    def test_known_values(self):
+        self.assertEqual(reference_parse("two hundred and five", "en", 80), 205)
+        self.assertEqual(reference_parse("fourty two", "en", 80), 42)
+        self.assertIsNone(reference_parse("fourty two", "en", 100))
+        self.assertEqual(reference_parse("one and three quarters", "en", 80), 1.75)
+        self.assertEqual(reference_parse("-3 million", "en", 80), -3000000)
+        self.assertEqual(reference_parse("tres quintas negativas", "es", 80), -0.6)
+        self.assertEqual(reference_parse("3,5 millones", "es", 80), 3500000)
+        self.assertEqual(reference_parse("two billion and fourty", "en", 80), 2000000004)
+        self.assertIsNone(reference_parse("2024 10 19", "en", 80))
+        self.assertAlmostEqual(reference_parse("one point 5 5", "en", 80), 1.55)
+        self.assertAlmostEqual(reference_parse("three point 1 4", "en", 80), 3.14)
+
+    def test_detected_language(self):
+        self.assertEqual(reference_parse("once", "auto", 80), 11)
+        self.assertEqual(reference_parse("fourty two", "auto", 80), 42)
+        self.assertEqual(reference_parse("dosientos", "auto", 80), 200)
+        self.assertEqual(reference_parse("42", "auto", 80), 42)
+        self.assertIsNone(reference_parse("giraffe", "auto", 80))
+
+    def test_extra_words(self):
+        extra_words = (("units", "grand", 1000), ("whole_numbers", "dozen", 12))
+        self.assertEqual(reference_parse("two grand and one dozen", "en", 80, extra_words), 2013)
+        self.assertEqual(reference_parse("two grnd", "en", 80, extra_words), 2000)
+        self.assertIsNone(reference_parse("two grand", "en", 80))
+
+
+class TestDifferential(unittest.TestCase):
+    def assert_no_disagreements(self, language_code, fuzzy_threshold, seed):
+        texts = list(itertools.islice(PhraseGenerator(language_code, seed), PHRASE_COUNT))
+        disagreements = find_disagreements(language_code, fuzzy_threshold, texts, max_reports=3)
+        self.assertEqual([], [str(disagreement) for disagreement in disagreements])
+
+    def test_english(self):
+        self.assert_no_disagreements("en", 80, seed=1)
+
+    def test_english_exact_only(self):
+        self.assert_no_disagreements("en", 100, seed=2)
+
+    def test_spanish(self):
+        self.assert_no_disagreements("es", 80, seed=3)
+
+    def test_spanish_exact_only(self):
+        self.assert_no_disagreements("es", 100, seed=4)
+
+    def test_every_engine_is_compared(self):
+        self.assertEqual(
+            set(ENGINES),
+            {
+                "default",
+                "parse_tokens",
+                "auto",
+                "parse_many_threads",
+                "parse_many_processes",
+                "extended_vocabulary",
+                "no_prefilter",
+                "language_pack",
+                "budget",
+                "trace",
+                "incremental",
+                "rapidfuzz_scorer",
+                "bitparallel_scorer",
+                "score_cache",
+                "aliases",
+                "nbest",
+            },
+        )
+
+
+class TestHarness(unittest.TestCase):
+    def test_generator_is_reproducible(self):
+        first = list(itertools.islice(PhraseGenerator("en", seed=5), 20))
+        second = list(itertools.islice(PhraseGenerator("en", seed=5), 20))
+        self.assertEqual(first, second)
+
+    def test_reports_minimized_disagreement(self):
+        def broken_engine(language_code, fuzzy_threshold):
+            parse = Word2Num(language_code, fuzzy_threshold).parse
+            return lambda text: None if "million" in text else parse(text)
+
+        disagreements = find_disagreements(
+            "en", 80, ["two hundred and five", "three million four hundred"], {"broken": broken_engine}
+        )
+        self.assertEqual(len(disagreements), 1)
+        self.assertEqual(disagreements[0].engine, "broken")
+        self.assertEqual(disagreements[0].text, "million")
+        self.assertEqual(disagreements[0].expected, 0)
+        self.assertIsNone(disagreements[0].actual)
+
+    def test_minimize(self):
+        self.assertEqual(minimize("one two giraffe three", lambda text: "raf" in text), "raf")
+
+    def test_outcome_records_exceptions(self):
+        def crash(text):
+            raise ZeroDivisionError
+
+        self.assertEqual(outcome(crash, "one"), "ZeroDivisionError")
+
+
+if __name__ == "__main__":
+    unittest.main()
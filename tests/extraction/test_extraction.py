@@ -0,0 +1,101 @@
+import os
+import random
+import tempfile
+import unittest
+
+from word2num import Word2Num
+from word2num.extraction import extract_numbers, extract_numbers_from_file
+
+TEXT = (
+    "I went to the store and bought twenty-three apples, 4 pears and one hundred and five grapes.\n"
+    "Then a half of them; minus seven degrees and 1,234.5 dollars. Three quarters of an hour.\n"
+)
+
+
+def phrases(data, extractions):
+    return [(data[offset : offset + length].decode("utf-8"), value) for offset, length, value in extractions]
+
+
+class TestExtractNumbers(unittest.TestCase):
+    def test_phrases(self):
+        data = TEXT.encode()
+        self.assertEqual(
+            phrases(data, extract_numbers(data)),
+            [
+                ("twenty-three", 23),
+                ("4", 4),
+                ("one hundred and five", 105),
+                ("a half", 0.5),
+                ("minus seven", -7),
+                ("1,234.5", 1234.5),
+                ("Three quarters", 0.75),
+            ],
+        )
+
+    def test_misspelled_words_end_phrases(self):
+        # "to" and "for" are close to "two" and "four", but in running text they are ordinary words.
+        self.assertEqual(extract_numbers(b"went to the shop for eggs"), [])
+
+    def test_adjacent_numerals_are_separate_numbers(self):
+        self.assertEqual(extract_numbers(b"date 2024 10 19 ok"), [(5, 4, 2024), (10, 2, 10), (13, 2, 19)])
+        self.assertEqual(extract_numbers(b"it cost 5 - 3 dollars"), [(8, 1, 5), (12, 1, 3)])
+        self.assertEqual(extract_numbers(b"from 10-20 people"), [(5, 2, 10), (8, 2, 20)])
+        data = b"twenty 30, 4 and 6, 3 million 2 thousand, three point 1 4"
+        self.assertEqual(
+            phrases(data, extract_numbers(data)),
+            [("twenty", 20), ("30", 30), ("4", 4), ("6", 6), ("3 million 2 thousand", 3002000), ("three point 1 4", 3.14)],
+        )
+
+    def test_spanish_byte_offsets(self):
+        data = "Compré veintitrés manzanas y ciento cinco uvas".encode()
+        self.assertEqual(
+            phrases(data, extract_numbers(data, Word2Num("es"))),
+            [("veintitrés", 23), ("ciento cinco", 105)],
+        )
+        self.assertEqual(extract_numbers(data, Word2Num("es"))[0][:2], (8, len("veintitrés".encode())))
+
+
+class TestExtractNumbersFromFile(unittest.TestCase):
+    def setUp(self):
+        words = TEXT.replace("\n", " \n ").split(" ")
+        rng = random.Random(0)
+        self.data = " ".join(rng.choice(words) for _ in range(3000)).encode()
+        file, self.path = tempfile.mkstemp()
+        with os.fdopen(file, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_chunks_find_the_same_phrases(self):
+        expected = extract_numbers(self.data)
+        self.assertTrue(expected)
+        for chunk_size in [1, 7, 64, 4096, 1 << 20]:
+            self.assertEqual(list(extract_numbers_from_file(self.path, chunk_size=chunk_size)), expected, chunk_size)
+
+    def test_processes(self):
+        self.assertEqual(
+            list(extract_numbers_from_file(self.path, processes=2, chunk_size=512)),
+            extract_numbers(self.data),
+        )
+
+    def test_phrase_across_chunk_edge(self):
+        with open(self.path, "wb") as f:
+            f.write(b"x" * 10 + b" one hundred and twenty-five\n")
+        self.assertEqual(
+            list(extract_numbers_from_file(self.path, chunk_size=15)),
+            [(11, len("one hundred and twenty-five"), 125)],
+        )
+
+    def test_empty_file(self):
+        with open(self.path, "wb"):
+            pass
+        self.assertEqual(list(extract_numbers_from_file(self.path)), [])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(extract_numbers_from_file(self.path, chunk_size=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
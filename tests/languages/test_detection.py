@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+
+from word2num import Word2Num
+from word2num.languages.detection import LanguageDetector
+from word2num.word_matching import TheFuzzScorer
+
+LANGUAGE_CODE = "auto"
+
+
+class TestLanguageDetection(unittest.TestCase):
+    def setUp(self):
+        self.w2n = Word2Num(language_code=LANGUAGE_CODE)
+        self.detect = self.w2n.language_detector.detect
+
+    def test_detects_language(self):
+        self.assertEqual(self.detect("twenty three"), "en")
+        self.assertEqual(self.detect("veintitrés"), "es")
+        self.assertEqual(self.detect("one and a half"), "en")
+        self.assertEqual(self.detect("dos negativo"), "es")
+        self.assertIsNone(self.detect("giraffe"))
+
+    def test_parses_in_detected_language(self):
+        parse = self.w2n.parse
+
+        self.assertEqual(parse("fifty seven thousand four hundred and twenty one"), 57421)
+        self.assertEqual(parse("cincuenta y siete mil cuatrocientos veintiuno"), 57421)
+        self.assertAlmostEqual(parse("la mitad"), 0.5)
+        self.assertEqual(parse("fourty two"), 42)
+        self.assertIsNone(parse("giraffe"))
+
+    def test_exact_match_beats_fuzzy_match(self):
+        # "once" is eleven in Spanish, and only a fuzzy match for the English "one".
+        self.assertEqual(self.detect("once"), "es")
+        self.assertEqual(self.w2n.parse("once"), 11)
+
+    def test_fuzzy_scores_break_exact_ties(self):
+        # "tree" is closer to the English "three" than to the Spanish "tres".
+        self.assertEqual(self.detect("tree"), "en")
+        self.assertEqual(self.w2n.parse("tree"), 3)
+
+    def test_registration_order_breaks_remaining_ties(self):
+        # One exact match in each language and nothing else to compare.
+        self.assertEqual(self.detect("once hundred"), "en")
+        self.assertEqual(self.detect("hundred once"), "en")
+
+        spanish_first = LanguageDetector(
+            {
+                "es": Word2Num(language_code="es").fuzzy_converter.matcher,
+                "en": Word2Num(language_code="en").fuzzy_converter.matcher,
+            },
+            80,
+        )
+        self.assertEqual(spanish_first.detect("once hundred"), "es")
+
+    def test_parses_once_per_phrase(self):
+        english_parse = self.w2n.converters["en"][0].parse_tokens
+        spanish_parse = self.w2n.converters["es"][0].parse_tokens
+
+        with mock.patch.object(
+            self.w2n.converters["en"][0], "parse_tokens", wraps=english_parse
+        ) as english, mock.patch.object(
+            self.w2n.converters["es"][0], "parse_tokens", wraps=spanish_parse
+        ) as spanish:
+            self.w2n.parse("siete mil")
+
+        english.assert_not_called()
+        spanish.assert_called_once_with(["siete", "mil"])
+
+    def test_numerals(self):
+        self.assertEqual(self.detect("42"), "en")
+        self.assertEqual(self.w2n.parse("42"), 42)
+        self.assertEqual(self.w2n.parse("3,5 millones"), 3500000)
+        self.assertEqual(self.w2n.parse("3.5 million"), 3500000)
+
+    def test_exact_only(self):
+        parse = Word2Num(language_code=LANGUAGE_CODE, fuzzy_threshold=100).parse
+
+        self.assertEqual(parse("siete"), 7)
+        self.assertIsNone(parse("sieet"))
+
+    def test_uses_configured_scorer(self):
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        w2n = Word2Num(language_code=LANGUAGE_CODE, scorer=scorer)
+        self.assertIs(w2n.language_detector.scorer, scorer)
+
+        self.assertEqual(w2n.language_detector.detect("tree"), "en")
+        self.assertTrue(scorer.score.called)
+        # Candidates whose length rules out the threshold are never scored, and the rest are scored with a cutoff.
+        for (word, candidate, cutoff), _ in scorer.score.call_args_list:
+            self.assertEqual((word, cutoff), ("tree", 80))
+            self.assertLessEqual(abs(len(candidate) - len(word)), 2)
+
+    def test_same_results_with_every_scorer(self):
+        phrases = ["tree", "fourty two", "sinco mil", "dosientos", "once hundred", "giraffe"]
+        expected = [self.detect(phrase) for phrase in phrases]
+        for scorer in ["rapidfuzz", "bitparallel"]:
+            try:
+                detect = Word2Num(language_code=LANGUAGE_CODE, scorer=scorer).language_detector.detect
+            except ImportError:
+                continue
+            self.assertEqual([detect(phrase) for phrase in phrases], expected, scorer)
+
+
+if __name__ == "__main__":
+    unittest.main()
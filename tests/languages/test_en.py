@@ -97,11 +97,81 @@ class TestEnglishParser(unittest.TestCase):
         )
         self.assertAlmostEqual(extra_fuzzy_parse("soxteeeen"), 16)
 
+    def test_misspelled_words_follow_grammar(self):
+        for w2n in (Word2Num(language_code="en"), Word2Num(language_code="en", score_cache=True)):
+            # Exact unit words aren't mistaken for larger units they resemble.
+            self.assertEqual(w2n.parse("two billion and fourty"), 2000000004)
+            self.assertEqual(w2n.parse("atwo million four hundred"), 2000400)
+            # Only digits follow a tens word, so a misspelled tens word after one isn't read as a digit it resembles less.
+            self.assertEqual(w2n.parse("twenty fiv"), 25)
+            self.assertIsNone(w2n.parse("twenty fourty"))
+            self.assertIsNone(w2n.parse("thirty fourty two"))
+            # Only digits follow a decimal separator.
+            self.assertAlmostEqual(w2n.parse("one point fourty"), 1.4)
+            # Exact words are parsed as before.
+            self.assertEqual(w2n.parse("twenty forty"), 60)
+
     def test_unrecognizable_words(self):
         parse = Word2Num(language_code="en").parse
         self.assertIsNone(parse("giraffe"))
         self.assertIsNone(parse("five walruses"))
         self.assertIsNone(parse("one point six capybaras"))
+        self.assertIsNone(parse("giraffe third"))
+        self.assertIsNone(parse("one zeroth"))
+
+    def test_empty_phrases(self):
+        parse = Word2Num(language_code="en").parse
+        self.assertIsNone(parse(""))
+        self.assertIsNone(parse("!?"))
+        self.assertIsNone(parse("minus"))
+
+    def test_numerals(self):
+        parse = Word2Num(language_code="en").parse
+        self.assertEqual(parse("42"), 42)
+        self.assertEqual(parse("3.5"), 3.5)
+        self.assertEqual(parse("-7"), -7)
+        self.assertEqual(parse("1,234,567.25"), 1234567.25)
+        self.assertIsNone(parse("1,5"))
+        self.assertIsNone(parse("42 walruses"))
+
+    def test_mixed_numerals_and_words(self):
+        parse = Word2Num(language_code="en").parse
+        self.assertEqual(parse("3 million"), 3000000)
+        self.assertEqual(parse("1.5 thousand"), 1500)
+        self.assertEqual(parse("-3 million"), -3000000)
+        self.assertEqual(parse("minus 3"), -3)
+        self.assertEqual(parse("2 hundred and 5"), 205)
+        self.assertEqual(parse("three point 14"), 3.14)
+        self.assertEqual(parse("3 quarters"), 0.75)
+        self.assertEqual(parse("3 milion"), 3000000)
+
+    def test_adjacent_numerals(self):
+        parse = Word2Num(language_code="en").parse
+        # Numerals only combine with units, so they aren't added to neighboring numerals or number words.
+        self.assertIsNone(parse("5 5"))
+        self.assertIsNone(parse("2024 10 19"))
+        self.assertIsNone(parse("twenty 30"))
+        self.assertIsNone(parse("twenty 5"))
+        self.assertIsNone(parse("3 and 4"))
+        self.assertEqual(parse("five five"), 55)
+        self.assertEqual(parse("3 million 2 thousand"), 3002000)
+
+    def test_numeral_decimals(self):
+        parse = Word2Num(language_code="en").parse
+        # The digits after the decimal separator are read as one string of digits.
+        self.assertAlmostEqual(parse("one point 5 5"), 1.55)
+        self.assertAlmostEqual(parse("three point 1 4"), 3.14)
+        self.assertAlmostEqual(parse("three point 1 four"), 3.14)
+        self.assertAlmostEqual(parse("one point 05"), 1.05)
+        self.assertAlmostEqual(parse("one point fiv and 5"), 1.55)
+        self.assertIsNone(parse("one point 1.5"))
+        self.assertIsNone(parse("one point twenty 5"))
+
+    def test_numerals_skip_matching(self):
+        w2n = Word2Num(language_code="en")
+        trace = w2n.trace("-1,234.5")
+        self.assertEqual(trace.value, -1234.5)
+        self.assertEqual(trace.stages[1].decisions, [])
 
     def test_misspelled_words_no_fuzzy(self):
         parse = Word2Num(language_code="en", fuzzy_threshold=100).parse
@@ -100,12 +100,35 @@ class TestSpanishParser(unittest.TestCase):
         self.assertAlmostEqual(extra_fuzzy_parse("dociento veintidos"), 222)
         self.assertAlmostEqual(extra_fuzzy_parse("diecises"), 16)
 
+    def test_misspelled_words_follow_grammar(self):
+        parse = Word2Num(language_code=LANGUAGE_CODE).parse
+
+        self.assertEqual(parse("ddos millones cuatrocientos"), 2000400)
+        self.assertEqual(parse("veinte sinco"), 25)
+        self.assertIsNone(parse("veinte cuarentta"))
+        self.assertAlmostEqual(parse("uno coma sinco"), 1.5)
+
     def test_unrecognizable_words(self):
         parse = Word2Num(language_code=LANGUAGE_CODE).parse
         self.assertIsNone(parse("jirafa"))
         self.assertIsNone(parse("cinco morsas"))
         self.assertIsNone(parse("uno punto seis carpinchos"))
 
+    def test_empty_phrases(self):
+        parse = Word2Num(language_code=LANGUAGE_CODE).parse
+        self.assertIsNone(parse(""))
+        self.assertIsNone(parse("menos"))
+
+    def test_numerals(self):
+        parse = Word2Num(language_code=LANGUAGE_CODE).parse
+        self.assertEqual(parse("1.234,5"), 1234.5)
+        self.assertEqual(parse("3,5 millones"), 3500000)
+        self.assertEqual(parse("2 mil"), 2000)
+        self.assertEqual(parse("5 negativo"), -5)
+        self.assertAlmostEqual(parse("uno coma 5 5"), 1.55)
+        self.assertIsNone(parse("2 5"))
+        self.assertIsNone(parse("veinte 5"))
+
     def test_misspelled_words_no_fuzzy(self):
         parse = Word2Num(language_code=LANGUAGE_CODE, fuzzy_threshold=100).parse
 
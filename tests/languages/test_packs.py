@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from word2num import ParseBudget, ParseBudgetExceeded, Word2Num
+from word2num.languages import packs
+from word2num.languages.packs import LanguagePack, LanguagePackError, compile_language_pack
+from word2num.word_matching import AliasTable, BitParallelScorer, RankedScoreCache
+
+PHRASES = {
+    "en": [
+        "fifty seven thousand four hundred and twenty one",
+        "one and three quarters",
+        "minus two point five",
+        "five sixteenths",
+        "twoo hunrdered and twienty-too",
+        "giraffe",
+    ],
+    "es": [
+        "dos mil novecientos cincuenta y seis",
+        "tres quintas negativas",
+        "cinco dieciseisavos",
+        "tre y medip",
+        "jirafa",
+    ],
+}
+
+
+class TestLanguagePacks(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def pack_path(self, name="pack.w2npack"):
+        return os.path.join(self.directory.name, name)
+
+    def test_round_trip(self):
+        for language_code, phrases in PHRASES.items():
+            path = self.pack_path(language_code)
+            compile_language_pack(language_code, path)
+
+            for threshold in (60, 80, 100):
+                packed = Word2Num.from_language_pack(path, fuzzy_threshold=threshold)
+                built = Word2Num(language_code=language_code, fuzzy_threshold=threshold)
+
+                for phrase in phrases:
+                    self.assertEqual(packed.parse(phrase), built.parse(phrase), phrase)
+
+    def test_restores_indexes(self):
+        language_pack = LanguagePack.from_bytes(LanguagePack.compile("en").to_bytes())
+        matcher = Word2Num.from_language_pack(language_pack).fuzzy_converter.matcher
+        built_matcher = Word2Num().fuzzy_converter.matcher
+
+        self.assertEqual(matcher.denominator_forms, built_matcher.denominator_forms)
+        self.assertEqual(matcher.units_by_value, built_matcher.units_by_value)
+        self.assertEqual(matcher.prefilter.to_dict(), built_matcher.prefilter.to_dict())
+        self.assertEqual(matcher.prefilter.fuzzy_threshold, 80)
+
+    def test_options(self):
+        language_pack = LanguagePack.from_bytes(LanguagePack.compile("en").to_bytes())
+        budget = ParseBudget(max_tokens=3)
+        aliases = AliasTable(min_count=1)
+        score_cache = RankedScoreCache()
+        w2n = Word2Num.from_language_pack(
+            language_pack, 70, budget=budget, scorer="bitparallel", phonetic=True, score_cache=score_cache, aliases=aliases
+        )
+
+        matcher = w2n.fuzzy_converter.matcher
+        self.assertIs(w2n.budget, budget)
+        self.assertEqual(matcher.fuzzy_threshold, 70)
+        self.assertIsInstance(matcher.scorer, BitParallelScorer)
+        self.assertTrue(matcher.phonetic)
+        self.assertIs(matcher.score_cache, score_cache)
+        self.assertIs(matcher.aliases, aliases)
+
+        self.assertEqual(w2n.parse("ate hundrd"), 800)
+        with self.assertRaises(ParseBudgetExceeded):
+            w2n.parse("one two three four")
+
+    def test_corrupt_payload(self):
+        data = bytearray(LanguagePack.compile("en").to_bytes())
+        data[-10] ^= 0xFF
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.from_bytes(data)
+
+    def test_truncated_pack(self):
+        data = LanguagePack.compile("en").to_bytes()
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.from_bytes(data[:-1])
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.from_bytes(data[:4])
+
+    def test_not_a_pack(self):
+        path = self.pack_path()
+        with open(path, "wb") as f:
+            f.write(b"definitely not a language pack")
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.load(path)
+
+    def test_empty_file(self):
+        path = self.pack_path()
+        open(path, "wb").close()
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.load(path)
+
+    def test_library_version_mismatch(self):
+        with mock.patch.object(packs, "__version__", "0.0.1"):
+            data = LanguagePack.compile("en").to_bytes()
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.from_bytes(data)
+
+    def test_format_version_mismatch(self):
+        with mock.patch.object(packs, "PACK_FORMAT_VERSION", 99):
+            data = LanguagePack.compile("en").to_bytes()
+
+        with self.assertRaises(LanguagePackError):
+            LanguagePack.from_bytes(data)
+
+    def test_language_mismatch(self):
+        language_pack = LanguagePack.compile("es")
+
+        with self.assertRaises(ValueError):
+            Word2Num(language_code="en", language_pack=language_pack)
+
+    def test_unsupported_language(self):
+        with self.assertRaises(ValueError):
+            LanguagePack.compile("xx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import time
+import unittest
+
+from word2num import ParseBudget, ParseBudgetExceeded, Word2Num
+from word2num.word_matching import TheFuzzScorer
+
+
+def adversarial_phrase(length: int) -> str:
+    """A long phrase of misspelled number words, which makes the fuzzy parser compare every word many times."""
+    words = ["two", "hundrd", "thirty", "fve", "milion", "thousnd", "seven", "nineteen"]
+    rng = random.Random(0)
+    return " ".join(rng.choice(words) for _ in range(length))
+
+
+class TestParseBudget(unittest.TestCase):
+    def test_within_budget(self):
+        w2n = Word2Num(budget=ParseBudget(max_tokens=10, max_fuzzy_comparisons=1000, timeout=1))
+        self.assertEqual(w2n.parse("two hundred and five"), 205)
+        self.assertEqual(w2n.parse("two hundrd"), 200)
+        self.assertIsNone(w2n.parse("hello world"))
+
+    def test_max_tokens(self):
+        w2n = Word2Num(budget=ParseBudget(max_tokens=3))
+        self.assertEqual(w2n.parse("one two three"), 123)
+        with self.assertRaises(ParseBudgetExceeded) as context:
+            w2n.parse("one two three four")
+        self.assertEqual(context.exception.limit, "max_tokens")
+
+    def test_max_fuzzy_comparisons(self):
+        w2n = Word2Num()
+        self.assertEqual(w2n.parse("one hundred", budget=ParseBudget(max_fuzzy_comparisons=0)), 100)
+        with self.assertRaises(ParseBudgetExceeded) as context:
+            w2n.parse("one hundrd", budget=ParseBudget(max_fuzzy_comparisons=10))
+        self.assertEqual(context.exception.limit, "max_fuzzy_comparisons")
+
+    def test_call_budget_overrides_instance_budget(self):
+        w2n = Word2Num(budget=ParseBudget(max_tokens=1))
+        self.assertEqual(w2n.parse("two hundred", budget=ParseBudget(max_tokens=2)), 200)
+
+    def test_bounded_worst_case(self):
+        w2n = Word2Num()
+        text = adversarial_phrase(3000)
+
+        for budget, limit in [
+            (ParseBudget(max_tokens=100), "max_tokens"),
+            (ParseBudget(max_fuzzy_comparisons=5000), "max_fuzzy_comparisons"),
+            (ParseBudget(timeout=0.05), "timeout"),
+        ]:
+            start = time.perf_counter()
+            with self.assertRaises(ParseBudgetExceeded) as context:
+                w2n.parse(text, budget=budget)
+            self.assertEqual(context.exception.limit, limit)
+            self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_long_phrase_of_units(self):
+        # Phrases of units are split one unit at a time, without running into the recursion limit.
+        self.assertEqual(Word2Num(budget=ParseBudget(max_tokens=1000)).parse("million " * 600), 0)
+        self.assertEqual(Word2Num().parse("two million " * 3000), 6000000000)
+        self.assertEqual(Word2Num(score_cache=True).parse("thousand milion " * 1000), 0)
+        self.assertEqual(Word2Num().trace("hundred " * 2000).value, 0)
+
+        for budget, limit in [
+            (ParseBudget(max_tokens=1000), "max_tokens"),
+            (ParseBudget(timeout=0.05), "timeout"),
+        ]:
+            start = time.perf_counter()
+            with self.assertRaises(ParseBudgetExceeded) as context:
+                Word2Num().parse("thousand milion " * 5000, budget=budget)
+            self.assertEqual(context.exception.limit, limit)
+            self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_detected_language(self):
+        w2n = Word2Num(language_code="auto", budget=ParseBudget(max_tokens=2))
+        self.assertEqual(w2n.parse("doscientos"), 200)
+        with self.assertRaises(ParseBudgetExceeded):
+            w2n.parse("uno dos tres")
+
+    def test_bounded_detection(self):
+        w2n = Word2Num(language_code="auto")
+        text = "fourty " * 30000
+
+        for budget, limit in [
+            (ParseBudget(max_fuzzy_comparisons=50, timeout=0.05), "max_fuzzy_comparisons"),
+            (ParseBudget(timeout=0.05), "timeout"),
+        ]:
+            start = time.perf_counter()
+            with self.assertRaises(ParseBudgetExceeded) as context:
+                w2n.parse(text, budget=budget)
+            self.assertEqual(context.exception.limit, limit)
+            self.assertLess(time.perf_counter() - start, 0.5)
+
+        with self.assertRaises(ParseBudgetExceeded):
+            w2n.parse_nbest([text], budget=ParseBudget(max_fuzzy_comparisons=50))
+        self.assertIs(type(w2n.language_detector.scorer), TheFuzzScorer)
+
+    def test_parsers_not_modified(self):
+        w2n = Word2Num(budget=ParseBudget(max_fuzzy_comparisons=1000))
+        w2n.parse("two hundrd")
+        self.assertNotIn("parse_tokens", vars(w2n.fuzzy_converter))
+        self.assertIs(type(w2n.fuzzy_converter.matcher.scorer), TheFuzzScorer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import random
+import time
+import unittest
+from unittest import mock
+
+from word2num import Word2Num
+from word2num.word_matching import TheFuzzScorer
+
+ENGLISH_PHRASES = [
+    "two hundred thirty",
+    "negative one thousand two hundred and five",
+    "fifty seven thousand four hundred and twenty one",
+    "one two three four",
+    "one two hundred",
+    "five hundred thousand hundred",
+    "two thousand three thousand",
+    "three point one four",
+    "minus twenty two point zero zero three six",
+    "one and three quarters",
+    "one and a half",
+    "a third",
+    "fourty two",
+    "two hundred giraffes",
+    "seven minus",
+    "point five",
+    "hundred",
+    "-3 million 2 hundred",
+    "1.5 thousand and 7",
+    "twenty 5",
+    "three point 14",
+    "minus -3",
+    "six three quadrillion seven",
+    "twenty quintillion three",
+]
+
+SPANISH_PHRASES = [
+    "dos mil novecientos cincuenta y seis",
+    "un millón cuatrocientos veintiséis mil novecientos ochenta y siete",
+    "un millón dos millones",
+    "dos millones un millón",
+    "menos ocho",
+    "dos negativo",
+    "tres quintas negativas",
+    "uno y cuarto",
+    "veintidós punto cero cero tres seis",
+    "dociento veintidos",
+    "3,5 millones",
+    "-2 mil 1.500",
+]
+
+
+class TestIncrementalParser(unittest.TestCase):
+    def assert_matches_parse(self, w2n, phrase):
+        parser = w2n.incremental()
+        words = phrase.split()
+
+        for i, word in enumerate(words):
+            expected = w2n.parse(" ".join(words[: i + 1]))
+            self.assertEqual(parser.push(word), expected, words[: i + 1])
+
+        for i in range(len(words) - 1, 0, -1):
+            expected = w2n.parse(" ".join(words[:i]))
+            self.assertEqual(parser.retract(), expected, words[:i])
+
+    def test_english_prefixes(self):
+        w2n = Word2Num(language_code="en")
+        for phrase in ENGLISH_PHRASES:
+            self.assert_matches_parse(w2n, phrase)
+
+    def test_spanish_prefixes(self):
+        w2n = Word2Num(language_code="es")
+        for phrase in SPANISH_PHRASES:
+            self.assert_matches_parse(w2n, phrase)
+
+    def test_exact_only(self):
+        w2n = Word2Num(language_code="en", fuzzy_threshold=100)
+        for phrase in ENGLISH_PHRASES:
+            self.assert_matches_parse(w2n, phrase)
+
+    def test_random_revisions(self):
+        w2n = Word2Num(language_code="en")
+        vocabulary = "one two three twenty thirty hundred thousand million and point minus half 4 -5 1.5".split()
+        rng = random.Random(42)
+        parser = w2n.incremental()
+
+        for _ in range(500):
+            if parser.words and rng.random() < 0.3:
+                value = parser.retract()
+            else:
+                value = parser.push(rng.choice(vocabulary))
+
+            self.assertEqual(value, w2n.parse(" ".join(parser.words)), parser.words)
+            self.assertEqual(parser.value, value)
+
+    def test_live_hypotheses(self):
+        parser = Word2Num().incremental()
+
+        self.assertEqual(parser.push("two"), 2)
+        self.assertEqual(parser.push("hundred"), 200)
+        self.assertEqual(parser.push("thirty"), 230)
+        self.assertEqual(parser.retract(), 200)
+        self.assertEqual(parser.push("forty"), 240)
+        self.assertEqual(parser.words, ["two", "hundred", "forty"])
+
+        parser.reset()
+        self.assertIsNone(parser.value)
+        self.assertEqual(parser.words, [])
+
+    def test_denominators_checked_once_per_word(self):
+        w2n = Word2Num()
+        parser = w2n.incremental()
+        words = "45 thousand six hundred and".split()
+        with mock.patch.object(w2n.exact_converter, "_is_denominator", wraps=w2n.exact_converter._is_denominator) as check:
+            for word in words * 500:
+                parser.push(word)
+        self.assertEqual(check.call_count, len(set(words)) - 1)
+
+    def test_fuzzy_fallback_costs_one_parse_per_word(self):
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        w2n = Word2Num(scorer=scorer)
+        parser = w2n.incremental()
+        words = "two hundred twoo thousand three hundred and fourty five".split()
+
+        for i, word in enumerate(words):
+            scorer.score.reset_mock()
+            parser.push(word)
+            push_calls = scorer.score.call_count
+
+            scorer.score.reset_mock()
+            w2n.parse(" ".join(words[: i + 1]))
+            self.assertLessEqual(push_calls, scorer.score.call_count, words[: i + 1])
+            if i < 2:
+                self.assertEqual(push_calls, 0)
+
+        # Once the misspelled words are retracted, words are accumulated without fuzzy matching again.
+        for _ in range(len(words) - 2):
+            parser.retract()
+        scorer.score.reset_mock()
+        for word in ["thousand", "three", "hundred"]:
+            parser.push(word)
+        self.assertEqual(scorer.score.call_count, 0)
+        self.assertEqual(parser.value, 200300)
+
+    def test_repeated_units(self):
+        # Each repeated unit adds a group, and the groups' running total keeps each word constant time.
+        for w2n, words in [
+            (Word2Num(fuzzy_threshold=100), ["thousand"]),
+            (Word2Num(), ["one", "thousand"]),
+            (Word2Num(language_code="es"), ["dos", "mil"]),
+        ]:
+            parser = w2n.incremental()
+            start = time.perf_counter()
+            for _ in range(5000):
+                for word in words:
+                    parser.push(word)
+            self.assertLess(time.perf_counter() - start, 1, words)
+            self.assertEqual(parser.value, w2n.parse(" ".join(parser.words)), words)
+
+        # Sums beyond 2 ** 53 aren't exact, so their groups are added in the order of the standard parser.
+        self.assert_matches_parse(Word2Num(), "two quintillion three " * 20)
+
+    def test_retract_empty_phrase(self):
+        with self.assertRaises(IndexError):
+            Word2Num().incremental().retract()
+
+    def test_auto_language_unsupported(self):
+        with self.assertRaises(ValueError):
+            Word2Num(language_code="auto").incremental()
+
+
+if __name__ == "__main__":
+    unittest.main()
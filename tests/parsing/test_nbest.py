@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+
+from word2num import ParseBudget, ParseBudgetExceeded, Word2Num
+from word2num.parsing.nbest import EXACT_CONFIDENCE, Reading
+from word2num.word_matching import AliasTable, TheFuzzScorer
+
+HYPOTHESES = {
+    "en": [
+        "two hundred thirty fuor thousand five hundred",
+        "two hundred thirty four thousand five hundred",
+        "too hundred thirty four thousand five hundrd",
+        "two hundred thirty four thousand fiv hundrd",
+        "Two hundred, thirty-four thousand five hundred",
+        "two hundred thirty four thousand and a half",
+        "fourty two point fiv",
+        "hello world",
+        "",
+    ],
+    "es": [
+        "doscientos treinta y cuatro mil quinientos",
+        "dosientos treinta y cuatro mil quinientos",
+        "doscientos trenta y cuatro mil quinientos",
+        "dosientos trenta y quatro mil",
+        "menos tres cuartos",
+        "hola mundo",
+    ],
+}
+
+
+class TestNBestParsing(unittest.TestCase):
+    def test_same_values_as_parse(self):
+        for options in [{}, {"phonetic": True}, {"score_cache": True}, {"aliases": AliasTable(min_count=1)}]:
+            for language_code, hypotheses in HYPOTHESES.items():
+                w2n = Word2Num(language_code, **options)
+                expected = [w2n.parse(hypothesis) for hypothesis in hypotheses]
+                readings = w2n.parse_nbest(hypotheses)
+                self.assertEqual([reading.value for reading in readings], expected, (language_code, options))
+                self.assertEqual([reading.text for reading in readings], hypotheses)
+
+    def test_confidence(self):
+        readings = Word2Num().parse_nbest(["two hundred", "two hundrd", "twoo hundrd", "hello world"])
+        self.assertEqual(readings[0], Reading("two hundred", 200, EXACT_CONFIDENCE))
+        self.assertEqual([reading.value for reading in readings[1:]], [200, 200, None])
+        self.assertTrue(EXACT_CONFIDENCE > readings[1].confidence > readings[2].confidence > 0)
+        self.assertEqual(readings[3].confidence, 0)
+
+    def test_best_reading(self):
+        readings = Word2Num().parse_nbest(["fourty two", "forty two", "forty too"])
+        self.assertEqual(max(readings, key=lambda reading: reading.confidence).text, "forty two")
+
+    def test_shares_fuzzy_scores(self):
+        hypotheses = HYPOTHESES["en"][:4]
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        w2n = Word2Num(scorer=scorer)
+        for hypothesis in hypotheses:
+            w2n.parse(hypothesis)
+        separate_calls = scorer.score.call_count
+
+        scorer.score.reset_mock()
+        w2n.parse_nbest(hypotheses)
+        self.assertLess(scorer.score.call_count, separate_calls * 0.75)
+
+    def test_never_more_fuzzy_scores_than_parse(self):
+        for options in [{}, {"phonetic": True}, {"aliases": AliasTable(min_count=1)}]:
+            scorer = mock.Mock(wraps=TheFuzzScorer())
+            w2n = Word2Num(scorer=scorer, **options)
+            for hypothesis in ["two hundrd and fourty", "one thrd", "minus fiv point tree", "twoo milion", "a hlf"]:
+                scorer.score.reset_mock()
+                w2n.parse(hypothesis)
+                parse_calls = scorer.score.call_count
+
+                scorer.score.reset_mock()
+                readings = w2n.parse_nbest([hypothesis])
+                self.assertLessEqual(scorer.score.call_count, parse_calls, (hypothesis, options))
+                self.assertGreater(readings[0].confidence, 0, (hypothesis, options))
+
+                # A budget that is enough to parse the hypothesis is enough to read it.
+                budget = ParseBudget(max_fuzzy_comparisons=parse_calls)
+                self.assertEqual(w2n.parse_nbest([hypothesis], budget=budget)[0].value, w2n.parse(hypothesis))
+
+    def test_parsers_not_modified(self):
+        w2n = Word2Num()
+        w2n.parse_nbest(["two hundrd", "twoo hundred"])
+        self.assertIsNone(w2n.fuzzy_converter.matcher.match_memo)
+        self.assertNotIn("_parse_whole_number", vars(w2n.fuzzy_converter))
+        self.assertNotIn("match", vars(w2n.fuzzy_converter.matcher))
+
+    def test_detected_language(self):
+        w2n = Word2Num("auto")
+        hypotheses = ["doscientos cinco", "two hundrd and five", "dosientos cinco", "hola mundo"]
+        readings = w2n.parse_nbest(hypotheses)
+        self.assertEqual([reading.value for reading in readings], [w2n.parse(hypothesis) for hypothesis in hypotheses])
+        self.assertEqual(readings[0].confidence, EXACT_CONFIDENCE)
+
+    def test_budget_covers_every_hypothesis(self):
+        w2n = Word2Num()
+        hypotheses = ["two hundrd", "twoo hundred", "two hunded", "fiv hundrd"]
+        budget = ParseBudget(max_fuzzy_comparisons=60)
+        for hypothesis in hypotheses:
+            self.assertIsNotNone(w2n.parse(hypothesis, budget=budget))
+        with self.assertRaises(ParseBudgetExceeded) as context:
+            w2n.parse_nbest(hypotheses, budget=budget)
+        self.assertEqual(context.exception.limit, "max_fuzzy_comparisons")
+
+        # Shared work is counted once, so all of them take less than the sum of each on its own.
+        readings = w2n.parse_nbest(hypotheses * 10, budget=ParseBudget(max_fuzzy_comparisons=60 * len(hypotheses)))
+        self.assertEqual(len(readings), 40)
+        with self.assertRaises(ParseBudgetExceeded):
+            w2n.parse_nbest(["one two three"], budget=ParseBudget(max_tokens=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from word2num import Word2Num
+from word2num.word_matching import TheFuzzScorer
+
+
+class TestParseTrace(unittest.TestCase):
+    def test_value_matches_parse(self):
+        w2n = Word2Num()
+        for text in [
+            "two hundred and thirty five",
+            "two hundrd and thirty fve",
+            "minus three point one four",
+            "one and a half",
+            "hello world",
+            "",
+        ]:
+            self.assertEqual(w2n.trace(text).value, w2n.parse(text), text)
+
+    def test_exact_parse_skips_fuzzy_stage(self):
+        trace = Word2Num().trace("two hundred and five")
+        self.assertEqual(trace.tokens, ["two", "hundred", "and", "five"])
+        self.assertEqual([stage.name for stage in trace.stages], ["tokenize", "exact"])
+        self.assertEqual(trace.fuzzy_comparisons, 0)
+
+    def test_fuzzy_stage_records_scores(self):
+        trace = Word2Num().trace("two hundrd")
+        self.assertEqual(trace.value, 200)
+
+        exact, fuzzy = trace.stages[1:]
+        self.assertIsNone(exact.value)
+        self.assertEqual(fuzzy.value, 200)
+        self.assertGreater(fuzzy.fuzzy_comparisons, 0)
+
+        split = fuzzy.splits[0]
+        self.assertEqual((split.words, split.unit, split.index), (["two", "hundrd"], "hundred", 1))
+        self.assertIn(("hundred", "hundrd", 92), split.comparisons)
+
+        digit_decisions = [decision for decision in fuzzy.decisions if decision.category == "digits"]
+        self.assertEqual(digit_decisions[0].word, "two")
+        self.assertEqual(digit_decisions[0].result, "two")
+
+    def test_detected_language(self):
+        trace = Word2Num(language_code="auto").trace("doscientos")
+        self.assertEqual(trace.language_code, "es")
+        self.assertEqual(trace.value, 200)
+
+        trace = Word2Num(language_code="auto").trace("hello world")
+        self.assertIsNone(trace.language_code)
+        self.assertEqual([stage.name for stage in trace.stages], ["tokenize", "detect"])
+
+        w2n = Word2Num(language_code="auto")
+        trace = w2n.trace("fourty dos")
+        detect = trace.stages[1]
+        self.assertGreater(detect.fuzzy_comparisons, 0)
+        self.assertEqual([(decision.category, decision.word) for decision in detect.decisions], [("languages", "fourty")])
+        self.assertEqual(detect.decisions[0].result, {"en": 91})
+        self.assertNotIn("_best_fuzzy_scores", vars(w2n.language_detector))
+
+    def test_serializable(self):
+        trace = Word2Num().trace("fourty two")
+        self.assertEqual(json.loads(json.dumps(trace.to_dict()))["value"], 42)
+
+    def test_parser_not_modified(self):
+        w2n = Word2Num()
+        w2n.trace("two hundrd")
+        self.assertNotIn("_find_largest_unit", vars(w2n.fuzzy_converter))
+        self.assertIs(type(w2n.fuzzy_converter.matcher.scorer), TheFuzzScorer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import gc
+import os
+import unittest
+
+from word2num import Word2Num
+from word2num.preload import memory_usage, preload, preloaded
+
+
+def indexes_built(w2n):
+    matcher = w2n.fuzzy_converter.matcher
+    return None not in (matcher._denominator_forms, matcher._units_by_value, matcher._prefilter, matcher._phonetic_index)
+
+
+class TestPreload(unittest.TestCase):
+    def test_builds_indexes(self):
+        instances = preload(["en", "es"], fuzzy_thresholds=(80, 90), freeze=False, phonetic=True)
+
+        self.assertTrue({("en", 80), ("en", 90), ("es", 80), ("es", 90)} <= set(instances))
+        for (language_code, fuzzy_threshold), w2n in instances.items():
+            if language_code in ("en", "es"):
+                self.assertTrue(indexes_built(w2n), language_code)
+                self.assertIs(preloaded(language_code, fuzzy_threshold), w2n)
+        self.assertEqual(preloaded("es", 80).parse("dos mill"), 2000000)
+
+    def test_detected_languages(self):
+        w2n = preload(["auto"], freeze=False)["auto", 80]
+        for exact_parser, fuzzy_parser in w2n.converters.values():
+            self.assertIsNotNone(exact_parser.matcher._prefilter)
+            self.assertIsNotNone(fuzzy_parser.matcher._prefilter)
+
+    def test_not_preloaded(self):
+        w2n = preloaded("en", 55)
+        self.assertIsInstance(w2n, Word2Num)
+        self.assertEqual(w2n.fuzzy_converter.matcher.fuzzy_threshold, 55)
+
+    def test_freeze(self):
+        try:
+            preload(["en"])
+            self.assertGreater(gc.get_freeze_count(), 0)
+        finally:
+            gc.unfreeze()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_child(self):
+        preload(["en"], freeze=False)
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            with os.fdopen(write_end, "w") as f:
+                f.write(str(preloaded("en").parse("twnety three")))
+            os._exit(0)
+        os.close(write_end)
+        with os.fdopen(read_end) as f:
+            self.assertEqual(f.read(), "23")
+        os.waitpid(pid, 0)
+
+    def test_memory_usage(self):
+        usage = memory_usage()
+        if usage is None:
+            self.skipTest("memory usage not reported on this platform")
+        self.assertGreater(usage.rss, 0)
+        self.assertEqual(usage.shared + usage.private, usage.rss)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from word2num import ParseBudget, Word2Num
+from word2num.server import ConversionServer, MicroBatcher, UnixConversionServer
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def request(connection: http.client.HTTPConnection, method: str, path: str, body=None):
+    connection.request(
+        method,
+        path,
+        body=json.dumps(body) if body is not None else None,
+        headers={"Content-Type": "application/json"},
+    )
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_batches_concurrent_submissions(self):
+        batcher = MicroBatcher(Word2Num(), max_batch_size=100, max_wait=0.05)
+        try:
+            futures = [batcher.submit([text]) for text in ["one", "two", "three"]]
+            self.assertEqual([future.result() for future in futures], [[1], [2], [3]])
+            self.assertEqual(batcher.stats.batches, 1)
+        finally:
+            batcher.close()
+
+    def test_respects_max_batch_size(self):
+        batcher = MicroBatcher(Word2Num(), max_batch_size=2, max_wait=0.05)
+        try:
+            futures = [batcher.submit([text]) for text in ["one", "two", "three"]]
+            self.assertEqual([future.result() for future in futures], [[1], [2], [3]])
+            self.assertEqual(batcher.stats.batches, 2)
+        finally:
+            batcher.close()
+
+    def test_failing_submission_fails_alone(self):
+        w2n = Word2Num(budget=ParseBudget(max_tokens=2))
+        batcher = MicroBatcher(w2n, max_batch_size=100, max_wait=0.05)
+        try:
+            ok = batcher.submit(["two hundred"])
+            failing = batcher.submit(["one two three"])
+            self.assertEqual(ok.result(), [200])
+            self.assertIsNotNone(failing.exception())
+        finally:
+            batcher.close()
+
+    def test_submit_after_close(self):
+        batcher = MicroBatcher(Word2Num())
+        batcher.close()
+        with self.assertRaises(ValueError):
+            batcher.submit(["one"])
+        batcher.close()
+
+
+class TestConversionServer(unittest.TestCase):
+    def setUp(self):
+        self.server = ConversionServer(("127.0.0.1", 0), Word2Num(), max_wait=0.005)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def connect(self) -> http.client.HTTPConnection:
+        return http.client.HTTPConnection(*self.server.server_address)
+
+    def test_parse(self):
+        connection = self.connect()
+        self.assertEqual(request(connection, "POST", "/parse", {"text": "two hundred"}), (200, {"value": 200}))
+        self.assertEqual(
+            request(connection, "POST", "/parse", {"texts": ["one", "hello", "one"]}),
+            (200, {"values": [1, None, 1]}),
+        )
+
+    def test_values_too_large_for_a_float(self):
+        # JSON has no infinity, so values that overflow are null like texts without a value.
+        text = "fourty " * 400
+        self.assertEqual(Word2Num().parse(text), float("inf"))
+        connection = self.connect()
+        self.assertEqual(request(connection, "POST", "/parse", {"text": text}), (200, {"value": None}))
+        self.assertEqual(
+            request(connection, "POST", "/parse", {"texts": [text, "two"]}),
+            (200, {"values": [None, 2]}),
+        )
+
+    def test_concurrent_requests(self):
+        texts = [f"{word} hundred" for word in ["one", "two", "three", "four", "five"]] * 10
+
+        def parse(text):
+            return request(self.connect(), "POST", "/parse", {"text": text})[1]["value"]
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            values = list(executor.map(parse, texts))
+
+        self.assertEqual(values, [Word2Num().parse(text) for text in texts])
+
+        status, stats = request(self.connect(), "GET", "/stats")
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["requests"], len(texts))
+        self.assertLessEqual(stats["batches"], len(texts))
+        self.assertGreaterEqual(stats["latency_ms"]["p99"], stats["latency_ms"]["p50"])
+
+    def test_bad_requests(self):
+        connection = self.connect()
+        self.assertEqual(request(connection, "POST", "/parse", {"texts": [1]})[0], 400)
+        self.assertEqual(request(connection, "POST", "/parse", ["text"])[0], 400)
+        self.assertEqual(request(connection, "GET", "/parse")[0], 404)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not supported")
+class TestUnixConversionServer(unittest.TestCase):
+    def test_parse(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "word2num.sock")
+            server = UnixConversionServer(path, Word2Num())
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                status, body = request(UnixHTTPConnection(path), "POST", "/parse", {"text": "forty two"})
+                self.assertEqual((status, body), (200, {"value": 42}))
+            finally:
+                server.shutdown()
+                server.server_close()
+                thread.join()
+
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
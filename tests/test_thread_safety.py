@@ -0,0 +1,72 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from word2num import Word2Num
+
+ENGLISH_TEXTS = [
+    "one hundred and three",
+    "negative eight",
+    "minus two point five",
+    "one and three quarters",
+    "twenty-two point zero zero three six",
+    "fifty seven thousand four hundred and twenty one",
+    "fourty too",
+    "one three three seven",
+    "a third",
+    "jirafa",
+    "",
+    "minus",
+]
+
+SPANISH_TEXTS = [
+    "menos ocho",
+    "dos negativo",
+    "tres quintas negativas",
+    "cincuenta y siete mil cuatrocientos veintiuno",
+    "uno y cuarto",
+    "unoo punto cincco",
+    "cinco morsas",
+]
+
+
+class TestThreadSafety(unittest.TestCase):
+    def assert_matches_serial(self, w2n, texts, iterations=2000, threads=8):
+        expected = {text: w2n.parse(text) for text in texts}
+        rng = random.Random(1234)
+        workload = [rng.choice(texts) for _ in range(iterations)]
+
+        def parse(text):
+            return text, w2n.parse(text)
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for text, value in executor.map(parse, workload):
+                self.assertEqual(value, expected[text], text)
+
+    def test_shared_english_instance(self):
+        self.assert_matches_serial(Word2Num(language_code="en"), ENGLISH_TEXTS)
+
+    def test_shared_spanish_instance(self):
+        self.assert_matches_serial(Word2Num(language_code="es"), SPANISH_TEXTS)
+
+    def test_parse_many_in_threads(self):
+        w2n = Word2Num()
+        texts = ENGLISH_TEXTS * 20
+
+        self.assertEqual(w2n.parse_many(texts, threads=8), w2n.parse_many(texts))
+
+    def test_parse_many_rejects_processes_and_threads(self):
+        with self.assertRaises(ValueError):
+            Word2Num().parse_many(["one"], processes=2, threads=2)
+
+    def test_parse_does_not_mutate_words(self):
+        parser = Word2Num(language_code="es").exact_converter
+        words = ["menos", "ocho", "negativo"]
+
+        parser._find_and_remove_negative_signifier(words)
+
+        self.assertEqual(words, ["menos", "ocho", "negativo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from word2num import Word2Num
+from word2num.tokenization import SimpleTokenizer
+
+
+class TestWord2Num(unittest.TestCase):
+    def test_parse_many(self):
+        w2n = Word2Num()
+        texts = ["one", "twenty three", "jirafa", "one", "negative eight"]
+
+        self.assertEqual(w2n.parse_many(texts), [1, 23, None, 1, -8])
+
+    def test_parse_many_in_processes(self):
+        w2n = Word2Num(language_code="es")
+        texts = ["uno", "dos", "tres", "siete mil", "dos"]
+
+        self.assertEqual(w2n.parse_many(texts, processes=2), [1, 2, 3, 7000, 2])
+
+    def test_parsers_share_vocabulary_snapshot(self):
+        w2n = Word2Num()
+        vocabulary = w2n.exact_converter.matcher.vocabulary
+
+        self.assertIs(w2n.fuzzy_converter.matcher.vocabulary, vocabulary)
+        self.assertIs(vocabulary.whole_numbers, vocabulary.whole_numbers)
+        self.assertEqual(w2n.parse("ninety nine"), 99)
+
+    def test_parse_tokens(self):
+        w2n = Word2Num()
+        for text in ["minus two point five", "-3 million", "one and three quarters", "fourty too", "jirafa", ""]:
+            self.assertEqual(w2n.parse_tokens(SimpleTokenizer().tokenize(text)), w2n.parse(text), text)
+
+    def test_parse_tokens_leaves_tokens_untouched(self):
+        w2n = Word2Num(language_code="auto")
+        for tokens in [["negative", "eight"], ["-7"], ["menos", "tres", "quintos"], ["minus", "fourty", "too"]]:
+            copy = list(tokens)
+            w2n.parse_tokens(tokens)
+            self.assertEqual(tokens, copy)
+        self.assertEqual(w2n.parse_tokens(("dos", "negativo")), -2)
+
+    def test_parse_many_tokens(self):
+        w2n = Word2Num()
+        token_sequences = [["one"], ("twenty", "three"), ["jirafa"], ("one",), ["negative", "eight"]]
+
+        self.assertEqual(w2n.parse_many_tokens(token_sequences), [1, 23, None, 1, -8])
+        self.assertEqual(w2n.parse_many_tokens(token_sequences, processes=2), [1, 23, None, 1, -8])
+        self.assertEqual(w2n.parse_many_tokens(token_sequences, threads=2), [1, 23, None, 1, -8])
+
+
+if __name__ == "__main__":
+    unittest.main()
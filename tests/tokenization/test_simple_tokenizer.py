@@ -31,6 +31,12 @@ class SimpleTokenizerTest(unittest.TestCase):
         tokens = self.tokenizer.tokenize(text)
         self.assertEqual(tokens, expected_tokens)
 
+    def test_numerals(self):
+        text = "-7, 1,234.5 and twenty-3"
+        expected_tokens = ["-7", "1,234.5", "and", "twenty", "3"]
+        tokens = self.tokenizer.tokenize(text)
+        self.assertEqual(tokens, expected_tokens)
+
 
 if __name__ == "__main__":
     unittest.main()
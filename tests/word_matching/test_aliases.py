@@ -0,0 +1,135 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from word2num import Word2Num
+from word2num.word_matching import AliasTable, TheFuzzScorer, VocabularyRegistry
+
+
+class TestAliasTable(unittest.TestCase):
+    def test_promotes_frequent_matches(self):
+        table = AliasTable(min_count=3, min_score=85)
+        for _ in range(2):
+            table.record("whole_numbers", "ninty", "ninety", 91)
+        self.assertIsNone(table.lookup("whole_numbers", "ninty", 80))
+
+        table.record("whole_numbers", "ninty", "ninety", 91)
+        self.assertEqual(table.lookup("whole_numbers", "ninty", 80), "ninety")
+        self.assertIsNone(table.lookup("whole_numbers", "ninty", 95))
+        self.assertIsNone(table.lookup("digits", "ninty", 80))
+        self.assertEqual(len(table), 1)
+
+    def test_low_scores_are_not_counted(self):
+        table = AliasTable(min_count=1, min_score=85)
+        table.record("digits", "fourty", "four", 80)
+        self.assertEqual(len(table), 0)
+
+    def test_bounded(self):
+        table = AliasTable(min_count=3, max_tracked=10, max_aliases=2)
+        for i in range(100):
+            table.record("units", f"word{i}", "million", 90)
+            self.assertLessEqual(len(table._counts), 10)
+
+        # Frequent misspellings survive the decay of rare ones.
+        for i in range(100):
+            table.record("units", "milion", "million", 90)
+            table.record("units", f"other{i}", "million", 90)
+        self.assertEqual(table.lookup("units", "milion", 80), "million")
+
+        for word in ["a", "b", "c"]:
+            for _ in range(3):
+                table.record("digits", word, "one", 90)
+        self.assertEqual(len(table), 2)
+
+    def test_without(self):
+        table = AliasTable(min_count=1)
+        table.record("units", "milion", "million", 92)
+        table.record("digits", "fiv", "five", 86)
+
+        copy = table.without(["units"])
+        self.assertIsNone(copy.lookup("units", "milion", 80))
+        self.assertEqual(copy.lookup("digits", "fiv", 80), "five")
+        self.assertEqual(table.lookup("units", "milion", 80), "million")
+        self.assertEqual(len(copy), 1)
+
+    def test_save_and_load(self):
+        table = AliasTable(min_count=1, min_score=90)
+        table.record("whole_numbers", "tresientos", "trescientos", 95)
+        file, path = tempfile.mkstemp(suffix=".json")
+        os.close(file)
+        try:
+            table.save(path)
+            loaded = AliasTable.load(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(loaded.to_dict(), table.to_dict())
+        self.assertEqual(loaded.lookup("whole_numbers", "tresientos", 80), "trescientos")
+        self.assertEqual(pickle.loads(pickle.dumps(table)).to_dict(), table.to_dict())
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            AliasTable(min_count=0)
+
+
+class TestMatcherAliases(unittest.TestCase):
+    def test_aliases_skip_fuzzy_matching(self):
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        w2n = Word2Num("es", scorer=scorer, aliases=AliasTable(min_count=2))
+
+        self.assertEqual(w2n.parse("tresientos"), 300)
+        self.assertEqual(w2n.parse("tresientos"), 300)
+        self.assertEqual(w2n.alias_tables["es"].lookup("whole_numbers", "tresientos", 80), "trescientos")
+
+        scorer.score.reset_mock()
+        self.assertEqual(w2n.parse("tresientos"), 300)
+        whole_numbers = w2n.fuzzy_converter.matcher.vocabulary.whole_numbers
+        self.assertFalse([args for args, _ in scorer.score.call_args_list if args[1] in whole_numbers])
+
+    def test_same_results(self):
+        phrases = ["ninty nine thousand", "one hundred and twnety", "seventeeen", "fourty two", "a thrd", "minus fiev"]
+        for options in [{}, {"score_cache": True}, {"phonetic": True}]:
+            expected = [Word2Num(**options).parse(phrase) for phrase in phrases]
+            w2n = Word2Num(aliases=AliasTable(min_count=1, min_score=0), **options)
+            for _ in range(3):
+                self.assertEqual([w2n.parse(phrase) for phrase in phrases], expected, options)
+            self.assertTrue(w2n.alias_tables["en"], options)
+
+    def test_loaded_aliases(self):
+        table = AliasTable.from_dict({**AliasTable().to_dict(), "aliases": {"whole_numbers": {"ninty": ["ninety", 91]}}})
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+
+        self.assertEqual(Word2Num(scorer=scorer, aliases=table).parse("ninty nine"), 99)
+        self.assertNotIn(mock.call("ninty", "ninety", 80), scorer.score.call_args_list)
+        self.assertEqual(Word2Num(aliases={"en": table}).parse("ninty nine"), 99)
+        self.assertIsNone(Word2Num(fuzzy_threshold=95, aliases=table).parse("ninty nine"))
+
+    def test_added_words_drop_aliases_of_their_category(self):
+        w2n = Word2Num(aliases=AliasTable(min_count=1), vocabulary_registry=VocabularyRegistry())
+        w2n.parse("ninty nine")
+        w2n.parse("fiv")
+        self.assertEqual(w2n.alias_tables["en"].lookup("whole_numbers", "ninty", 80), "ninety")
+
+        # Units are added to the whole numbers too.
+        w2n.add_words("units", {"ninti": 10 ** 6})
+
+        aliases = w2n.alias_tables["en"]
+        self.assertIsNone(aliases.lookup("whole_numbers", "ninty", 80))
+        self.assertEqual(aliases.lookup("digits", "fiv", 80), "five")
+        fresh = Word2Num(vocabulary_registry=VocabularyRegistry())
+        fresh.add_words("units", {"ninti": 10 ** 6})
+        for phrase in ["ninty nine", "two ninty", "fiv ninty"]:
+            self.assertEqual(w2n.parse(phrase), fresh.parse(phrase), phrase)
+
+    def test_detected_language(self):
+        w2n = Word2Num("auto", aliases=True)
+        self.assertEqual(sorted(w2n.alias_tables), ["en", "es"])
+        self.assertEqual(Word2Num().alias_tables, {})
+        with self.assertRaises(ValueError):
+            Word2Num("auto", aliases=AliasTable())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import pickle
+import unittest
+
+from word2num import Word2Num
+from word2num.languages.en.phonetic import english_phonetic_key
+from word2num.languages.es.phonetic import spanish_phonetic_key
+from word2num.word_matching.phonetic import PhoneticIndex
+
+
+class TestPhoneticKeys(unittest.TestCase):
+    def test_english_homophones(self):
+        for misheard, word in [
+            ("for", "four"),
+            ("ate", "eight"),
+            ("won", "one"),
+            ("to", "two"),
+            ("too", "two"),
+            ("sics", "six"),
+            ("nein", "nine"),
+            ("fourty", "forty"),
+        ]:
+            self.assertEqual(english_phonetic_key(misheard), english_phonetic_key(word), misheard)
+
+    def test_english_distinct_numbers(self):
+        keys = [english_phonetic_key(word) for word in ["eight", "eighth", "two", "ten", "twenty", "twelve"]]
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_closest_word_of_block(self):
+        # "eight" and "eighty" sound alike without their vowels, so the block is scored.
+        self.assertEqual(english_phonetic_key("eight"), english_phonetic_key("eighty"))
+        self.assertEqual(Word2Num(phonetic=True).parse("ate"), 8)
+        self.assertEqual(Word2Num(phonetic=True).parse("aty"), 80)
+
+    def test_spanish_homophones(self):
+        for misheard, word in [
+            ("sinco", "cinco"),
+            ("beinte", "veinte"),
+            ("sero", "cero"),
+            ("dies", "diez"),
+            ("kinse", "quince"),
+            ("miyon", "millón"),
+            ("ocho", "hocho"),
+        ]:
+            self.assertEqual(spanish_phonetic_key(misheard), spanish_phonetic_key(word), misheard)
+
+    def test_spanish_keeps_vowels(self):
+        self.assertNotEqual(spanish_phonetic_key("seis"), spanish_phonetic_key("sus"))
+        self.assertEqual(spanish_phonetic_key("pingüino"), "PINGUINO")
+
+    def test_no_letters(self):
+        self.assertEqual(english_phonetic_key(""), "")
+        self.assertEqual(spanish_phonetic_key("42"), "")
+
+
+class TestPhoneticIndex(unittest.TestCase):
+    def test_blocks(self):
+        index = PhoneticIndex([("four", "FR"), ("for", "FR"), ("four", "FR"), ("a", "")])
+        self.assertEqual(index.block("FR"), ["four", "for"])
+        self.assertEqual(index.block(""), [])
+        self.assertEqual(index.block("XYZ"), [])
+
+
+class TestPhoneticMatching(unittest.TestCase):
+    def test_misheard_words(self):
+        w2n = Word2Num(phonetic=True)
+        self.assertEqual(w2n.parse("ate"), 8)
+        self.assertEqual(w2n.parse("won hundred"), 100)
+        self.assertEqual(w2n.parse("to thousand and ate"), 2008)
+        self.assertEqual(w2n.parse("two hundrd"), 200)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(Word2Num().parse("ate"))
+        self.assertIsNone(Word2Num(phonetic=True, fuzzy_threshold=100).parse("ate"))
+
+    def test_spanish(self):
+        w2n = Word2Num(language_code="es", phonetic=True)
+        self.assertEqual(w2n.parse("kinse"), 15)
+        self.assertEqual(w2n.parse("dos miyones"), 2000000)
+
+    def test_auto_language(self):
+        w2n = Word2Num(language_code="auto", phonetic=True)
+        self.assertEqual(w2n.parse("ate"), 8)
+        self.assertEqual(w2n.parse("kinse"), 15)
+
+    def test_fewer_comparisons(self):
+        text = "for hundred"
+        self.assertLess(
+            Word2Num(phonetic=True).trace(text).fuzzy_comparisons,
+            Word2Num().trace(text).fuzzy_comparisons,
+        )
+
+    def test_pickle(self):
+        w2n = pickle.loads(pickle.dumps(Word2Num(phonetic=True)))
+        self.assertEqual(w2n.parse("ate"), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import string
+import unittest
+from unittest import mock
+
+from thefuzz import fuzz
+
+from word2num import Word2Num
+from word2num.languages.en.word_matcher import EnglishWordMatcher
+from word2num.languages.es.word_matcher import SpanishWordMatcher
+from word2num.word_matching import VocabularyPrefilter
+
+
+def random_tokens(words, count, seed=0):
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + "áéíóúñ"
+    tokens = []
+    for _ in range(count):
+        word = list(rng.choice(words))
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(word) + 1)
+            operation = rng.choice(["insert", "delete", "replace"])
+            if operation == "insert":
+                word.insert(position, rng.choice(alphabet))
+            elif word and position < len(word):
+                if operation == "delete":
+                    del word[position]
+                else:
+                    word[position] = rng.choice(alphabet)
+        tokens.append("".join(word) or "x")
+        tokens.append("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))))
+    return tokens
+
+
+class TestVocabularyPrefilter(unittest.TestCase):
+    def assert_conservative(self, matcher_class):
+        for threshold in (50, 80, 95, 100):
+            prefilter = matcher_class(threshold).prefilter
+            words = sorted(prefilter.words | prefilter.denominator_words)
+
+            for token in random_tokens(words, 300, seed=threshold):
+                if not prefilter.may_match(token):
+                    best = max(fuzz.ratio(token, word) for word in words)
+                    self.assertLess(best, threshold, token)
+
+                if not prefilter.may_match_denominator(token):
+                    best = max(
+                        max(fuzz.ratio(token, word), fuzz.ratio(token.rstrip("s"), word))
+                        for word in prefilter.denominator_words
+                    )
+                    self.assertLess(best, threshold, token)
+
+    def test_english_prefilter_is_conservative(self):
+        self.assert_conservative(EnglishWordMatcher)
+
+    def test_spanish_prefilter_is_conservative(self):
+        self.assert_conservative(SpanishWordMatcher)
+
+    def test_classify(self):
+        prefilter = VocabularyPrefilter(["one", "two"], ["half", "fourth"], 80)
+
+        self.assertEqual(prefilter.classify("one"), prefilter.ACCEPTED)
+        self.assertEqual(prefilter.classify("twoo"), prefilter.ACCEPTED)
+        self.assertEqual(prefilter.classify("halves"), prefilter.REJECTED)
+        self.assertEqual(prefilter.classify("halfs"), prefilter.DENOMINATOR)
+        self.assertEqual(prefilter.classify("giraffe"), prefilter.REJECTED)
+
+    def test_rejects_before_fuzzy_scoring(self):
+        w2n = Word2Num()
+        w2n.parse("warm up")
+
+        with mock.patch.object(fuzz, "ratio", wraps=fuzz.ratio) as ratio:
+            self.assertIsNone(w2n.parse("please confirm the delivery address"))
+
+        ratio.assert_not_called()
+
+    def test_parse_results_unchanged(self):
+        phrases = {
+            "en": [
+                "fourty two", "twoo hunrdered and twienty-too", "one and a halff",
+                "the customer", "five walruses", "one half giraffe quarter", "minus sevn",
+            ],
+            "es": [
+                "tre y medip", "dociento veintidos", "jirafa", "cinco morsas",
+                "unoo punto cincco", "dos negativo",
+            ],
+        }
+
+        for language_code, texts in phrases.items():
+            for threshold in (60, 80):
+                filtered = Word2Num(language_code=language_code, fuzzy_threshold=threshold)
+                unfiltered = Word2Num(language_code=language_code, fuzzy_threshold=threshold)
+                for parser in (unfiltered.exact_converter, unfiltered.fuzzy_converter):
+                    parser.use_prefilter = False
+
+                for text in texts:
+                    self.assertEqual(filtered.parse(text), unfiltered.parse(text), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import pickle
+import unittest
+from unittest import mock
+
+from thefuzz import fuzz
+
+from word2num import Word2Num
+from word2num.word_matching import RankedScoreCache, TheFuzzScorer, shared_score_cache
+from word2num.word_matching.score_cache import Ranking
+
+WORDS = ("three", "thee", "thirty", "tree")
+
+
+class TestRankedScoreCache(unittest.TestCase):
+    def test_ranking(self):
+        ranking = RankedScoreCache().rank("thre", WORDS, TheFuzzScorer())
+        self.assertEqual(
+            ranking.scores,
+            (("three", 89), ("thee", 75), ("tree", 75), ("thirty", 60)),
+        )
+        self.assertEqual(
+            [score for _, score in ranking.scores],
+            sorted((fuzz.ratio("thre", word) for word in WORDS), reverse=True),
+        )
+        self.assertEqual(ranking.best_match(80), ("three", 89))
+        self.assertIsNone(ranking.best_match(90))
+        self.assertIsNone(Ranking(()).best_match(80))
+
+    def test_scored_once(self):
+        cache = RankedScoreCache()
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        for _ in range(3):
+            cache.rank("thre", WORDS, scorer)
+        self.assertEqual(scorer.score.call_count, len(WORDS))
+        self.assertEqual(len(cache), 1)
+
+    def test_starts_over_when_full(self):
+        cache = RankedScoreCache(max_rankings=2)
+        for word in ["a", "b", "c"]:
+            cache.rank(word, WORDS, TheFuzzScorer())
+        self.assertEqual(len(cache), 1)
+
+    def test_pickle(self):
+        self.assertIs(pickle.loads(pickle.dumps(shared_score_cache)), shared_score_cache)
+
+        cache = RankedScoreCache(max_rankings=10)
+        cache.rank("thre", WORDS, TheFuzzScorer())
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((copy.max_rankings, len(copy)), (10, 0))
+
+
+class TestMatcherScoreCache(unittest.TestCase):
+    PHRASES = ["two hundrd and thirty fve", "fourty two", "one and three quartrs", "giraffe", "milion", "sevn"]
+
+    def test_shared_between_thresholds(self):
+        cache = RankedScoreCache()
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        strict = Word2Num(fuzzy_threshold=90, scorer=scorer, score_cache=cache)
+        lenient = Word2Num(fuzzy_threshold=70, scorer=scorer, score_cache=cache)
+
+        self.assertEqual(lenient.fuzzy_converter.matcher.match_whole_number("fourty"), "forty")
+        self.assertEqual(lenient.fuzzy_converter.matcher.match_whole_number("tventy"), "twenty")
+        scorer.score.reset_mock()
+        self.assertEqual(strict.fuzzy_converter.matcher.match_whole_number("fourty"), "forty")
+        self.assertIsNone(strict.fuzzy_converter.matcher.match_whole_number("tventy"))
+        scorer.score.assert_not_called()
+
+    def test_scored_once_at_decreasing_thresholds(self):
+        # Rankings aren't cut off at the threshold of the first matcher, so lower thresholds don't score words again.
+        cache = RankedScoreCache()
+        calculate_ranking = mock.Mock(wraps=RankedScoreCache._calculate_ranking)
+        with mock.patch.object(RankedScoreCache, "_calculate_ranking", calculate_ranking):
+            for threshold in (90, 80, 70):
+                w2n = Word2Num(fuzzy_threshold=threshold, score_cache=cache)
+                self.assertEqual(
+                    [w2n.parse(phrase) for phrase in self.PHRASES],
+                    [Word2Num(fuzzy_threshold=threshold).parse(phrase) for phrase in self.PHRASES],
+                )
+
+        ranked = [(word, candidates) for (word, candidates, _), _ in calculate_ranking.call_args_list]
+        self.assertEqual(len(ranked), len(set(ranked)))
+        self.assertEqual(len(ranked), len(cache))
+
+    def test_same_results(self):
+        for threshold in (60, 80, 90):
+            expected = [Word2Num(fuzzy_threshold=threshold).parse(phrase) for phrase in self.PHRASES]
+            w2n = Word2Num(fuzzy_threshold=threshold, score_cache=RankedScoreCache())
+            for _ in range(2):
+                self.assertEqual([w2n.parse(phrase) for phrase in self.PHRASES], expected, threshold)
+
+    def test_process_wide_cache(self):
+        w2n = Word2Num(score_cache=True)
+        self.assertIs(w2n.fuzzy_converter.matcher.score_cache, shared_score_cache)
+        self.assertIsNone(w2n.exact_converter.matcher.score_cache)
+        self.assertIsNone(Word2Num().fuzzy_converter.matcher.score_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
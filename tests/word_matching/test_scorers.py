@@ -0,0 +1,78 @@
+import pickle
+import random
+import unittest
+from unittest import mock
+
+from thefuzz import fuzz
+
+from word2num import Word2Num
+from word2num.word_matching import BitParallelScorer, RapidFuzzScorer, TheFuzzScorer
+from word2num.word_matching.scorers import max_possible_score, ratio_from_lcs
+
+SCORERS = [TheFuzzScorer(), RapidFuzzScorer(), BitParallelScorer()]
+
+
+def random_pairs(count, seed=0):
+    rng = random.Random(seed)
+    alphabet = "abcdeñé"
+    for _ in range(count):
+        yield (
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))),
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))),
+            rng.randint(0, 100),
+        )
+
+
+class TestScorers(unittest.TestCase):
+    def test_scores_match_thefuzz(self):
+        for a, b, cutoff in random_pairs(20000):
+            ratio = fuzz.ratio(a, b)
+            expected = ratio if ratio >= cutoff else 0
+            for scorer in SCORERS:
+                self.assertEqual(scorer.score(a, b, cutoff), expected, (type(scorer).__name__, a, b, cutoff))
+
+    def test_ratio_from_lcs(self):
+        self.assertEqual(ratio_from_lcs(0, 0, 0), 100)
+        self.assertEqual(ratio_from_lcs(3, 3, 5), fuzz.ratio("abc", "abcde"))
+        self.assertEqual(max_possible_score(3, 5), 75)
+
+    def test_pickle(self):
+        for scorer in SCORERS:
+            copy = pickle.loads(pickle.dumps(scorer))
+            self.assertEqual(copy.score("hundrd", "hundred"), 92)
+
+
+class TestMatcherScoring(unittest.TestCase):
+    PHRASES = ["two hundrd and thirty fve", "fourty two", "one and three quartrs", "seventh", "giraffe", "milion"]
+
+    def test_scorers_give_identical_results(self):
+        expected = [Word2Num().parse(phrase) for phrase in self.PHRASES]
+        for scorer_name in ["rapidfuzz", "bitparallel"]:
+            w2n = Word2Num(scorer=scorer_name)
+            self.assertEqual([w2n.parse(phrase) for phrase in self.PHRASES], expected, scorer_name)
+
+    def test_length_pruning_skips_hopeless_candidates(self):
+        matcher = Word2Num().fuzzy_converter.matcher
+        with mock.patch.object(fuzz, "ratio", wraps=fuzz.ratio) as ratio:
+            self.assertEqual(matcher.match_unit("hundrd"), "hundred")
+
+        compared = {call.args[1] for call in ratio.call_args_list}
+        # "quintillion" is too long to ever reach the threshold against a six letter word.
+        self.assertNotIn("quintillion", compared)
+        self.assertIn("hundred", compared)
+
+    def test_cutoff_is_best_score_so_far(self):
+        scorer = mock.Mock(wraps=TheFuzzScorer())
+        matcher = Word2Num(scorer=scorer).fuzzy_converter.matcher
+        matcher.match("thre", ["three", "thee"])
+
+        cutoffs = [call.args[2] for call in scorer.score.call_args_list]
+        self.assertEqual(cutoffs, [80, fuzz.ratio("thre", "three") + 1])
+
+    def test_unsupported_scorer(self):
+        with self.assertRaises(ValueError):
+            Word2Num(scorer="levenshtein")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+import pickle
+import random
+import string
+import threading
+import unittest
+
+from word2num import Word2Num, word2num
+from word2num.languages.en.word_matcher import EnglishWordMatcher
+from word2num.languages.es.word_matcher import SpanishWordMatcher
+from word2num.languages.packs import LanguagePack
+from word2num.word_matching import VocabularyRegistry, VocabularySnapshot, shared_vocabulary_registry
+
+EXTENSIONS = {
+    EnglishWordMatcher: [
+        ("units", {"grand": 1000, "k": 1000, "dozen": 12, "gazillion": 10 ** 30}),
+        ("whole_numbers", {"fourty": 40, "zillion": 10 ** 7}),
+        ("digits", {"oh": 0}),
+        ("irregular_denominators", {"dozenth": 12, "halve": 2, "sixteenthish": 16}),
+        ("negative_signifiers", ["below"]),
+        ("decimal_separators", ["dot"]),
+    ],
+    SpanishWordMatcher: [
+        ("whole_numbers", {"veintiún": 21, "dieciseis": 16}),
+        ("units", {"lucas": 1000}),
+        ("irregular_denominators", {"mitá": 2}),
+        ("indefinite_articles", ["uno"]),
+    ],
+}
+
+
+def random_tokens(words, count, seed=0):
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + "áéíóúñ"
+    tokens = []
+    for _ in range(count):
+        word = list(rng.choice(words))
+        word[rng.randrange(len(word))] = rng.choice(alphabet)
+        tokens.append("".join(word))
+        tokens.append("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))))
+    return tokens
+
+
+class TestVocabularyExtension(unittest.TestCase):
+    def assert_same_indexes(self, extended, built, tokens):
+        self.assertEqual(extended.denominator_forms, built.denominator_forms)
+        self.assertEqual(extended.units_by_value, built.units_by_value)
+        self.assertEqual(extended.prefilter.words, built.prefilter.words)
+        for token in tokens:
+            self.assertEqual(extended.prefilter.classify(token), built.prefilter.classify(token), token)
+            self.assertEqual(
+                extended.phonetic_index.block(extended.phonetic_key(token)),
+                built.phonetic_index.block(built.phonetic_key(token)),
+                token,
+            )
+
+    def test_indexes_match_rebuilt_indexes(self):
+        for matcher_class, extensions in EXTENSIONS.items():
+            for threshold in (60, 80, 100):
+                matcher = matcher_class(threshold, phonetic=True)
+                vocabulary = matcher.vocabulary
+                tokens = random_tokens(sorted(matcher.prefilter.words), 300)
+                # Remember verdicts and build every index before extending, so that they are all updated.
+                for token in tokens:
+                    matcher.prefilter.classify(token)
+                matcher.phonetic_index
+
+                for category, words in extensions:
+                    vocabulary = vocabulary.extended(category, words)
+                    matcher = matcher.extended(vocabulary)
+                    built = matcher_class(threshold, vocabulary, phonetic=True)
+                    self.assert_same_indexes(matcher, built, tokens + list(words))
+
+    def test_leaves_original_untouched(self):
+        matcher = EnglishWordMatcher(80)
+        prefilter = matcher.prefilter
+        self.assertEqual(prefilter.classify("grand"), prefilter.REJECTED)
+
+        extended = matcher.extended(matcher.vocabulary.extended("units", {"grand": 1000}))
+
+        self.assertNotEqual(extended.prefilter.classify("grand"), prefilter.REJECTED)
+        self.assertEqual(prefilter.classify("grand"), prefilter.REJECTED)
+        self.assertNotIn("grand", matcher.vocabulary.units)
+        self.assertNotIn("grand", matcher.units_by_value)
+        self.assertIs(extended.vocabulary.digits, matcher.vocabulary.digits)
+
+    def test_invalid_words(self):
+        vocabulary = EnglishWordMatcher(80).vocabulary
+        for category, words in [
+            ("unknown", ["word"]),
+            ("units", ["grand"]),
+            ("negative_signifiers", {"below": 1}),
+            ("negative_signifiers", "below"),
+            ("units", {"Grand": 1000}),
+            ("units", {"two words": 1000}),
+            ("units", {"100": 100}),
+            ("units", {"million": 10 ** 9}),
+        ]:
+            with self.assertRaises(ValueError, msg=(category, words)):
+                vocabulary.extended(category, words)
+
+
+class TestAddWords(unittest.TestCase):
+    def test_add_words(self):
+        w2n = Word2Num(vocabulary_registry=VocabularyRegistry())
+        self.assertIsNone(w2n.parse("five grand"))
+
+        w2n.add_words("units", {"grand": 1000, "dozen": 12})
+        w2n.add_words("negative_signifiers", ["below"])
+
+        self.assertEqual(w2n.parse("five grand"), 5000)
+        self.assertEqual(w2n.parse("two dozen"), 24)
+        self.assertEqual(w2n.parse("five grnd"), 5000)
+        self.assertEqual(w2n.parse("below five"), -5)
+        self.assertEqual(w2n.parse_many(["three grand", "one hundred"]), [3000, 100])
+        self.assertEqual(pickle.loads(pickle.dumps(w2n)).parse("five grand"), 5000)
+        incremental_parser = w2n.incremental()
+        incremental_parser.push("five")
+        self.assertEqual(incremental_parser.push("grand"), 5000)
+        self.assertIs(w2n.fuzzy_converter.matcher.vocabulary, w2n.exact_converter.matcher.vocabulary)
+
+    def test_instances_of_the_language_see_words(self):
+        registry = VocabularyRegistry()
+        existing = Word2Num(score_cache=True, aliases=True, vocabulary_registry=registry)
+        detecting = Word2Num(language_code="auto", vocabulary_registry=registry)
+        self.assertIsNone(existing.parse("five grand"))
+
+        Word2Num(vocabulary_registry=registry).add_words("units", {"grand": 1000})
+        detecting.add_words("units", {"lucas": 1000}, language_code="es")
+
+        language_pack = LanguagePack.compile("en")
+        for instance in (
+            existing,
+            detecting,
+            Word2Num(vocabulary_registry=registry),
+            Word2Num.from_language_pack(language_pack, vocabulary_registry=registry),
+        ):
+            self.assertEqual(instance.parse("five grand"), 5000)
+            self.assertEqual(instance.parse("five grnd"), 5000)
+        self.assertIsNone(existing.parse("cinco lucas"))
+        self.assertEqual(detecting.parse("cinco lucas"), 5000)
+        self.assertEqual(Word2Num("es", vocabulary_registry=registry).parse("cinco lucas"), 5000)
+        self.assertIs(
+            existing.exact_converter.matcher.vocabulary, registry.vocabulary("en")
+        )
+
+        # Instances with another registry keep their vocabulary.
+        for instance in (Word2Num(vocabulary_registry=VocabularyRegistry()), Word2Num(), Word2Num("auto")):
+            self.assertIsNone(instance.parse("five grand"))
+        self.assertIsNone(word2num("five grand"))
+        self.assertIs(Word2Num().vocabulary_registry, shared_vocabulary_registry)
+
+    def test_pickle_registry(self):
+        self.assertIs(pickle.loads(pickle.dumps(shared_vocabulary_registry)), shared_vocabulary_registry)
+
+        registry = VocabularyRegistry()
+        Word2Num(vocabulary_registry=registry).add_words("units", {"grand": 1000})
+        copy = pickle.loads(pickle.dumps(registry))
+        self.assertEqual((copy.version, copy.vocabulary("en")), (0, None))
+
+    def test_detected_language(self):
+        w2n = Word2Num(language_code="auto", vocabulary_registry=VocabularyRegistry())
+        with self.assertRaises(ValueError):
+            w2n.add_words("units", {"lucas": 1000})
+        with self.assertRaises(ValueError):
+            w2n.add_words("units", {"lucas": 1000}, language_code="fr")
+
+        w2n.add_words("units", {"lucas": 1000}, language_code="es")
+
+        self.assertEqual(w2n.language_detector.detect("cinco lucas"), "es")
+        self.assertEqual(w2n.parse("cinco lucas"), 5000)
+        self.assertIsNone(w2n.parse("five lucas"))
+
+    def test_fixed_language(self):
+        registry = VocabularyRegistry()
+        with self.assertRaises(ValueError):
+            Word2Num(vocabulary_registry=registry).add_words("units", {"lucas": 1000}, language_code="es")
+        with self.assertRaises(ValueError):
+            Word2Num(vocabulary_registry=registry).add_words("units", {"million": 10 ** 9})
+        self.assertEqual(registry.version, 0)
+
+    def test_parses_see_old_or_new_vocabulary(self):
+        registry = VocabularyRegistry()
+        w2n = Word2Num(vocabulary_registry=registry)
+        results = set()
+        adding = threading.Event()
+
+        def parse():
+            while not adding.is_set():
+                results.add(w2n.parse("seven lakh"))
+            results.add(w2n.parse("seven lakh"))
+
+        threads = [threading.Thread(target=parse) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        # Words added through another instance are seen all at once as well.
+        Word2Num(vocabulary_registry=registry).add_words("units", {"lakh": 10 ** 5})
+        adding.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results - {None}, {7 * 10 ** 5})
+        self.assertIn(7 * 10 ** 5, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
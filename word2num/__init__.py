@@ -1,3 +1,5 @@
+from .version import __version__
+from .parsing.budget import ParseBudget, ParseBudgetExceeded
 from .word2num import word2num, Word2Num
 
-__all__ = ["word2num", "Word2Num"]
\ No newline at end of file
+__all__ = ["word2num", "Word2Num", "ParseBudget", "ParseBudgetExceeded", "__version__"]
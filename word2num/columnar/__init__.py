@@ -0,0 +1,3 @@
+from .arrow import ArrowConverter, convert_arrow_array, convert_parquet_column
+from .series import convert_column
+from .sqlite import register_sqlite_function
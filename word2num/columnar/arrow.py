@@ -0,0 +1,121 @@
+from typing import Any, Dict, Iterator, Optional
+
+from word2num.word2num import Word2Num
+
+DEFAULT_BATCH_SIZE = 64 * 1024
+DEFAULT_MAX_CACHED_VALUES = 100_000
+
+
+class ArrowConverter:
+    """
+    Converts Arrow string arrays of text representations of numbers to float64 arrays.
+
+    Arrays are dictionary-encoded before conversion (unless they already are), so only
+    the distinct values of each array are materialized as Python strings and parsed.
+    Values parsed for earlier arrays are remembered, up to `max_cached_values` distinct values,
+    so a stream of record batches doesn't parse the same value again.
+    """
+
+    def __init__(
+        self,
+        w2n: Optional[Word2Num] = None,
+        processes: Optional[int] = None,
+        max_cached_values: int = DEFAULT_MAX_CACHED_VALUES,
+    ):
+        self.w2n = w2n or Word2Num()
+        self.processes = processes
+        self.max_cached_values = max_cached_values
+        self._parsed_values: Dict[str, Optional[float]] = {}
+
+    def convert(self, array: Any) -> Any:
+        """
+        Converts an Arrow array of text representations of numbers.
+
+        :param array: A string, large string or dictionary-encoded string Array or ChunkedArray.
+        :return: A float64 array of the same length whose validity bitmap is unset where the input is null or parsing fails.
+        """
+        pa, pc = _import_pyarrow()
+
+        if isinstance(array, pa.ChunkedArray):
+            return pa.chunked_array(
+                [self.convert(chunk) for chunk in array.chunks], type=pa.float64()
+            )
+
+        if not pa.types.is_dictionary(array.type):
+            array = pc.dictionary_encode(array)
+
+        dictionary_values = self._parse_dictionary(array.dictionary.to_pylist())
+        return pc.take(pa.array(dictionary_values, type=pa.float64()), array.indices)
+
+    def _parse_dictionary(self, texts: list) -> list:
+        """Parses the distinct values of a dictionary, reusing values parsed for earlier arrays."""
+        present_texts = [text for text in texts if text is not None]
+        new_texts = [
+            text for text in present_texts if text not in self._parsed_values
+        ]
+        if len(self._parsed_values) + len(new_texts) > self.max_cached_values:
+            self._parsed_values.clear()
+            new_texts = present_texts
+
+        new_values = self.w2n.parse_many(new_texts, processes=self.processes)
+        self._parsed_values.update(zip(new_texts, new_values))
+
+        return [
+            None if text is None else self._parsed_values[text] for text in texts
+        ]
+
+
+def convert_arrow_array(
+    array: Any, w2n: Optional[Word2Num] = None, processes: Optional[int] = None
+) -> Any:
+    """
+    Converts an Arrow string array of text representations of numbers to a float64 array.
+    Each distinct value is parsed once.
+
+    :param array: A string, large string or dictionary-encoded string Array or ChunkedArray.
+    :param w2n: The Word2Num instance to parse with (default: English with the default fuzzy threshold).
+    :param processes: Number of worker processes to spread the distinct values across (default: parse in the current process).
+    :return: A float64 array whose validity bitmap is unset where the input is null or parsing fails.
+    """
+    return ArrowConverter(w2n, processes=processes).convert(array)
+
+
+def convert_parquet_column(
+    path: Any,
+    column: str,
+    w2n: Optional[Word2Num] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    processes: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Streams the converted values of a Parquet string column, one record batch at a time.
+    The column is read dictionary-encoded, so each distinct value in a batch is only decoded and parsed once,
+    and only one batch is held in memory at a time.
+
+    :param path: Path or file object of the Parquet file.
+    :param column: Name of the column holding text representations of numbers.
+    :param w2n: The Word2Num instance to parse with (default: English with the default fuzzy threshold).
+    :param batch_size: Maximum number of rows per record batch.
+    :param processes: Number of worker processes to spread the distinct values across (default: parse in the current process).
+    :return: An iterator of float64 arrays, one per record batch, in file order.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    converter = ArrowConverter(w2n, processes=processes)
+    parquet_file = pq.ParquetFile(path, read_dictionary=[column])
+
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=[column]):
+        yield converter.convert(batch.column(0))
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError as error:
+        raise ImportError(
+            "Arrow conversion requires pyarrow. Install it with `pip install word2num[arrow]`."
+        ) from error
+
+    return pyarrow, pyarrow.compute
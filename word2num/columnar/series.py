@@ -0,0 +1,108 @@
+from typing import Any, List, Optional, Tuple
+
+from word2num.word2num import Word2Num
+
+INTEGER_LIMIT = 2 ** 63
+
+
+def convert_column(
+    column: Any,
+    w2n: Optional[Word2Num] = None,
+    dtype: str = "float64",
+    processes: Optional[int] = None,
+) -> Any:
+    """
+    Converts a column of text representations of numbers to a numerical array.
+    The column is factorized first, so each distinct value is only parsed once no matter how often it repeats.
+
+    :param column: A pandas Series or a NumPy object array of text representations of numbers.
+    :param w2n: The Word2Num instance to parse with (default: English with the default fuzzy threshold).
+    :param dtype: "float64" for a float array with NaN where parsing fails, or "Int64" for a pandas nullable integer array with NA where parsing fails or the value is not a whole number.
+    :param processes: Number of worker processes to spread the distinct values across (default: parse in the current process).
+    :return: A pandas Series sharing the column's index if a Series was given, otherwise a NumPy array (or a pandas IntegerArray for "Int64").
+    """
+    np = _import_numpy()
+    if dtype not in ("float64", "Int64"):
+        raise ValueError(f"Unsupported dtype: {dtype}")
+
+    w2n = w2n or Word2Num()
+    codes, uniques = _factorize(column)
+
+    texts = [value for value in uniques if isinstance(value, str)]
+    values_by_text = dict(zip(texts, w2n.parse_many(texts, processes=processes)))
+
+    # The trailing NaN is picked up by the -1 code that marks missing values.
+    unique_values = np.full(len(uniques) + 1, np.nan, dtype=np.float64)
+    for i, value in enumerate(uniques):
+        parsed = values_by_text.get(value) if isinstance(value, str) else None
+        if parsed is not None:
+            unique_values[i] = parsed
+
+    result = unique_values[codes]
+
+    if dtype == "Int64":
+        pd = _import_pandas()
+        is_integer = (np.mod(result, 1) == 0) & (np.abs(result) < INTEGER_LIMIT)
+        result = pd.array(np.where(is_integer, result, np.nan), dtype="Int64")
+
+    if _is_series(column):
+        pd = _import_pandas()
+        return pd.Series(result, index=column.index, name=column.name)
+
+    return result
+
+
+def _factorize(column: Any) -> Tuple[Any, List[Any]]:
+    """
+    Encodes the column as codes into a list of its distinct values, with -1 marking missing values.
+    pandas is used when it is installed; otherwise the column is factorized with a dictionary.
+    """
+    np = _import_numpy()
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    if pd is not None:
+        codes, uniques = pd.factorize(column)
+        return np.asarray(codes, dtype=np.intp), list(uniques)
+
+    index = {}
+    values = np.asarray(column, dtype=object).ravel()
+    codes = np.empty(len(values), dtype=np.intp)
+    for i, value in enumerate(values):
+        codes[i] = -1 if value is None else index.setdefault(value, len(index))
+
+    return codes, list(index)
+
+
+def _is_series(column: Any) -> bool:
+    """Checks if the column is a pandas Series without requiring pandas to be installed."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return False
+
+    return isinstance(column, pd.Series)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "Column conversion requires NumPy. Install it with `pip install word2num[pandas]`."
+        ) from error
+
+    return numpy
+
+
+def _import_pandas():
+    try:
+        import pandas
+    except ImportError as error:
+        raise ImportError(
+            "Nullable integer output requires pandas. Install it with `pip install word2num[pandas]`."
+        ) from error
+
+    return pandas
@@ -0,0 +1,75 @@
+import sqlite3
+from typing import Dict, Optional, Tuple, Union
+
+from word2num.word2num import Word2Num
+
+DEFAULT_FUNCTION_NAME = "word2num"
+DEFAULT_MAX_CACHED_VALUES = 100_000
+
+# Values SQLite stores as integers, which whole numbers are returned as.
+INTEGER_LIMIT = 2 ** 63
+
+# Instances for calls that name a language or fuzzy threshold, shared by every connection so they stay warm.
+_instances: Dict[Tuple[str, int], Word2Num] = {}
+
+
+def register_sqlite_function(
+    connection: sqlite3.Connection,
+    w2n: Optional[Word2Num] = None,
+    name: str = DEFAULT_FUNCTION_NAME,
+    max_cached_values: int = DEFAULT_MAX_CACHED_VALUES,
+) -> None:
+    """
+    Registers a deterministic SQL function on a SQLite connection that converts text representations of numbers,
+    so that columns can be converted in place, as in `UPDATE t SET value = word2num(text)`.
+
+    The function takes the text and optionally a language code and a fuzzy threshold:
+    `word2num(text)`, `word2num(text, 'es')` or `word2num(text, 'es', 90)`.
+    It returns an INTEGER for whole numbers, a REAL for other numbers, and NULL where the text is NULL or parsing fails.
+    Numbers are returned unchanged. Parsers for each language and threshold are created on first use and kept warm,
+    and values are remembered up to `max_cached_values` distinct calls, so repeated texts are only parsed once.
+
+    :param connection: The connection to register the function on.
+    :param w2n: The Word2Num instance for calls with only a text (default: English with the default fuzzy threshold).
+    :param name: The name of the SQL function (default: "word2num").
+    :param max_cached_values: Number of distinct calls whose values are remembered before the memo is cleared.
+    """
+    w2n = w2n or Word2Num()
+    values: Dict[tuple, Optional[Union[int, float]]] = {}
+
+    def convert(text, *options):
+        if not isinstance(text, str):
+            return text if isinstance(text, (int, float)) else None
+
+        key = (text, *options)
+        if key in values:
+            return values[key]
+
+        value = _to_sql_value(_instance(w2n, *options).parse(text))
+        if len(values) >= max_cached_values:
+            values.clear()
+        values[key] = value
+        return value
+
+    connection.create_function(name, -1, convert, deterministic=True)
+
+
+def _instance(
+    w2n: Word2Num, language_code: Optional[str] = None, fuzzy_threshold: Optional[float] = None
+) -> Word2Num:
+    """Finds the instance for a call with the given options, creating and keeping it on first use."""
+    if language_code is None and fuzzy_threshold is None:
+        return w2n
+
+    key = (language_code or "en", 80 if fuzzy_threshold is None else int(fuzzy_threshold))
+    instance = _instances.get(key)
+    if instance is None:
+        instance = _instances[key] = Word2Num(language_code=key[0], fuzzy_threshold=key[1])
+    return instance
+
+
+def _to_sql_value(value: Optional[float]) -> Optional[Union[int, float]]:
+    """Converts a parsed value to an INTEGER if it is a whole number SQLite can store as one, or else leaves it a REAL."""
+    if value is not None and value % 1 == 0 and abs(value) < INTEGER_LIMIT:
+        return int(value)
+    return value
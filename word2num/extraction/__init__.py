@@ -0,0 +1,2 @@
+from .files import extract_numbers, extract_numbers_from_file
+from .phrases import PhraseFinder
@@ -0,0 +1,109 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Iterator, List, Optional, Tuple, Union
+
+from word2num.word2num import Word2Num
+from .phrases import BREAK_PATTERN, Extraction, PhraseFinder
+
+# Approximate size of the chunks a file is scanned in, in bytes.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Number of chunks each worker process may have queued, which bounds the results held in memory.
+CHUNKS_PER_PROCESS = 2
+
+
+def extract_numbers(data: bytes, w2n: Optional[Word2Num] = None) -> List[Extraction]:
+    """
+    Finds and parses every number phrase in UTF-8 text.
+
+    :param data: UTF-8 text.
+    :param w2n: The Word2Num instance to parse with (default: English with the default fuzzy threshold).
+    :return: The byte offset, length in bytes and value of each phrase, in text order.
+    """
+    return list(PhraseFinder(w2n or Word2Num()).find(data))
+
+
+def extract_numbers_from_file(
+    path: Union[str, os.PathLike],
+    w2n: Optional[Word2Num] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Extraction]:
+    """
+    Finds and parses every number phrase in a UTF-8 text file, such as a transcript or a log.
+
+    The file is memory-mapped and scanned in chunks of about `chunk_size` bytes, which end just after a byte that
+    can't be part of a phrase, such as a line break, so no phrase is split between chunks. Results are streamed in
+    file order while later chunks are scanned, holding the results of at most a few chunks per process in memory.
+    A chunk only ends where a phrase can't continue, so a file without line breaks or punctuation is scanned whole.
+
+    :param path: Path of the file.
+    :param w2n: The Word2Num instance to parse with (default: English with the default fuzzy threshold).
+    :param processes: Number of worker processes to scan chunks in (default: scan in the current process).
+    :param chunk_size: Approximate size of the chunks in bytes (default: 8 MiB).
+    :return: The byte offset, length in bytes and value of each phrase, in file order.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+
+    w2n = w2n or Word2Num()
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            chunks = _chunks(data, chunk_size)
+            if processes and processes > 1:
+                yield from _scan_in_processes(os.fspath(path), w2n, chunks, processes)
+            else:
+                finder = PhraseFinder(w2n)
+                for start, end in chunks:
+                    yield from finder.find(data, start, end)
+
+
+def _chunks(data: mmap.mmap, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """Splits the data into chunks of about the given size that end just after a byte which can't be part of a phrase."""
+    start = 0
+    size = len(data)
+    while start < size:
+        break_match = BREAK_PATTERN.search(data, min(start + chunk_size, size) - 1)
+        end = break_match.end() if break_match else size
+        yield start, end
+        start = end
+
+
+def _scan_in_processes(
+    path: str, w2n: Word2Num, chunks: Iterator[Tuple[int, int]], processes: int
+) -> Iterator[Extraction]:
+    """Scans the chunks of a file in worker processes that each map the file, yielding their results in file order."""
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_initialize_worker,
+        initargs=(path, w2n),
+    ) as executor:
+        pending: Deque = deque()
+        for start, end in chunks:
+            pending.append(executor.submit(_scan_in_worker, start, end))
+            if len(pending) >= processes * CHUNKS_PER_PROCESS:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+_worker_data: Optional[mmap.mmap] = None
+_worker_finder: Optional[PhraseFinder] = None
+
+
+def _initialize_worker(path: str, w2n: Word2Num) -> None:
+    """Maps the file and creates the phrase finder that a worker process scans with."""
+    global _worker_data, _worker_finder
+    with open(path, "rb") as file:
+        _worker_data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker_finder = PhraseFinder(w2n)
+
+
+def _scan_in_worker(start: int, end: int) -> List[Extraction]:
+    """Scans one chunk of the file in a worker process."""
+    return list(_worker_finder.find(_worker_data, start, end))
@@ -0,0 +1,153 @@
+import re
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from word2num.word2num import Word2Num
+
+# Words in UTF-8: ASCII letters and the accented letters of Latin-1 (À-Ö, Ø-ö, ø-ÿ, encoded as 0xC3 and a second byte),
+# and numerals with a leading minus sign unless it joins two words, like SimpleTokenizer's tokens.
+TOKEN_PATTERN = re.compile(
+    rb"(?:(?<![A-Za-z0-9_\x80-\xff])-)?\d+(?:[.,]\d+)*|(?:[A-Za-z]|\xc3[\x80-\x96\x98-\xb6\xb8-\xbf])+"
+)
+
+# Bytes that may separate the words of one phrase, as in "twenty-three" or "one hundred".
+GAP_PATTERN = re.compile(rb"[ \t-]*")
+
+# Bytes that never appear inside a phrase, so text can be split after them without splitting a phrase.
+BREAK_PATTERN = re.compile(rb"[^A-Za-z0-9 \t\-.,\x80-\xff]")
+
+# Number of phrase values remembered before the memo is cleared.
+MAX_REMEMBERED_PHRASES = 8192
+
+# Marks phrases whose value isn't remembered.
+_UNKNOWN = object()
+
+# A number phrase found in text: its byte offset, its length in bytes and its value.
+Extraction = Tuple[int, int, float]
+
+
+class PhraseFinder:
+    """
+    Finds number phrases in UTF-8 text and parses them.
+
+    A phrase is a run of numerals and correctly spelled number words of the instance's languages, separated only by
+    spaces, tabs or hyphens, without any filler words such as "and" at either end. Misspelled words end a phrase,
+    since in running text they are far more often ordinary words ("to", "for") than misspelled numbers.
+    Numerals only combine with units, so a numeral next to another numeral or whole number word starts a new phrase,
+    as in dates ("2024 10 19") and ranges ("5 - 3"), except after a decimal separator ("three point 1 4").
+    Phrases that can't be parsed are skipped.
+
+    The values of a bounded number of recent phrases are remembered, since phrases repeat a lot in transcripts and logs.
+    The memo is only ever replaced or extended with values that are the same for every thread,
+    so the finder is safe to share between threads.
+    """
+
+    def __init__(self, w2n: Word2Num):
+        """
+        :param w2n: The Word2Num instance to parse phrases with.
+        """
+        self.w2n = w2n
+        parsers = (
+            [exact for exact, _ in w2n.converters.values()]
+            if w2n.language_detector
+            else [w2n.exact_converter]
+        )
+
+        # Words that may be part of a phrase, and the filler words among them, which a phrase can't start with
+        # or (with negative signifiers and indefinite articles) end with.
+        self.words: Set[str] = set()
+        self.leading_fillers: Set[str] = set()
+        self.trailing_fillers: Set[str] = set()
+        # Units, the other whole number words, which can't be next to a numeral, and the decimal separators.
+        self.units: Set[str] = set()
+        self.non_unit_words: Set[str] = set()
+        self.decimal_separators: Set[str] = set()
+        for parser in parsers:
+            prefilter = parser.matcher.prefilter
+            vocabulary = parser.matcher.vocabulary
+            fillers = {
+                *parser.ignored_words,
+                *vocabulary.decimal_separators,
+                *vocabulary.fraction_separators,
+            }
+            self.words |= prefilter.words | fillers
+            # Denominators may be plural, as in "three quarters".
+            self.words |= {
+                form
+                for word in prefilter.denominator_words
+                for form in (word, word + "s")
+            }
+            self.units |= vocabulary.units.keys()
+            self.non_unit_words |= vocabulary.whole_numbers.keys() - vocabulary.units.keys()
+            self.decimal_separators |= set(vocabulary.decimal_separators)
+            self.leading_fillers |= fillers
+            self.trailing_fillers |= {
+                *fillers,
+                *vocabulary.negative_signifiers,
+                *vocabulary.indefinite_articles,
+            }
+
+        self._values: Dict[bytes, Optional[float]] = {}
+
+    def find(self, data: bytes, start: int = 0, end: Optional[int] = None) -> Iterator[Extraction]:
+        """
+        Finds and parses the number phrases in a region of UTF-8 text.
+
+        :param data: UTF-8 text, such as bytes or a memory-mapped file.
+        :param start: Offset where the region starts, which must not be inside a phrase (default: the start of the text).
+        :param end: Offset where the region ends, which must not be inside a phrase (default: the end of the text).
+        :return: The byte offset, length in bytes and value of each phrase, in text order.
+        """
+        end = len(data) if end is None else end
+        run: List[Tuple[int, int, str]] = []
+        # Whether the last numeral or whole number word of the run was a numeral or a word that isn't a unit,
+        # and whether the run has a decimal separator.
+        after_numeral = after_non_unit_word = after_decimal_separator = False
+
+        for token_match in TOKEN_PATTERN.finditer(data, start, end):
+            token_start, token_end = token_match.span()
+            token = token_match.group().decode("utf-8").lower()
+            is_numeral = token.lstrip("-")[:1].isdecimal()
+            is_non_unit_word = token in self.non_unit_words
+            # Numerals only combine with units, except after a decimal separator.
+            is_beside_numeral = not after_decimal_separator and (
+                is_numeral and (after_numeral or after_non_unit_word) or is_non_unit_word and after_numeral
+            )
+
+            if run and (
+                not GAP_PATTERN.fullmatch(data, run[-1][1], token_start)
+                or not (is_numeral or token in self.words)
+                or is_beside_numeral
+            ):
+                yield from self._parse_run(data, run)
+                run = []
+                after_numeral = after_non_unit_word = after_decimal_separator = False
+
+            if is_numeral or token in self.words:
+                run.append((token_start, token_end, token))
+                if is_numeral or is_non_unit_word or token in self.units:
+                    after_numeral, after_non_unit_word = is_numeral, is_non_unit_word
+                after_decimal_separator = after_decimal_separator or token in self.decimal_separators
+
+        yield from self._parse_run(data, run)
+
+    def _parse_run(self, data: bytes, run: List[Tuple[int, int, str]]) -> Iterator[Extraction]:
+        """Parses a run of number words, without its leading and trailing filler words."""
+        first, last = 0, len(run) - 1
+        while first <= last and run[first][2] in self.leading_fillers:
+            first += 1
+        while last >= first and run[last][2] in self.trailing_fillers:
+            last -= 1
+        if first > last:
+            return
+
+        start, end = run[first][0], run[last][1]
+        phrase = data[start:end]
+        value = self._values.get(phrase, _UNKNOWN)
+        if value is _UNKNOWN:
+            value = self.w2n.parse_tokens([token for _, _, token in run[first : last + 1]])
+            if len(self._values) >= MAX_REMEMBERED_PHRASES:
+                self._values: Dict[bytes, Optional[float]] = {}
+            self._values[phrase] = value
+
+        if value is not None:
+            yield start, end - start, value
@@ -0,0 +1,7 @@
+from .en import EnglishParser
+from .es import SpanishParser
+
+parsers = {
+    "en": EnglishParser,
+    "es": SpanishParser,
+}
@@ -0,0 +1,156 @@
+import copy
+from typing import Dict, List, Optional, Tuple
+
+from word2num.tokenization import SimpleTokenizer
+from word2num.word_matching.scorers import Scorer
+from word2num.word_matching.word_matcher import WordMatcher
+
+
+class LanguageDetector:
+    """
+    Picks the language of a number phrase by classifying each of its tokens once
+    against a merged index of the vocabularies of several languages.
+
+    A language is picked by comparing, in order:
+
+    1. The number of tokens that are exactly a word of the language's vocabulary.
+    2. The total fuzzy score of the remaining tokens' best matches in the language's vocabulary,
+       counting only matches that reach the fuzzy threshold.
+    3. The order in which the languages were given, earlier languages winning ties.
+
+    Numerals don't count towards any language, but a phrase of numerals alone, such as "42", is given the first language.
+
+    So "once" is Spanish (an exact match for "once", eleven) even though it is a close fuzzy match for the English "one".
+
+    Fuzzy scores are calculated by the same scorer as the matchers', with the same length bounds and cutoff,
+    so that budgets and traces that wrap a scorer see the comparisons of detection too.
+
+    The detector only reads its index after it has been built, so it is safe to share between threads.
+    """
+
+    def __init__(self, matchers: Dict[str, WordMatcher], fuzzy_threshold: float, scorer: Optional[Scorer] = None):
+        """
+        :param matchers: Word matchers of each candidate language, keyed by language code, in order of preference.
+        :param fuzzy_threshold: The minimum fuzzy score for a token to count towards a language.
+        :param scorer: The fuzzy scorer (default: the scorer of the first language's matcher).
+        """
+        self.matchers = matchers
+        self.language_codes = list(matchers)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.scorer = scorer or next(iter(matchers.values())).scorer
+
+        # Every word of every vocabulary, including denominator forms, mapped to the languages it belongs to.
+        self.index: Dict[str, Tuple[str, ...]] = {}
+        for language_code, matcher in matchers.items():
+            prefilter = matcher.prefilter
+            for word in prefilter.words | prefilter.denominator_words:
+                self.index[word] = self.index.get(word, ()) + (language_code,)
+
+        self._fuzzy_candidates: List[Tuple[str, Tuple[str, ...]]] = sorted(self.index.items())
+
+    def extended(self, language_code: str, matcher: WordMatcher) -> "LanguageDetector":
+        """
+        Creates a copy of the detector in which one language's matcher is replaced by a matcher of an extended vocabulary,
+        such as one made by `WordMatcher.extended`. Only the words that the new matcher adds are indexed.
+
+        :param language_code: Code of the language whose vocabulary was extended.
+        :param matcher: The language's new word matcher.
+        :return: The extended detector.
+        """
+        old_prefilter = self.matchers[language_code].prefilter
+        prefilter = matcher.prefilter
+        added_words = (prefilter.words | prefilter.denominator_words) - (
+            old_prefilter.words | old_prefilter.denominator_words
+        )
+
+        detector = copy.copy(self)
+        detector.matchers = {**self.matchers, language_code: matcher}
+        detector.index = dict(self.index)
+        for word in added_words:
+            detector.index[word] = detector.index.get(word, ()) + (language_code,)
+        detector._fuzzy_candidates = sorted(detector.index.items())
+        return detector
+
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Picks the language of the given text representation of a number.
+
+        :param text: A text representation of a number.
+        :return: The code of the detected language, or None if no token matches any language.
+        """
+        return self.detect_words(SimpleTokenizer().tokenize(text))
+
+    def detect_words(self, words: List[str]) -> Optional[str]:
+        """
+        Picks the language of the given words of a number phrase.
+
+        :param words: Tokenized, lowercase words of a number phrase.
+        :return: The code of the detected language, or None if no word matches any language.
+        """
+        exact_counts = dict.fromkeys(self.language_codes, 0)
+        fuzzy_scores = dict.fromkeys(self.language_codes, 0)
+        has_numerals = False
+
+        for word in words:
+            if word.lstrip("-")[:1].isdecimal():
+                has_numerals = True
+                continue
+
+            languages = self.index.get(word)
+            if languages:
+                for language_code in languages:
+                    exact_counts[language_code] += 1
+            elif self.fuzzy_threshold < 100:
+                for language_code, score in self._best_fuzzy_scores(word).items():
+                    fuzzy_scores[language_code] += score
+
+        best_language = max(
+            self.language_codes,
+            key=lambda code: (
+                exact_counts[code],
+                fuzzy_scores[code],
+                -self.language_codes.index(code),
+            ),
+        )
+
+        if not exact_counts[best_language] and not fuzzy_scores[best_language]:
+            return best_language if has_numerals else None
+        return best_language
+
+    def _best_fuzzy_scores(self, word: str) -> Dict[str, int]:
+        """
+        Finds the word's best fuzzy score in each language where it reaches the threshold.
+        A word that only sounds like a word of a language with phonetic matching scores the threshold in that language.
+        """
+        if not any(
+            matcher.prefilter.may_match(word) for matcher in self.matchers.values()
+        ):
+            return self._phonetic_scores(word)
+
+        best_scores: Dict[str, int] = {}
+        score = self.scorer.score
+        word_length = len(word)
+        # Scores below the threshold don't count, so they are cut off, and candidates whose length rules out
+        # reaching the threshold are skipped, as in the matcher's fuzzy match.
+        cutoff = max(self.fuzzy_threshold, 1)
+        for candidate, languages in self._fuzzy_candidates:
+            candidate_length = len(candidate)
+            shorter_length = candidate_length if candidate_length < word_length else word_length
+            if 200 * shorter_length < (cutoff - 1) * (word_length + candidate_length):
+                continue
+            candidate_score = score(word, candidate, cutoff)
+            if candidate_score < self.fuzzy_threshold:
+                continue
+            for language_code in languages:
+                if candidate_score > best_scores.get(language_code, 0):
+                    best_scores[language_code] = candidate_score
+
+        return best_scores or self._phonetic_scores(word)
+
+    def _phonetic_scores(self, word: str) -> Dict[str, int]:
+        """Scores the word at the threshold in each language with phonetic matching where it sounds like a word."""
+        return {
+            language_code: self.fuzzy_threshold
+            for language_code, matcher in self.matchers.items()
+            if matcher.may_match_phonetically(word)
+        }
@@ -1,19 +1,28 @@
-from typing import List, Optional
+from typing import Optional
 
 from word2num.languages.en.word_matcher import EnglishWordMatcher
 from word2num.parsing.standard_parser import StandardParser
+from word2num.word_matching.aliases import AliasTable
+from word2num.word_matching.score_cache import RankedScoreCache
+from word2num.word_matching.scorers import Scorer
+from word2num.word_matching.vocabulary import Vocabulary
 
 
 class EnglishParser(StandardParser):
     """Converts English-language text representations of numbers to numerical values."""
 
-    def __init__(self, fuzzy_threshold: float):
-        super().__init__(EnglishWordMatcher(fuzzy_threshold))
+    # Skip the "and" in numbers like "one hundred and five"
+    ignored_words = ("and",)
 
-    def _parse_whole_number(self, words: List[str]) -> Optional[float]:
-        if not words:
-            return 0
-
-        # Skip the "and" in numbers like "one hundred and five"
-        words = [word for word in words if word != "and"]
-        return super()._parse_whole_number(words)
+    def __init__(
+        self,
+        fuzzy_threshold: float,
+        vocabulary: Optional[Vocabulary] = None,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
+        super().__init__(
+            EnglishWordMatcher(fuzzy_threshold, vocabulary, scorer, phonetic, score_cache, aliases)
+        )
@@ -0,0 +1,92 @@
+VOWELS = ("a", "e", "i", "o", "u")
+
+# Initial letter pairs whose first letter is silent, as in "knight" or "wrong".
+SILENT_INITIAL_PAIRS = ("kn", "gn", "pn", "wr", "ae")
+
+# Letters that sound the same on their own.
+SIMPLE_SOUNDS = {
+    "f": "F", "j": "J", "l": "L", "m": "M", "n": "N", "r": "R",
+    "q": "K", "v": "F", "x": "KS", "z": "S",
+}
+
+
+def english_phonetic_key(word: str) -> str:
+    """
+    Calculates a Metaphone-style key of an English word, so that words which sound alike,
+    such as "for" and "four" or "ate" and "eight", have the same key.
+
+    Like Metaphone, the key keeps the consonant sounds and drops vowels, except that a word starting with a vowel
+    sound gets a leading "A". Unlike Metaphone, a "w" that doesn't start the word is silent, as in "two".
+
+    :param word: Lowercase word.
+    :return: The key, or an empty string if the word has no letters.
+    """
+    word = "".join(character for character in word if "a" <= character <= "z")
+    if word[:2] in SILENT_INITIAL_PAIRS:
+        word = word[1:]
+    elif word[:1] == "x":
+        word = "s" + word[1:]
+    elif word[:2] == "wh":
+        word = "w" + word[2:]
+    elif word[:1] == "w" and word[1:2] in VOWELS:
+        # A "w" before a vowel starts with a vowel sound, as in "won" and "one".
+        word = word[1:]
+
+    key = []
+    for i, character in enumerate(word):
+        previous = word[i - 1] if i else ""
+        following = word[i + 1 : i + 2]
+        if character == previous and character != "c":
+            continue
+
+        if character in VOWELS:
+            sound = "A" if i == 0 else ""
+        elif character == "b":
+            sound = "" if previous == "m" and not following else "B"
+        elif character == "c":
+            if word[i + 1 : i + 3] == "ia" or following == "h":
+                sound = "K" if previous == "s" else "X"
+            elif following in ("i", "e", "y"):
+                sound = "" if previous == "s" else "S"
+            else:
+                sound = "K"
+        elif character == "d":
+            sound = "J" if following == "g" and word[i + 2 : i + 3] in ("e", "i", "y") else "T"
+        elif character == "g":
+            if following == "h" and word[i + 2 : i + 3] not in ("", *VOWELS):
+                sound = ""
+            elif following == "n" and word[i + 2 :] in ("", "ed"):
+                sound = ""
+            elif previous == "d" and following in ("e", "i", "y"):
+                sound = ""
+            elif following in ("e", "i", "y"):
+                sound = "J"
+            else:
+                sound = "K"
+        elif character == "h":
+            sound = "H" if following in VOWELS and previous not in ("c", "g", "p", "s", "t") else ""
+        elif character == "k":
+            sound = "" if previous == "c" else "K"
+        elif character == "p":
+            sound = "F" if following == "h" else "P"
+        elif character == "s":
+            if following == "h" or word[i + 1 : i + 3] in ("io", "ia"):
+                sound = "X"
+            else:
+                sound = "S"
+        elif character == "t":
+            if word[i + 1 : i + 3] in ("io", "ia"):
+                sound = "X"
+            elif following == "h":
+                sound = "0"
+            elif word[i + 1 : i + 3] == "ch":
+                sound = ""
+            else:
+                sound = "T"
+        elif character in ("w", "y"):
+            sound = "Y" if character == "y" and following in VOWELS else ""
+        else:
+            sound = SIMPLE_SOUNDS.get(character, "")
+        key.append(sound)
+
+    return "".join(key)
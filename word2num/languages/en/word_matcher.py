@@ -1,7 +1,17 @@
 import re
+from typing import Optional
+
+from word2num.word_matching.aliases import AliasTable
+from word2num.word_matching.score_cache import RankedScoreCache
+from word2num.word_matching.scorers import Scorer
+from word2num.word_matching.vocabulary import Vocabulary
 from word2num.word_matching.word_matcher import WordMatcher
+from .phonetic import english_phonetic_key
 from .vocabulary import EnglishVocabulary
 
+# Regular denominators are whole numbers with a "th" suffix, as in "tenth" or "tenths".
+REGULAR_DENOMINATOR_PATTERN = re.compile(r"([A-Z]+)ths?", flags=re.IGNORECASE)
+
 
 class EnglishWordMatcher(WordMatcher):
     """
@@ -9,8 +19,27 @@ class EnglishWordMatcher(WordMatcher):
     ranging from 0 to 100, where 0 means no match and 100 means an exact match.
     """
 
-    def __init__(self, fuzzy_threshold):
-        super().__init__(EnglishVocabulary(), fuzzy_threshold)
+    def __init__(
+        self,
+        fuzzy_threshold,
+        vocabulary: Optional[Vocabulary] = None,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
+        super().__init__(
+            vocabulary or EnglishVocabulary(), fuzzy_threshold, scorer, phonetic, score_cache, aliases
+        )
+
+    def phonetic_key(self, word: str) -> str:
+        """
+        Calculates the phonetic key of a word using the language's rules, which is the same for words that sound alike.
+
+        :param word: Word to calculate the key of.
+        :return: Phonetic key of the word, or an empty string if it has none.
+        """
+        return english_phonetic_key(word)
 
     def _regular_denominator_to_whole_number(self, word: str) -> str:
         """
@@ -20,12 +49,12 @@ class EnglishWordMatcher(WordMatcher):
         :param word: Regular denominator word to convert.
         :return: Whole number word equivalent of the denominator, if it exists, else None.
         """
-        pattern_match = re.match(r'([A-Z]+)ths?', word, flags=re.IGNORECASE)
+        pattern_match = REGULAR_DENOMINATOR_PATTERN.match(word)
         if not pattern_match:
             return None
 
         base_word = pattern_match.group(1)
-        return self.match(base_word, self.vocabulary.whole_numbers)
+        return self.match(base_word, self.vocabulary.whole_numbers, "whole_numbers")
 
     def _whole_number_to_regular_denominator(self, word: str) -> str:
         """
@@ -2,27 +2,42 @@ from typing import List, Optional
 
 from word2num.languages.es.word_matcher import SpanishWordMatcher
 from word2num.parsing.standard_parser import StandardParser
+from word2num.word_matching.aliases import AliasTable
+from word2num.word_matching.score_cache import RankedScoreCache
+from word2num.word_matching.scorers import Scorer
+from word2num.word_matching.vocabulary import Vocabulary
 
 
 class SpanishParser(StandardParser):
     """Converts Spanish-language text representations of numbers to numerical values."""
 
-    def __init__(self, fuzzy_threshold: float):
-        super().__init__(SpanishWordMatcher(fuzzy_threshold))
-
-    def _parse_whole_number(self, words: List[str]) -> Optional[float]:
-        if not words:
-            return 0
-
-        # Skip the "y" in numbers like "cinquenta y tres"
-        words = [word for word in words if word != "y"]
-        return super()._parse_whole_number(words)
+    # Skip the "y" in numbers like "cinquenta y tres"
+    ignored_words = ("y",)
+
+    # Numerals like "1.234,5" use a decimal comma and group thousands with periods
+    decimal_mark = ","
+    grouping_mark = "."
+
+    def __init__(
+        self,
+        fuzzy_threshold: float,
+        vocabulary: Optional[Vocabulary] = None,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
+        super().__init__(
+            SpanishWordMatcher(fuzzy_threshold, vocabulary, scorer, phonetic, score_cache, aliases)
+        )
 
     def _find_and_remove_negative_signifier(self, words: List[str]) -> tuple:
-        """Checks if the given word list represents a negative number, and remove the negative signifier if it does."""
+        """
+        Checks if the given word list represents a negative number.
+        The given list is left untouched; the returned word list has the negative signifier removed if there was one.
+        """
         is_negative = self.matcher.match_negative_signifier(words[-1])
         if is_negative:
-            words.pop()
-            return is_negative, words
+            return is_negative, words[:-1]
 
         return super()._find_and_remove_negative_signifier(words)
@@ -0,0 +1,74 @@
+import unicodedata
+
+VOWELS = ("a", "e", "i", "o", "u")
+
+# Letters that sound like another letter in most Spanish accents (seseo and yeísmo included).
+SIMPLE_SOUNDS = {
+    "a": "A", "e": "E", "i": "I", "o": "O", "u": "U",
+    "b": "B", "v": "B", "w": "B", "d": "D", "f": "F", "j": "J", "k": "K",
+    "l": "L", "m": "M", "n": "N", "p": "P", "r": "R", "s": "S", "z": "S", "t": "T",
+    "x": "KS", "ñ": "NY",
+}
+
+
+def spanish_phonetic_key(word: str) -> str:
+    """
+    Calculates a phonetic key of a Spanish word, so that words which sound alike,
+    such as "sinco" and "cinco" or "beinte" and "veinte", have the same key.
+
+    Spanish spelling is close to its pronunciation, so the key keeps the vowels and only merges letters that
+    sound the same: "b" and "v", "c", "s" and "z" (seseo), "c", "k" and "qu", "g" and "j" before "e" and "i",
+    "ll" and "y" (yeísmo), and "r" and "rr". A silent "h" is dropped, and accents are ignored.
+
+    :param word: Lowercase word.
+    :return: The key, or an empty string if the word has no letters.
+    """
+    # Remove accents, but keep "ñ", and double the "ü" of "güe" and "güi", which is pronounced,
+    # so that it isn't taken for the silent "u" of "gue" and "gui".
+    word = word.replace("ñ", "\0").replace("gü", "guu")
+    word = unicodedata.normalize("NFKD", word)
+    word = "".join(
+        character for character in word if "a" <= character <= "z" or character == "\0"
+    ).replace("\0", "ñ")
+
+    key = []
+    i = 0
+    while i < len(word):
+        character = word[i]
+        following = word[i + 1 : i + 2]
+        step = 1
+
+        if character == "c":
+            if following == "h":
+                sound, step = "CH", 2
+            elif following in ("e", "i"):
+                sound = "S"
+            else:
+                sound = "K"
+        elif character == "q":
+            # "qu" is always followed by "e" or "i", and its "u" is silent.
+            sound, step = ("K", 2) if following == "u" else ("K", 1)
+        elif character == "g":
+            if following in ("e", "i"):
+                sound = "J"
+            elif following == "u" and word[i + 2 : i + 3] in ("e", "i"):
+                sound, step = "G", 2
+            else:
+                sound = "G"
+        elif character == "h":
+            sound = ""
+        elif character == "l" and following == "l":
+            sound, step = "Y", 2
+        elif character == "y":
+            # A "y" that isn't followed by a vowel is pronounced as the vowel "i", as in "y" and "hoy".
+            sound = "Y" if following in VOWELS else "I"
+        elif character == "r" and following == "r":
+            sound, step = "R", 2
+        else:
+            sound = SIMPLE_SOUNDS.get(character, "")
+
+        if not key or sound != key[-1]:
+            key.append(sound)
+        i += step
+
+    return "".join(key)
@@ -0,0 +1,236 @@
+import argparse
+import hashlib
+import json
+import mmap
+import struct
+from typing import Any, Dict, List, Optional
+
+from word2num.languages import parsers
+from word2num.parsing.standard_parser import StandardParser
+from word2num.version import __version__
+from word2num.word_matching.aliases import AliasTable
+from word2num.word_matching.prefilter import VocabularyPrefilter
+from word2num.word_matching.score_cache import RankedScoreCache
+from word2num.word_matching.scorers import Scorer
+from word2num.word_matching.vocabulary_snapshot import VocabularySnapshot
+
+PACK_MAGIC = b"W2NPACK\x00"
+PACK_FORMAT_VERSION = 1
+
+# Magic bytes, format version and header length, followed by the JSON header and then the JSON payload.
+_PREAMBLE = struct.Struct("<8sII")
+
+
+class LanguagePackError(ValueError):
+    """Raised when a language pack is corrupt or was compiled by a different version of word2num."""
+
+
+class LanguagePack:
+    """
+    A compiled language: a snapshot of its vocabulary together with the indexes derived from it,
+    so that parsers can be created without building those indexes again.
+
+    Packs are saved as a small binary file: a fixed preamble with magic bytes and the format version,
+    a JSON header recording the library version and a SHA-256 digest of the payload, and the JSON payload itself.
+    Loading memory-maps the file and checks the preamble, versions and digest before decoding the payload.
+    """
+
+    def __init__(
+        self,
+        language_code: str,
+        vocabulary: VocabularySnapshot,
+        denominator_forms: Dict[str, str],
+        units_by_value: List[str],
+        prefilter_index: Dict[str, Any],
+    ):
+        """
+        :param language_code: Code of the language the pack was compiled from.
+        :param vocabulary: Snapshot of the language's vocabulary.
+        :param denominator_forms: Dictionary that maps each whole number word to its denominator form.
+        :param units_by_value: Unit words sorted in decreasing order of their numerical value.
+        :param prefilter_index: The vocabulary prefilter's index, as returned by `VocabularyPrefilter.to_dict`.
+        """
+        self.language_code = language_code
+        self.vocabulary = vocabulary
+        self.denominator_forms = denominator_forms
+        self.units_by_value = units_by_value
+        self.prefilter_index = prefilter_index
+
+    @classmethod
+    def compile(cls, language_code: str) -> "LanguagePack":
+        """
+        Compiles a supported language into a language pack.
+
+        :param language_code: Code of the language to compile.
+        :return: The compiled language pack.
+        """
+        if language_code not in parsers:
+            raise ValueError(f"Unsupported language: {language_code}")
+
+        matcher = parsers[language_code](fuzzy_threshold=100).matcher
+        return cls(
+            language_code=language_code,
+            vocabulary=VocabularySnapshot.of(matcher.vocabulary),
+            denominator_forms=matcher.denominator_forms,
+            units_by_value=matcher.units_by_value,
+            prefilter_index=matcher.prefilter.to_dict(),
+        )
+
+    def create_parser(
+        self,
+        fuzzy_threshold: float,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ) -> StandardParser:
+        """
+        Creates a parser for the pack's language that uses the pack's vocabulary and indexes.
+
+        :param fuzzy_threshold: The minimum score for fuzzy string matching.
+        :param scorer: The fuzzy scorer of the parser (default: thefuzz).
+        :param phonetic: Whether fuzzy matching first tries the words that sound alike (default: False).
+        :param score_cache: Cache of ranked fuzzy scores to look scores up in (default: no cache).
+        :param aliases: Table that learns and looks up frequent misspellings (default: no aliases).
+        :return: A parser of the pack's language.
+        """
+        parser = parsers[self.language_code](
+            fuzzy_threshold,
+            vocabulary=self.vocabulary,
+            scorer=scorer,
+            phonetic=phonetic,
+            score_cache=score_cache,
+            aliases=aliases,
+        )
+        parser.matcher.restore_indexes(
+            self.denominator_forms,
+            self.units_by_value,
+            VocabularyPrefilter.from_dict(self.prefilter_index, fuzzy_threshold),
+        )
+        return parser
+
+    def to_bytes(self) -> bytes:
+        """Serializes the language pack."""
+        payload = json.dumps(
+            {
+                "vocabulary": self.vocabulary.to_dict(),
+                "denominator_forms": self.denominator_forms,
+                "units_by_value": self.units_by_value,
+                "prefilter": self.prefilter_index,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        header = json.dumps(
+            {
+                "library_version": __version__,
+                "language_code": self.language_code,
+                "payload_length": len(payload),
+                "payload_sha256": hashlib.sha256(payload).hexdigest(),
+            }
+        ).encode("utf-8")
+
+        return _PREAMBLE.pack(PACK_MAGIC, PACK_FORMAT_VERSION, len(header)) + header + payload
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> "LanguagePack":
+        """
+        Deserializes a language pack, checking its integrity and that it was compiled by this version of word2num.
+
+        :param data: The serialized language pack, as bytes or any other buffer such as a memory map.
+        :return: The language pack.
+        """
+        with memoryview(data) as view:
+            if len(view) < _PREAMBLE.size:
+                raise LanguagePackError("Language pack is truncated")
+
+            magic, format_version, header_length = _PREAMBLE.unpack_from(view)
+            header_end = _PREAMBLE.size + header_length
+            header_bytes = bytes(view[_PREAMBLE.size:header_end])
+            payload = bytes(view[header_end:])
+
+        if magic != PACK_MAGIC:
+            raise LanguagePackError("Not a language pack")
+        if format_version != PACK_FORMAT_VERSION:
+            raise LanguagePackError(
+                f"Unsupported language pack format version {format_version}, expected {PACK_FORMAT_VERSION}"
+            )
+
+        try:
+            header = json.loads(header_bytes)
+        except ValueError as error:
+            raise LanguagePackError("Language pack header is corrupt") from error
+
+        if header.get("library_version") != __version__:
+            raise LanguagePackError(
+                f"Language pack was compiled by word2num {header.get('library_version')}, not {__version__}"
+            )
+
+        if (
+            len(payload) != header.get("payload_length")
+            or hashlib.sha256(payload).hexdigest() != header.get("payload_sha256")
+        ):
+            raise LanguagePackError("Language pack payload is corrupt")
+
+        contents = json.loads(payload)
+        return cls(
+            language_code=header["language_code"],
+            vocabulary=VocabularySnapshot(contents["vocabulary"]),
+            denominator_forms=contents["denominator_forms"],
+            units_by_value=contents["units_by_value"],
+            prefilter_index=contents["prefilter"],
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Saves the language pack to a file.
+
+        :param path: Path of the file to write.
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "LanguagePack":
+        """
+        Loads a language pack from a file by memory-mapping it.
+
+        :param path: Path of the language pack file.
+        :return: The language pack.
+        """
+        with open(path, "rb") as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                raise LanguagePackError("Language pack is empty") from error
+
+        with data:
+            return cls.from_bytes(data)
+
+
+def compile_language_pack(language_code: str, path: str) -> LanguagePack:
+    """
+    Compiles a supported language and saves it as a language pack file.
+
+    :param language_code: Code of the language to compile.
+    :param path: Path of the file to write.
+    :return: The compiled language pack.
+    """
+    language_pack = LanguagePack.compile(language_code)
+    language_pack.save(path)
+    return language_pack
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(
+        description="Compiles a language into a language pack file for fast parser creation."
+    )
+    argument_parser.add_argument("language_code", choices=sorted(parsers))
+    argument_parser.add_argument("path")
+    arguments = argument_parser.parse_args()
+
+    compile_language_pack(arguments.language_code, arguments.path)
+
+
+if __name__ == "__main__":
+    main()
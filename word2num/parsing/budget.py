@@ -0,0 +1,144 @@
+import copy
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+from word2num.languages.detection import LanguageDetector
+from word2num.parsing.standard_parser import StandardParser
+from word2num.word_matching.scorers import Scorer
+
+
+@dataclass(frozen=True)
+class ParseBudget:
+    """
+    Limits on the work a single parse may do, so that very long or adversarial phrases can't
+    run an unbounded number of fuzzy comparisons. Limits that are None are not enforced.
+    """
+
+    # Maximum number of words in a phrase.
+    max_tokens: Optional[int] = None
+    # Maximum number of fuzzy comparisons, across the exact and fuzzy parsing passes.
+    max_fuzzy_comparisons: Optional[int] = None
+    # Maximum wall-clock time of the parse in seconds.
+    timeout: Optional[float] = None
+
+    def start(self) -> "BudgetMeter":
+        """Starts measuring a parse against the budget."""
+        return BudgetMeter(self)
+
+
+class ParseBudgetExceeded(Exception):
+    """Raised when a parse exceeds one of the limits of its budget."""
+
+    def __init__(self, limit: str, message: str):
+        """
+        :param limit: Name of the exceeded limit: "max_tokens", "max_fuzzy_comparisons" or "timeout".
+        :param message: Description of the error.
+        """
+        super().__init__(message)
+        self.limit = limit
+
+
+class BudgetMeter:
+    """
+    Measures the work of one parse against a budget, raising ParseBudgetExceeded as soon as a limit is exceeded.
+
+    Limits are enforced by metered copies of the parsers and the language detector, whose scorers count fuzzy comparisons
+    and check the deadline before each one, and whose parsers check it before each split on a unit, so the parsers
+    themselves are never modified and parsing without a budget has no overhead.
+    """
+
+    def __init__(self, budget: ParseBudget):
+        """
+        :param budget: The budget to measure against.
+        """
+        self.budget = budget
+        self.fuzzy_comparisons = 0
+        self._deadline = (
+            perf_counter() + budget.timeout if budget.timeout is not None else None
+        )
+
+    def check_tokens(self, words: Sequence[str]) -> None:
+        """Checks that a phrase doesn't have more words than the budget allows."""
+        max_tokens = self.budget.max_tokens
+        if max_tokens is not None and len(words) > max_tokens:
+            raise ParseBudgetExceeded(
+                "max_tokens", f"Phrase has {len(words)} words, more than {max_tokens}"
+            )
+
+    def check_deadline(self) -> None:
+        """Checks that the budget's deadline hasn't passed."""
+        if self._deadline is not None and perf_counter() > self._deadline:
+            raise ParseBudgetExceeded(
+                "timeout", f"Parsing took longer than {self.budget.timeout} seconds"
+            )
+
+    def count_fuzzy_comparison(self) -> None:
+        """Counts a fuzzy comparison against the budget."""
+        self.fuzzy_comparisons += 1
+        max_fuzzy_comparisons = self.budget.max_fuzzy_comparisons
+        if (
+            max_fuzzy_comparisons is not None
+            and self.fuzzy_comparisons > max_fuzzy_comparisons
+        ):
+            raise ParseBudgetExceeded(
+                "max_fuzzy_comparisons",
+                f"Parsing needed more than {max_fuzzy_comparisons} fuzzy comparisons",
+            )
+        self.check_deadline()
+
+    def metered(self, parser: StandardParser) -> StandardParser:
+        """
+        Creates a copy of the given parser that enforces the budget.
+
+        :param parser: The parser to meter.
+        :return: A metered copy of the parser.
+        """
+        matcher = copy.copy(parser.matcher)
+        matcher.scorer = _MeteredScorer(matcher.scorer, self)
+
+        metered_parser = copy.copy(parser)
+        metered_parser.matcher = matcher
+        metered_parser.parse_tokens = self._metered_parse_tokens(metered_parser.parse_tokens)
+        metered_parser._find_largest_unit = self._metered_split(
+            metered_parser._find_largest_unit
+        )
+        return metered_parser
+
+    def metered_detector(self, detector: LanguageDetector) -> LanguageDetector:
+        """
+        Creates a copy of the given language detector whose fuzzy comparisons count against the budget.
+
+        :param detector: The detector to meter.
+        :return: A metered copy of the detector.
+        """
+        metered_detector = copy.copy(detector)
+        metered_detector.scorer = _MeteredScorer(detector.scorer, self)
+        return metered_detector
+
+    def _metered_parse_tokens(self, parse_tokens: Callable) -> Callable:
+        def metered_parse_tokens(words: Sequence[str]):
+            self.check_tokens(words)
+            self.check_deadline()
+            return parse_tokens(words)
+
+        return metered_parse_tokens
+
+    def _metered_split(self, find_largest_unit: Callable) -> Callable:
+        def metered_find_largest_unit(words, units=None):
+            self.check_deadline()
+            return find_largest_unit(words, units)
+
+        return metered_find_largest_unit
+
+
+class _MeteredScorer(Scorer):
+    """Counts every comparison of a scorer against a budget before making it."""
+
+    def __init__(self, scorer: Scorer, meter: BudgetMeter):
+        self.scorer = scorer
+        self.meter = meter
+
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        self.meter.count_fuzzy_comparison()
+        return self.scorer.score(a, b, cutoff)
@@ -0,0 +1,323 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from word2num.parsing.standard_parser import StandardParser
+
+# Whole numbers below this are floats whose sums are exact, whatever order they are added in.
+_EXACT_INTEGER_LIMIT = 2 ** 53
+
+
+class _UnitGroup(NamedTuple):
+    """A completed unit group such as "two hundred", on a persistent stack of unit groups."""
+
+    value: float
+    unit: int
+    below: Optional["_UnitGroup"]
+    # The sum of the values of this group and the groups below it, added from the first group to the last.
+    total: float
+    # Whether the values of this group and the groups below it, and the total, are exact whole numbers.
+    is_exact: bool
+
+
+def _is_exact_integer(value: float) -> bool:
+    """Checks if a value is a whole number that is added exactly to others like it."""
+    return 0 <= value < _EXACT_INTEGER_LIMIT and value % 1 == 0
+
+
+class _State(NamedTuple):
+    """The accumulated state of a phrase after one of its words."""
+
+    # Whether every word so far fits the incremental grammar. Otherwise the phrase is parsed in full.
+    is_incremental: bool
+    is_negative: bool
+    has_number_words: bool
+    groups: Optional[_UnitGroup]
+    # The words after the last unit word, which are summed, or concatenated if they are all digits.
+    segment_sum: float
+    segment_digits: int
+    segment_is_digits: bool
+    segment_length: int
+    # Whether the segment is a numeral, which can only be followed by a unit word.
+    segment_is_numeral: bool
+    # Names of the unit words seen so far, keyed by their values.
+    unit_names: Tuple[Tuple[int, str], ...]
+    # The value of the words before the decimal separator, once there is one.
+    integer_part: Optional[float]
+    decimal_digits: float
+    decimal_length: int
+
+
+_INITIAL_STATE = _State(
+    is_incremental=True,
+    is_negative=False,
+    has_number_words=False,
+    groups=None,
+    segment_sum=0,
+    segment_digits=0,
+    segment_is_digits=True,
+    segment_length=0,
+    segment_is_numeral=False,
+    unit_names=(),
+    integer_part=None,
+    decimal_digits=0,
+    decimal_length=0,
+)
+
+
+class IncrementalParser:
+    """
+    Parses a number phrase one word at a time, such as the growing partial transcripts of a speech recognizer.
+
+    Each word updates an accumulated state in constant amortized time, so the current value is available after
+    every word without parsing the whole phrase again, and the last word can be retracted when the recognizer
+    revises its hypothesis. Values always match what the wrapped parsers return for the whole phrase:
+    words outside the incremental grammar (fractions, negative signifiers after the first word,
+    words that only match fuzzily) make the parser fall back to parsing the whole phrase until they are retracted.
+    Until then, each word takes as long as Word2Num.parse of the phrase so far, which grows with the length of the phrase.
+
+    Unlike parsers, an incremental parser holds the state of one phrase, so it must not be shared between threads.
+    """
+
+    def __init__(
+        self,
+        exact_parser: StandardParser,
+        fuzzy_parser: Optional[StandardParser] = None,
+    ):
+        """
+        :param exact_parser: Parser that only accepts exact matches.
+        :param fuzzy_parser: Parser used when the exact parser fails, as in Word2Num.parse (default: none).
+        """
+        self.exact_parser = exact_parser
+        self.fuzzy_parser = fuzzy_parser
+
+        vocabulary = exact_parser.matcher.vocabulary
+        self._digits = vocabulary.digits
+        self._whole_numbers = vocabulary.whole_numbers
+        self._units = vocabulary.units
+        self._negative_signifiers = frozenset(vocabulary.negative_signifiers)
+        self._decimal_separators = frozenset(vocabulary.decimal_separators)
+        self._ignored_words = frozenset(exact_parser.ignored_words)
+        # Whether each word of the incremental grammar is a denominator, which only vocabulary words are checked for.
+        self._denominator_verdicts: Dict[str, bool] = {}
+
+        self.reset()
+
+    @property
+    def words(self) -> List[str]:
+        """The words of the current phrase."""
+        return list(self._words)
+
+    @property
+    def value(self) -> Optional[float]:
+        """The value of the current phrase, or None if it can't be parsed."""
+        return self._values[-1]
+
+    def reset(self) -> None:
+        """Starts a new phrase."""
+        self._words: List[str] = []
+        self._states: List[_State] = [_INITIAL_STATE]
+        self._values: List[Optional[float]] = [None]
+
+    def push(self, word: str) -> Optional[float]:
+        """
+        Appends a word to the current phrase.
+
+        :param word: A lowercase word, as produced by the tokenizer.
+        :return: The value of the phrase including the new word, or None if it can't be parsed.
+        """
+        state = self._advance(self._states[-1], word, len(self._words))
+        self._words.append(word)
+        self._states.append(state)
+        self._values.append(self._evaluate(state))
+        return self.value
+
+    def retract(self) -> Optional[float]:
+        """
+        Removes the last word of the current phrase.
+
+        :return: The value of the phrase without its last word, or None if it can't be parsed.
+        """
+        if not self._words:
+            raise IndexError("There is no word to retract")
+
+        self._words.pop()
+        self._states.pop()
+        self._values.pop()
+        return self.value
+
+    def _advance(self, state: _State, word: str, position: int) -> _State:
+        """Returns the state after the given word, which comes at the given position of the phrase."""
+        if not state.is_incremental:
+            return state
+
+        if word in self._negative_signifiers:
+            if position == 0:
+                return state._replace(is_negative=True)
+            return state._replace(is_incremental=False)
+
+        state = state._replace(has_number_words=True)
+
+        if word[:1] == "-" or word[:1].isdecimal():
+            return self._advance_numeral(state, word, position)
+
+        if state.integer_part is not None:
+            # After the decimal separator, only digits are accumulated incrementally.
+            if word not in self._digits:
+                return state._replace(is_incremental=False)
+            return state._replace(
+                decimal_digits=state.decimal_digits * 10 + self._digits[word],
+                decimal_length=state.decimal_length + 1,
+            )
+
+        if word in self._decimal_separators:
+            return state._replace(integer_part=self._whole_value(state))
+
+        if word in self._ignored_words:
+            return state
+
+        if word in self._units:
+            return self._advance_unit(state, word)
+
+        if word in self._whole_numbers:
+            if state.segment_is_numeral:
+                return state._replace(is_incremental=False)
+            value = self._whole_numbers[word]
+            is_digit = word in self._digits
+            return state._replace(
+                segment_sum=state.segment_sum + value,
+                segment_digits=state.segment_digits * 10 + value if is_digit else 0,
+                segment_is_digits=state.segment_is_digits and is_digit,
+                segment_length=state.segment_length + 1,
+            )
+
+        return state._replace(is_incremental=False)
+
+    def _advance_numeral(self, state: _State, word: str, position: int) -> _State:
+        """Applies a numeral such as "3" or "-1.5", which counts as a whole number that only combines with units, as in "3 million"."""
+        if word.startswith("-"):
+            if position != 0:
+                return state._replace(is_incremental=False)
+            state = state._replace(is_negative=True)
+            word = word[1:]
+
+        value = self.exact_parser._parse_numeral(word)
+        if value is None or state.integer_part is not None or state.segment_length:
+            # Numerals after the decimal separator change how the decimal words are scaled, and numerals after
+            # other number words make the phrase ungrammatical, so they are parsed in full.
+            return state._replace(is_incremental=False)
+
+        return state._replace(
+            segment_sum=value,
+            segment_digits=0,
+            segment_is_digits=False,
+            segment_length=1,
+            segment_is_numeral=True,
+        )
+
+    def _advance_unit(self, state: _State, word: str) -> _State:
+        """
+        Applies a unit word to the words before it.
+        Groups of smaller units are merged into the new group, which is what the standard parser's
+        split on the largest unit amounts to. Each group is merged at most once, so this is amortized constant time.
+        """
+        unit = self._units[word]
+        unit_names = dict(state.unit_names)
+        if unit_names.get(unit, word) != word:
+            # The standard parser splits on the first name of a unit value, not the first unit word, so
+            # differently named units of the same value (such as "millón" and "millones") can't be merged in order.
+            return state._replace(is_incremental=False)
+        unit_names[unit] = word
+
+        multiplier = self._segment_value(state)
+        groups = state.groups
+        while groups is not None and groups.unit < unit:
+            multiplier += groups.value
+            groups = groups.below
+
+        value = multiplier * unit
+        if groups is None:
+            total, is_exact = value, True
+        else:
+            total, is_exact = groups.total + value, groups.is_exact
+        is_exact = is_exact and _is_exact_integer(value) and _is_exact_integer(total)
+
+        return state._replace(
+            groups=_UnitGroup(value, unit, groups, total, is_exact),
+            segment_sum=0,
+            segment_digits=0,
+            segment_is_digits=True,
+            segment_length=0,
+            segment_is_numeral=False,
+            unit_names=tuple(unit_names.items()),
+        )
+
+    @staticmethod
+    def _segment_value(state: _State) -> float:
+        """The value of the words after the last unit word."""
+        if not state.segment_is_digits:
+            return state.segment_sum
+        # Digit sequences are floats and empty segments are zero, as in the standard parser.
+        return float(state.segment_digits) if state.segment_length else 0
+
+    def _whole_value(self, state: _State) -> float:
+        """The value of the whole number words of the state."""
+        value = self._segment_value(state)
+        groups = state.groups
+        if groups is None:
+            return value
+
+        # Sums of whole numbers below 2 ** 53 are exact, so while they all are, the running total is the value.
+        total = groups.total + value
+        if groups.is_exact and _is_exact_integer(value) and _is_exact_integer(total):
+            return total
+
+        # Otherwise the groups are added from the last to the first, the order in which the standard parser adds
+        # the terms of its splits, so that floating-point rounding is the same. This takes time proportional to
+        # the number of groups, which repeated units such as "thousand thousand" add one each.
+        while groups is not None:
+            value = groups.value + value
+            groups = groups.below
+        return value
+
+    def _evaluate(self, state: _State) -> Optional[float]:
+        """
+        Calculates the value of the current phrase, the same way Word2Num.parse would.
+        The fuzzy parser's split on units depends on every misspelled word of the phrase, so it has no incremental
+        state, and a phrase that the exact parser can't parse, or parses as 0, is parsed in full by the fuzzy parser.
+        """
+        result = self._evaluate_exact(state)
+        if result or not self.fuzzy_parser:
+            return result
+
+        return self.fuzzy_parser.parse_tokens(self._words)
+
+    def _evaluate_exact(self, state: _State) -> Optional[float]:
+        """Calculates the value of the current phrase with the exact parser."""
+        if not state.is_incremental or self._ends_in_denominator(state):
+            return self.exact_parser.parse_tokens(self._words)
+
+        if not state.has_number_words:
+            return None
+
+        if state.integer_part is None:
+            result = self._whole_value(state)
+        else:
+            result = state.integer_part + float(state.decimal_digits) / (
+                10 ** state.decimal_length
+            )
+
+        return -result if state.is_negative else result
+
+    def _ends_in_denominator(self, state: _State) -> bool:
+        """
+        Checks if the phrase of an incremental state ends in a denominator, which makes it a fraction.
+        The last word fits the incremental grammar, so it is a numeral, which is never a denominator,
+        or a vocabulary word, and each vocabulary word is only checked once.
+        """
+        word = self._words[-1]
+        if state.integer_part is not None or word[:1] == "-" or word[:1].isdecimal():
+            return False
+
+        verdict = self._denominator_verdicts.get(word)
+        if verdict is None:
+            verdict = self._denominator_verdicts[word] = self.exact_parser._is_denominator(word)
+        return verdict
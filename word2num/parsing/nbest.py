@@ -0,0 +1,156 @@
+import copy
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from word2num.parsing.budget import BudgetMeter
+from word2num.parsing.standard_parser import StandardParser
+from word2num.word_matching.match_memo import MatchMemo
+
+# Confidence of a word that is exactly a vocabulary word, a numeral or a filler word.
+EXACT_CONFIDENCE = 100.0
+
+
+class Reading(NamedTuple):
+    """The reading of one hypothesis of an utterance."""
+
+    text: str
+    # The parsed value, as Word2Num.parse would return it.
+    value: Optional[float]
+    # Mean of how well each word of the hypothesis matches the word it was read as, from 0 to 100, or 0 if it has no value.
+    confidence: float
+
+
+class NBestParser:
+    """
+    Parses the alternative transcripts of one utterance, such as the n-best hypotheses of a speech recognizer,
+    which mostly share their words. Each distinct word is matched against each vocabulary category once,
+    each unit is searched for once among the same misspelled words, and each part the hypotheses are split into
+    on units is parsed once. Every hypothesis reuses those decisions, so the values are those of parsing
+    each hypothesis on its own, with less work the more words the hypotheses share.
+
+    An n-best parser holds the decisions of one call, so it is created for each call and not shared between threads.
+    """
+
+    def __init__(
+        self,
+        exact_parser: StandardParser,
+        fuzzy_parser: Optional[StandardParser],
+        converters: Optional[Dict[str, Tuple[StandardParser, Optional[StandardParser]]]] = None,
+        language_detector=None,
+        meter: Optional[BudgetMeter] = None,
+    ):
+        """
+        :param exact_parser: The parser that only accepts exact matches.
+        :param fuzzy_parser: The parser used when the exact parser fails, or None.
+        :param converters: The exact and fuzzy parsers of each language, if the language is detected.
+        :param language_detector: The detector that picks the language of each hypothesis, if the language is detected.
+        :param meter: Meter of a budget that limits the work of all hypotheses together (default: no limits).
+        """
+        self.parsers = (exact_parser, fuzzy_parser)
+        self.converters = converters
+        # Detection shares the budget of the parsers.
+        self.language_detector = meter.metered_detector(language_detector) if meter and language_detector else language_detector
+        self.meter = meter
+        # Parsers that share their decisions between hypotheses, and the readings of each language.
+        self._shared_parsers: Dict[Optional[str], Tuple[StandardParser, Optional[StandardParser]]] = {}
+        self._readings: Dict[Tuple[Optional[str], Tuple[str, ...]], Tuple[Optional[float], float]] = {}
+
+    def parse(self, hypotheses: Iterable[str]) -> List[Reading]:
+        """
+        Parses every hypothesis.
+
+        :param hypotheses: Alternative text representations of one number.
+        :return: The reading of each hypothesis, in the order they were given.
+        """
+        tokenizer = self.parsers[0].tokenizer
+        return [self.parse_tokens(text, tokenizer.tokenize(text)) for text in hypotheses]
+
+    def parse_tokens(self, text: str, tokens: Sequence[str]) -> Reading:
+        """
+        Parses one hypothesis from its tokens, reusing the decisions made for the words of earlier hypotheses.
+
+        :param text: The hypothesis, which is only returned with its reading.
+        :param tokens: Lowercase tokens of the hypothesis, as produced by SimpleTokenizer.
+        :return: The reading of the hypothesis.
+        """
+        language_code = None
+        if self.language_detector:
+            if self.meter:
+                self.meter.check_tokens(tokens)
+            language_code = self.language_detector.detect_words(tokens)
+            if language_code is None:
+                return Reading(text, None, 0.0)
+
+        # Hypotheses that only differ in case or punctuation have the same tokens, and so the same reading.
+        key = (language_code, tuple(tokens))
+        reading = self._readings.get(key)
+        if reading is None:
+            reading = self._readings[key] = self._read(language_code, tokens)
+        return Reading(text, *reading)
+
+    def _read(self, language_code: Optional[str], tokens: Sequence[str]) -> Tuple[Optional[float], float]:
+        """Parses the tokens of a hypothesis in a language, returning its value and confidence."""
+        exact_parser, fuzzy_parser = self._shared(language_code)
+        value = exact_parser.parse_tokens(tokens)
+        if value:
+            return value, EXACT_CONFIDENCE
+        if not fuzzy_parser:
+            return value, EXACT_CONFIDENCE if value is not None else 0.0
+
+        value = fuzzy_parser.parse_tokens(tokens)
+        if value is None or not tokens:
+            return value, 0.0
+
+        confidence = sum(self._confidence(fuzzy_parser, token) for token in tokens) / len(tokens)
+        return value, confidence
+
+    def _shared(self, language_code: Optional[str]) -> Tuple[StandardParser, Optional[StandardParser]]:
+        """The parsers of a language, metered if there is a budget, with a fuzzy parser that shares its decisions."""
+        parsers = self._shared_parsers.get(language_code)
+        if parsers is None:
+            exact_parser, fuzzy_parser = self.parsers if language_code is None else self.converters[language_code]
+            # Indexes built on first use are built on the parsers' own matchers, so that they outlive the copies.
+            for parser in filter(None, (exact_parser, fuzzy_parser)):
+                parser.matcher.build_indexes()
+            if self.meter:
+                # Metered parsers are copies made for this call, whose methods are bound to them, so they share in place.
+                exact_parser = self.meter.metered(exact_parser)
+                fuzzy_parser = self.meter.metered(fuzzy_parser) if fuzzy_parser else None
+            elif fuzzy_parser:
+                fuzzy_parser = copy.copy(fuzzy_parser)
+                fuzzy_parser.matcher = copy.copy(fuzzy_parser.matcher)
+            if fuzzy_parser:
+                fuzzy_parser.matcher.match_memo = MatchMemo()
+                # Hypotheses are split on the same units into the same parts, which are parsed once.
+                fuzzy_parser._parse_whole_number = _remembering_phrase(fuzzy_parser._parse_whole_number)
+            parsers = self._shared_parsers[language_code] = (exact_parser, fuzzy_parser)
+        return parsers
+
+    @staticmethod
+    def _confidence(parser: StandardParser, token: str) -> float:
+        """
+        How well a word matches the vocabulary: 100 if it is exact, the best score it was fuzzy matched with,
+        or 0 if it wasn't matched to a vocabulary word, such as a word the parse skipped.
+        """
+        matcher = parser.matcher
+        prefilter = matcher.prefilter
+        if (
+            token.lstrip("-")[:1].isdecimal()
+            or token in parser.ignored_words
+            or token in prefilter.words
+            or token in prefilter.denominator_words
+        ):
+            return EXACT_CONFIDENCE
+        return float(matcher.match_memo.best_scores.get(token, 0))
+
+
+def _remembering_phrase(method: Callable) -> Callable:
+    """Wraps a parser method of a list of words to remember its result for each sequence of words."""
+    results = {}
+
+    def remembering_method(words):
+        key = tuple(words)
+        if key not in results:
+            results[key] = method(words)
+        return results[key]
+
+    return remembering_method
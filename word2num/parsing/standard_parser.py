@@ -1,7 +1,9 @@
-from typing import List, Optional, Tuple
+import copy
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from word2num.parsing.parser import Parser
 from word2num.tokenization import SimpleTokenizer
+from word2num.word_matching.vocabulary_snapshot import VocabularySnapshot
 from word2num.word_matching.word_matcher import WordMatcher
 
 
@@ -10,12 +12,40 @@ class StandardParser(Parser):
     Converts text representations of numbers to numerical values.
     This a parser that can be used across languages that structure
     number phrases in way that is fundamentally similar to English.
+
+    Parsing never modifies the parser, its matcher or the word lists it is given,
+    so one parser can be shared by any number of threads without locking.
     """
 
+    # Whether to reject phrases the matcher's prefilter rules out before matching any words.
+    use_prefilter = True
+
+    # Filler words that are skipped inside whole numbers, such as the "and" in "one hundred and five".
+    ignored_words: Tuple[str, ...] = ()
+
+    # Tokenizer that splits text into lowercase words. It holds no state, so all parsers share it.
+    tokenizer = SimpleTokenizer()
+
+    # Marks that separate the decimal part and the groups of thousands in numerals such as "1,234.5".
+    decimal_mark = "."
+    grouping_mark = ","
+
     def __init__(self, word_matcher: WordMatcher):
         """Initializes the standard number word parser."""
         self.matcher = word_matcher
 
+    def extended(self, vocabulary: VocabularySnapshot) -> "StandardParser":
+        """
+        Creates a copy of the parser whose matcher uses a vocabulary that extends the matcher's vocabulary with extra words.
+        The parser itself is left untouched, so parses that are under way finish with the old vocabulary.
+
+        :param vocabulary: The extended vocabulary, such as one made by `VocabularySnapshot.extended`.
+        :return: A parser of the extended vocabulary.
+        """
+        parser = copy.copy(self)
+        parser.matcher = self.matcher.extended(vocabulary)
+        return parser
+
     def parse(self, text: str) -> Optional[float]:
         """
         Parses a number from the given text representation.
@@ -23,9 +53,31 @@ class StandardParser(Parser):
         :param text: A text representation of a number.
         :return: The numerical value of the text representation or None if parsing fails.
         """
-        tokenizer = SimpleTokenizer()
-        words = tokenizer.tokenize(text)
+        return self.parse_tokens(self.tokenizer.tokenize(text))
+
+    def parse_tokens(self, words: Sequence[str]) -> Optional[float]:
+        """
+        Parses a number from the words of its text representation, skipping tokenization.
+        The given sequence is never modified.
+
+        :param words: Lowercase tokens of a text representation, as produced by SimpleTokenizer.
+        :return: The numerical value of the words or None if parsing fails.
+        """
+        if not words:
+            return None
+
+        if len(words) == 1:
+            # Plain numerals such as "42" or "-3.5" are converted without matching any words.
+            value = self._parse_signed_numeral(words[0])
+            if value is not None:
+                return value
+
+        if self.use_prefilter and not self._may_be_number(words):
+            return None
+
         is_negative, words = self._find_and_remove_negative_signifier(words)
+        if not words:
+            return None
 
         if self._find_decimal_separator(words):
             result = self._parse_decimal_number(words)
@@ -37,11 +89,37 @@ class StandardParser(Parser):
 
         return -result if is_negative else result
 
-    def _find_and_remove_negative_signifier(self, words: List[str]) -> tuple:
-        """Checks if the given word list represents a negative number, and remove the negative signifier if it does."""
+    def _may_be_number(self, words: Sequence[str]) -> bool:
+        """
+        Cheaply checks if the given word list could be parsed as a number, without calculating any fuzzy scores.
+        Returns False only if a word that the parser would have to match can't match any word of the vocabulary,
+        by spelling or, if phonetic matching is enabled, by sound.
+        """
+        prefilter = self.matcher.prefilter
+        for word in words:
+            if word.lstrip("-")[:1].isdecimal():
+                # Numerals are never matched against the vocabulary.
+                continue
+            verdict = prefilter.classify(word)
+            if verdict == prefilter.DENOMINATOR:
+                # Words following a denominator may be skipped by the fraction parser, so they can't rule the phrase out.
+                return True
+            if verdict == prefilter.REJECTED and not self.matcher.may_match_phonetically(word):
+                return False
+        return True
+
+    def _find_and_remove_negative_signifier(self, words: Sequence[str]) -> tuple:
+        """
+        Checks if the given word sequence represents a negative number.
+        The given sequence is left untouched; the returned word sequence has the negative signifier removed if there was one.
+        A leading minus sign of a numeral (as in "-3 million") is a negative signifier too.
+        """
+        if words[0].startswith("-") and self._parse_numeral(words[0][1:]) is not None:
+            return True, [words[0][1:], *words[1:]]
+
         is_negative = self.matcher.match_negative_signifier(words[0])
         if is_negative:
-            words.pop(0)
+            return is_negative, words[1:]
         return is_negative, words
 
     def _parse_decimal_number(self, words: List[str]) -> Optional[float]:
@@ -52,15 +130,54 @@ class StandardParser(Parser):
         decimal_words = words[separator_index + 1 :]
 
         integer_part = self._parse_whole_number(integer_words)
-        decimal_part = self._parse_whole_number(decimal_words)
+        decimal_part = self._parse_decimal_part(decimal_words)
 
-        if None in {integer_part, decimal_part}:
+        if integer_part is None or decimal_part is None:
             return None
 
-        return integer_part + decimal_part / (10 ** len(decimal_words))
+        decimal_value, decimal_length = decimal_part
+        return integer_part + decimal_value / (10 ** decimal_length)
+
+    def _parse_decimal_part(self, words: List[str]) -> Optional[Tuple[float, int]]:
+        """
+        Parses the words after a decimal separator into their value and the number of decimal places they take.
+
+        Digits and numerals are read as one string of digits, so "three point 1 4" and "three point 14" are both 3.14.
+        Other whole number words are added up, each taking one place (e.g. "twenty three" in "one point twenty three").
+        Words that aren't exactly whole number words can only be digits there, so they are only fuzzy matched
+        against the digits (e.g. "fiv" in "one point fiv", but not "fourty").
+        """
+        vocabulary = self.matcher.vocabulary
+        number_words = [word for word in words if word not in self.ignored_words]
+
+        if all(word in vocabulary.digits or word.isdecimal() for word in number_words):
+            digit_string = "".join(
+                word if word.isdecimal() else str(vocabulary.digits[word]) for word in number_words
+            )
+        elif all(word in vocabulary.whole_numbers for word in number_words):
+            value = self._parse_whole_number(number_words)
+            return None if value is None else (value, len(words))
+        else:
+            digit_string = ""
+            for word in number_words:
+                if word.isdecimal():
+                    digit_string += word
+                    continue
+                # Numerals with their own marks, like "1.5", are never matched.
+                digit = self.matcher.match_digit(word) if not word[:1].isdecimal() else None
+                if not digit:
+                    return None
+                digit_string += str(vocabulary.digits[digit])
+
+        # An empty decimal part, as in "one point", is zero.
+        return (float(digit_string), len(digit_string)) if digit_string else (0, 0)
 
     def _parse_whole_number(self, words: List[str]) -> Optional[float]:
         """Parses a number that does not have a separate fractional component."""
+        # Filler words are rare, so the words are only copied without them when there are any.
+        if any(ignored_word in words for ignored_word in self.ignored_words):
+            words = [word for word in words if word not in self.ignored_words]
+
         if not words:
             return 0
 
@@ -83,45 +200,179 @@ class StandardParser(Parser):
         return digit_sequence
 
     def _parse_whole_number_sequence(self, words: List[str]) -> Optional[float]:
-        """Parses a sequence of whole number words potentially including units (e.g. "twenty-three million")."""
-        # Sort units in decreasing order of their numerical value
-        sorted_units = sorted(
-            self.matcher.vocabulary.units.items(), key=lambda x: -x[1]
-        )
-        unit_names = [unit[0] for unit in sorted_units]
-
-        for unit_name in unit_names:
-            word_match = self.matcher.match(unit_name, words)
-            if word_match:
-                index = words.index(word_match)
-                left_value = self._parse_whole_number(words[:index])
-                right_value = self._parse_whole_number(words[index + 1 :])
-
-                if None in {left_value, right_value}:
-                    return None
-                else:
-                    return (
-                        left_value * self.matcher.vocabulary.units[unit_name]
-                        + right_value
-                    )
+        """
+        Parses a sequence of whole number words potentially including units (e.g. "twenty-three million").
+
+        The sequence is split on its largest unit, and the words before it are parsed on their own. The words after it
+        are split the same way in a loop rather than recursively, so that a phrase of thousands of units, such as
+        "million million ...", doesn't exceed the recursion limit. The terms are added from the last to the first,
+        as the words after a unit make up one number.
+        """
+        units = self.matcher.vocabulary.units
+        units_by_value = self.matcher.units_by_value
+        candidate_units = units_by_value
+        terms = []
+        while True:
+            largest_unit = self._find_largest_unit(words, candidate_units)
+            if not largest_unit:
+                # No units in the rest of the sequence, so it's a simple sequence of whole numbers.
+                value = self._parse_simple_whole_number_sequence(words)
+                break
+
+            unit_name, index = largest_unit
+            # No larger unit matches any word of the sequence, so none matches a word of the rest either.
+            candidate_units = units_by_value[units_by_value.index(unit_name) :]
+            left_value = self._parse_whole_number(words[:index])
+            if left_value is None:
+                return None
+            terms.append(left_value * units[unit_name])
+
+            # The words after the unit are a whole number of their own, like those `_parse_whole_number` is given,
+            # without filler words, which were removed from the whole sequence.
+            words = words[index + 1 :]
+            if not words:
+                value = 0
+                break
+            if all(self.matcher.match_digit(word) for word in words):
+                value = self._parse_digit_sequence(words)
+                break
+
+        if value is None:
+            return None
+        for term in reversed(terms):
+            value = term + value
+        return value
+
+    def _find_largest_unit(self, words: List[str], units: Optional[List[str]] = None) -> Optional[Tuple[str, int]]:
+        """
+        Finds the largest unit in a sequence of whole number words, which the sequence is split on.
+        Words that are exactly whole number words, such as "billion", are what they are, so only the other words
+        are fuzzy matched against the units, and "billion" can't be mistaken for "trillion".
+
+        :param words: A list of whole number words.
+        :param units: The unit words to look for, in decreasing order of value (default: every unit).
+        :return: A tuple of the unit word and the index of the word matching it, or None if there are no units.
+        """
+        units = self.matcher.units_by_value if units is None else units
+        if self.matcher.score_cache is not None and self.matcher.fuzzy_threshold < 100:
+            return self._find_largest_unit_in_score_cache(words, units)
+
+        # The misspelled words are only collected once a unit isn't in the words exactly.
+        misspelled_words = None
+
+        # Units are tried in decreasing order of their numerical value
+        for unit_name in units:
+            if unit_name in words:
+                return unit_name, words.index(unit_name)
+            if misspelled_words is None:
+                misspelled_words = self._misspelled_words(words)
+            if misspelled_words:
+                word_match = self.matcher.match(unit_name, misspelled_words)
+                if word_match:
+                    return unit_name, words.index(word_match)
+
+        return None
+
+    def _misspelled_words(self, words: List[str]) -> Dict[str, None]:
+        """
+        The words that may be misspelled number words, which are neither numerals nor exactly whole number words.
+        They are the keys of a dictionary, in order and without repeats, so that looking a word up takes constant time.
+        """
+        whole_numbers = self.matcher.vocabulary.whole_numbers
+        return dict.fromkeys(word for word in words if word not in whole_numbers and not word[:1].isdecimal())
+
+    def _find_largest_unit_in_score_cache(self, words: List[str], units: List[str]) -> Optional[Tuple[str, int]]:
+        """
+        Finds the largest unit like `_find_largest_unit`, scoring each word against every unit once through the score cache,
+        instead of scoring every unit against the words of this phrase.
+        """
+        word_scores = None
+        threshold = self.matcher.fuzzy_threshold
+
+        for unit_name in units:
+            if unit_name in words:
+                return unit_name, words.index(unit_name)
+
+            if word_scores is None:
+                misspelled_words = self._misspelled_words(words)
+                word_scores = [self.matcher.rank_units(word) if word in misspelled_words else {} for word in words]
+
+            # The first word with the highest score matches, as in the matcher's fuzzy match.
+            best_score, best_index = 0, None
+            for index, scores in enumerate(word_scores):
+                score = scores.get(unit_name, 0)
+                if score > best_score:
+                    best_score, best_index = score, index
 
-        # No units in the sequence, so it's a simple sequence of whole numbers.
-        return self._parse_simple_whole_number_sequence(words)
+            if best_index is not None and best_score >= threshold:
+                return unit_name, best_index
+
+        return None
 
     def _parse_simple_whole_number_sequence(
         self, words: List[str]
     ) -> Optional[float]:
-        """Parses a simple sequence of whole words representing whole numbers, without any units (e.g. "twenty six")."""
+        """
+        Parses a simple sequence of whole words representing whole numbers, without any units (e.g. "twenty six").
+        Only a digit can follow a tens word, so a misspelled word after one that is read as any other whole number,
+        such as "fourty" in "twenty fourty", makes the sequence ungrammatical. Exact words are summed as they are.
+        A numeral is only a sequence on its own.
+        """
+        whole_numbers = self.matcher.vocabulary.whole_numbers
+        digits = self.matcher.vocabulary.digits
         sum = 0
+        after_tens = False
         for word in words:
+            numeral_value = self._parse_numeral(word)
+            if numeral_value is not None:
+                # Numerals count as whole numbers that only combine with units, as in "3 million", so a numeral
+                # next to another numeral or a number word, as in "2024 10 19" or "twenty 30", is no number.
+                if len(words) > 1:
+                    return None
+                sum += numeral_value
+                continue
+
             match = self.matcher.match_whole_number(word)
-            if match:
-                sum += self.matcher.vocabulary.whole_numbers[match]
-            else:
+            if not match or (after_tens and match != word and match not in digits):
                 return None
 
+            value = whole_numbers[match]
+            sum += value
+            after_tens = 10 < value < 100 and value % 10 == 0
+
         return sum
 
+    def _parse_numeral(self, word: str) -> Optional[float]:
+        """
+        Converts an unsigned numeral such as "42" or "1,234.5" to its value, using the parser's decimal and grouping marks.
+
+        :param word: A token.
+        :return: The value of the numeral, or None if the token isn't a well-formed numeral.
+        """
+        if not word[:1].isdecimal():
+            return None
+
+        integer_part, decimal_mark, decimal_part = word.partition(self.decimal_mark)
+        groups = integer_part.split(self.grouping_mark)
+        if not all(group.isdecimal() for group in groups):
+            return None
+        if len(groups) > 1 and (
+            len(groups[0]) > 3 or any(len(group) != 3 for group in groups[1:])
+        ):
+            # Groups of thousands must have three digits each, so "1,5" is not a numeral where the grouping mark is ",".
+            return None
+        if decimal_mark and not decimal_part.isdecimal():
+            return None
+
+        return float("".join(groups) + "." + decimal_part if decimal_mark else "".join(groups))
+
+    def _parse_signed_numeral(self, word: str) -> Optional[float]:
+        """Converts a numeral with an optional minus sign, such as "-7", to its value, or returns None if the token isn't one."""
+        if word.startswith("-"):
+            value = self._parse_numeral(word[1:])
+            return -value if value is not None else None
+        return self._parse_numeral(word)
+
     def _parse_non_decimal_number(self, words: List[str]) -> Optional[float]:
         """Parses a non-decimal number from the given word list."""
         whole_words, fraction_words = self._split_whole_and_fraction(words)
@@ -173,9 +424,11 @@ class StandardParser(Parser):
                 numerator_words = words[:i]
                 denominator_word = words[i]
                 numerator = self._parse_numerator(numerator_words)
-                return numerator / self.matcher.match_denominator(
-                    denominator_word
-                )
+                denominator = self.matcher.match_denominator(denominator_word)
+                if numerator is None or not denominator:
+                    # The numerator isn't a number, or the denominator is zero (as in "one zeroth").
+                    return None
+                return numerator / denominator
 
     def _parse_numerator(self, words: List[str]) -> Optional[float]:
         """Parses a numerator from the given word list."""
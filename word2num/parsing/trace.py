@@ -0,0 +1,211 @@
+import copy
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from word2num.languages.detection import LanguageDetector
+from word2num.parsing.standard_parser import StandardParser
+from word2num.word_matching.scorers import Scorer
+
+# Matcher methods whose decisions are recorded, keyed by the vocabulary category they match against.
+TRACED_MATCH_METHODS = {
+    "match_negative_signifier": "negative_signifiers",
+    "match_decimal_separator": "decimal_separators",
+    "match_fraction_separator": "fraction_separators",
+    "match_indefinite_article": "indefinite_articles",
+    "match_denominator": "denominators",
+    "match_unit": "units",
+    "match_digit": "digits",
+    "match_whole_number": "whole_numbers",
+}
+
+# Category of the decisions of language detection, whose result is each language's best fuzzy score of a word.
+DETECTION_CATEGORY = "languages"
+
+# A fuzzy comparison: the two strings compared and their match score, which is 0 if it fell below the matcher's cutoff.
+Comparison = Tuple[str, str, int]
+
+
+@dataclass
+class MatchDecision:
+    """A word matched against one category of the vocabulary."""
+
+    category: str
+    word: str
+    # The matched vocabulary word (or the value of a denominator), or None if the word didn't match.
+    result: Any = None
+    comparisons: List[Comparison] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+@dataclass
+class UnitSplit:
+    """A search for the largest unit in a sequence of whole number words, which the sequence is split on."""
+
+    words: List[str]
+    # The unit that was found and the index of the word matching it, or None if the sequence has no units.
+    unit: Optional[str] = None
+    index: Optional[int] = None
+    comparisons: List[Comparison] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+@dataclass
+class StageTrace:
+    """One stage of a parse, such as tokenization or the exact or fuzzy parsing pass."""
+
+    name: str
+    value: Any = None
+    seconds: float = 0.0
+    decisions: List[MatchDecision] = field(default_factory=list)
+    splits: List[UnitSplit] = field(default_factory=list)
+
+    @property
+    def fuzzy_comparisons(self) -> int:
+        """The number of fuzzy comparisons made during the stage."""
+        return sum(len(decision.comparisons) for decision in self.decisions) + sum(
+            len(split.comparisons) for split in self.splits
+        )
+
+
+@dataclass
+class ParseTrace:
+    """
+    A structured record of how one text was parsed: its tokens, the timing of each stage,
+    every match decision with the fuzzy scores behind it and the unit split points.
+    """
+
+    text: str
+    tokens: List[str] = field(default_factory=list)
+    language_code: Optional[str] = None
+    value: Optional[float] = None
+    seconds: float = 0.0
+    stages: List[StageTrace] = field(default_factory=list)
+
+    @property
+    def fuzzy_comparisons(self) -> int:
+        """The number of fuzzy comparisons made during the parse."""
+        return sum(stage.fuzzy_comparisons for stage in self.stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the trace to a dictionary of plain values, e.g. to log it as JSON."""
+        return asdict(self)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator["StageRecorder"]:
+        """
+        Records a stage of the parse, timing the code run inside the context.
+
+        :param name: Name of the stage.
+        :return: A recorder for the stage.
+        """
+        recorder = StageRecorder(StageTrace(name))
+        self.stages.append(recorder.stage)
+        start = perf_counter()
+        try:
+            yield recorder
+        finally:
+            recorder.stage.seconds = perf_counter() - start
+
+
+class StageRecorder:
+    """
+    Records the match decisions and unit splits of a parser into a stage trace.
+
+    Tracing works on shallow copies of a parser and its matcher whose methods and scorer are wrapped,
+    so the parser being traced is never modified and parsing without tracing has no overhead.
+    """
+
+    def __init__(self, stage: StageTrace):
+        """
+        :param stage: The stage trace to record into.
+        """
+        self.stage = stage
+        # Decisions and splits that are in progress; fuzzy comparisons are attributed to the innermost one.
+        self._open: List[Any] = []
+
+    def traced(self, parser: StandardParser) -> StandardParser:
+        """
+        Creates a copy of the given parser that records into the stage trace.
+
+        :param parser: The parser to trace.
+        :return: A traced copy of the parser.
+        """
+        matcher = copy.copy(parser.matcher)
+        for method_name, category in TRACED_MATCH_METHODS.items():
+            setattr(
+                matcher,
+                method_name,
+                self._traced_match(getattr(matcher, method_name), category),
+            )
+        matcher.scorer = _TracedScorer(matcher.scorer, self)
+
+        traced_parser = copy.copy(parser)
+        traced_parser.matcher = matcher
+        traced_parser._find_largest_unit = self._traced_split(
+            traced_parser._find_largest_unit
+        )
+        return traced_parser
+
+    def traced_detector(self, detector: LanguageDetector) -> LanguageDetector:
+        """
+        Creates a copy of the given language detector that records the fuzzy scoring of each word into the stage trace.
+
+        :param detector: The detector to trace.
+        :return: A traced copy of the detector.
+        """
+        traced_detector = copy.copy(detector)
+        traced_detector.scorer = _TracedScorer(detector.scorer, self)
+        traced_detector._best_fuzzy_scores = self._traced_match(traced_detector._best_fuzzy_scores, DETECTION_CATEGORY)
+        return traced_detector
+
+    def _traced_match(self, match: Callable, category: str) -> Callable:
+        def traced_match(word: str):
+            decision = MatchDecision(category, word)
+            self.stage.decisions.append(decision)
+            self._open.append(decision)
+            start = perf_counter()
+            try:
+                decision.result = match(word)
+            finally:
+                decision.seconds = perf_counter() - start
+                self._open.pop()
+            return decision.result
+
+        return traced_match
+
+    def _traced_split(self, find_largest_unit: Callable) -> Callable:
+        def traced_find_largest_unit(words: List[str], units: Optional[List[str]] = None):
+            split = UnitSplit(list(words))
+            self.stage.splits.append(split)
+            self._open.append(split)
+            start = perf_counter()
+            try:
+                largest_unit = find_largest_unit(words, units)
+            finally:
+                split.seconds = perf_counter() - start
+                self._open.pop()
+            if largest_unit:
+                split.unit, split.index = largest_unit
+            return largest_unit
+
+        return traced_find_largest_unit
+
+    def record_comparison(self, a: str, b: str, score: int) -> None:
+        """Records a fuzzy comparison in the innermost decision or split in progress."""
+        if self._open:
+            self._open[-1].comparisons.append((a, b, score))
+
+
+class _TracedScorer(Scorer):
+    """Records every comparison of a scorer with a stage recorder."""
+
+    def __init__(self, scorer: Scorer, recorder: StageRecorder):
+        self.scorer = scorer
+        self.recorder = recorder
+
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        score = self.scorer.score(a, b, cutoff)
+        self.recorder.record_comparison(a, b, score)
+        return score
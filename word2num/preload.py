@@ -0,0 +1,124 @@
+import gc
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .languages import parsers
+from .parsing.standard_parser import StandardParser
+from .word2num import Word2Num
+
+# Where the kernel reports the memory of the current process, summed over all its mappings (Linux 4.14 and later).
+SMAPS_ROLLUP_PATH = "/proc/self/smaps_rollup"
+
+# Instances built by `preload`, keyed by language code and fuzzy threshold.
+_preloaded: Dict[Tuple[str, int], Word2Num] = {}
+
+
+class MemoryUsage(NamedTuple):
+    """The memory of a process, in bytes."""
+
+    # Resident memory, shared and private.
+    rss: int
+    # Resident memory with each shared page divided among the processes that share it.
+    pss: int
+    # Resident memory shared with other processes, such as pages a forked child hasn't written to since the fork.
+    shared: int
+    # Resident memory used only by this process.
+    private: int
+
+
+def preload(
+    language_codes: Optional[Iterable[str]] = None,
+    fuzzy_thresholds: Iterable[int] = (80,),
+    freeze: bool = True,
+    **options,
+) -> Dict[Tuple[str, int], Word2Num]:
+    """
+    Builds and warms up Word2Num instances in a server's parent process, before it forks its workers,
+    such as in a gunicorn config file with `preload_app`. Children then find them with `preloaded` and parse
+    at full speed straight away, sharing the memory of the instances with the parent through copy-on-write.
+
+    Every index that is otherwise built on first use is built, and each parser parses a few phrases.
+    Then, unless `freeze` is False, the garbage collector is run and every object it tracks is moved to its
+    permanent generation with `gc.freeze`. The collector never visits frozen objects, so children don't copy
+    the pages they are in by collecting them. Reference counting still writes to the objects children use.
+
+    :param language_codes: Languages to build instances for, which may include "auto" (default: every supported language).
+    :param fuzzy_thresholds: Fuzzy thresholds to build instances for, for each language (default: 80).
+    :param freeze: Whether to freeze the objects of the process in the garbage collector (default: True).
+    :param options: Further options of the instances, such as `phonetic=True`.
+    :return: The preloaded instances, keyed by language code and fuzzy threshold.
+    """
+    for language_code in parsers if language_codes is None else language_codes:
+        for fuzzy_threshold in fuzzy_thresholds:
+            w2n = Word2Num(language_code=language_code, fuzzy_threshold=fuzzy_threshold, **options)
+            for parser in _parsers_of(w2n):
+                _warm_up(parser)
+            _preloaded[language_code, fuzzy_threshold] = w2n
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    return dict(_preloaded)
+
+
+def preloaded(language_code: str = "en", fuzzy_threshold: int = 80) -> Word2Num:
+    """
+    Finds the instance preloaded for a language and fuzzy threshold, or creates one if none was.
+
+    :param language_code: The language of the instance, or "auto" (default: "en").
+    :param fuzzy_threshold: The fuzzy threshold of the instance (default: 80).
+    :return: The preloaded instance, or a new one.
+    """
+    w2n = _preloaded.get((language_code, fuzzy_threshold))
+    if w2n is None:
+        w2n = Word2Num(language_code=language_code, fuzzy_threshold=fuzzy_threshold)
+    return w2n
+
+
+def memory_usage() -> Optional[MemoryUsage]:
+    """
+    Measures the memory of the current process, such as to compare how much of a forked worker's memory is still
+    shared with its parent.
+
+    :return: The memory usage, or None if the platform doesn't report it.
+    """
+    try:
+        with open(SMAPS_ROLLUP_PATH) as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+
+    # Values are reported in kibibytes, as in "Shared_Clean:      1024 kB".
+    fields = {}
+    for line in lines:
+        name, _, value = line.partition(":")
+        if value.strip().endswith("kB"):
+            fields[name] = int(value.split()[0]) * 1024
+
+    return MemoryUsage(
+        rss=fields.get("Rss", 0),
+        pss=fields.get("Pss", 0),
+        shared=fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        private=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    )
+
+
+def _parsers_of(w2n: Word2Num) -> Iterable[StandardParser]:
+    """The exact and fuzzy parsers of an instance, of every language it detects."""
+    converters = w2n.converters.values() if w2n.language_detector else [(w2n.exact_converter, w2n.fuzzy_converter)]
+    for exact_parser, fuzzy_parser in converters:
+        yield exact_parser
+        if fuzzy_parser:
+            yield fuzzy_parser
+
+
+def _warm_up(parser: StandardParser) -> None:
+    """Builds the parser's indexes and parses a few phrases of its vocabulary, one of them misspelled."""
+    matcher = parser.matcher
+    matcher.build_indexes()
+
+    digit = next(iter(matcher.vocabulary.digits))
+    unit = matcher.units_by_value[-1]
+    denominator = next(iter(matcher.denominator_forms.values()))
+    for tokens in ([digit, unit], [digit, denominator], [digit + digit[-1], unit]):
+        parser.parse_tokens(tokens)
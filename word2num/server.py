@@ -0,0 +1,345 @@
+import argparse
+import json
+import math
+import os
+import queue
+import socketserver
+import threading
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .languages import parsers
+from .word2num import AUTO_LANGUAGE_CODE, Word2Num
+
+# Number of recent request latencies that the latency statistics are calculated from.
+LATENCY_WINDOW = 10_000
+
+
+class LatencyStats:
+    """Thread-safe statistics of the requests and batches handled by a server."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        """
+        :param window: Number of recent request latencies to calculate percentiles from.
+        """
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.requests = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    def record_request(self, seconds: float) -> None:
+        """Records the latency of a request."""
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(seconds)
+
+    def record_batch(self, size: int) -> None:
+        """Records a batch of the given number of texts."""
+        with self._lock:
+            self.batches += 1
+            self.batched_texts += size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarizes the statistics, with latencies in milliseconds."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "requests": self.requests,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_texts / self.batches if self.batches else 0,
+            }
+
+        if latencies:
+            stats["latency_ms"] = {
+                "mean": 1000 * sum(latencies) / len(latencies),
+                "p50": 1000 * _percentile(latencies, 0.5),
+                "p90": 1000 * _percentile(latencies, 0.9),
+                "p99": 1000 * _percentile(latencies, 0.99),
+                "max": 1000 * latencies[-1],
+            }
+        return stats
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """The nearest-rank percentile of a non-empty sorted list."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class MicroBatcher:
+    """
+    Gathers texts submitted by concurrent callers into batches that are parsed together with Word2Num.parse_many.
+
+    A batch is parsed as soon as it holds the maximum number of texts, or once the first text in it
+    has waited for the maximum wait time. Batching lets repeated texts be parsed once and
+    keeps the parsers warm on a single thread, at the cost of at most the maximum wait in latency.
+    """
+
+    def __init__(
+        self,
+        w2n: Word2Num,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        stats: Optional[LatencyStats] = None,
+    ):
+        """
+        :param w2n: The Word2Num instance to parse with.
+        :param max_batch_size: Maximum number of texts in a batch (default: 64).
+        :param max_wait: Maximum time in seconds to wait for a batch to fill up (default: 0.002).
+        :param stats: Statistics to record the batches in (default: new statistics).
+        """
+        if max_batch_size < 1:
+            raise ValueError("The maximum batch size must be at least 1")
+
+        self.w2n = w2n
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.stats = stats or LatencyStats()
+
+        self._queue: "queue.Queue[Optional[Tuple[List[str], Future]]]" = queue.Queue()
+        # Guards closing, so that nothing is submitted after the batching thread has been told to stop.
+        self._lock = threading.Lock()
+        self._is_closed = False
+        self._thread = threading.Thread(target=self._run, name="word2num-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> "Future[List[Optional[float]]]":
+        """
+        Submits texts to be parsed in the next batch.
+
+        :param texts: Text representations of numbers.
+        :return: A future of the numerical values of the texts, in order.
+        :raises ValueError: If the batcher has been closed.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._is_closed:
+                raise ValueError("The batcher is closed")
+            self._queue.put((texts, future))
+        return future
+
+    def close(self) -> None:
+        """Parses the texts submitted so far and stops the batching thread. Closing it again does nothing."""
+        with self._lock:
+            if not self._is_closed:
+                self._is_closed = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            size = len(item[0])
+            deadline = perf_counter() + self.max_wait
+            is_closing = False
+
+            while size < self.max_batch_size:
+                remaining = deadline - perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    is_closing = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            self._parse_batch(batch)
+            if is_closing:
+                return
+
+    def _parse_batch(self, batch: List[Tuple[List[str], Future]]) -> None:
+        """Parses a batch and resolves the futures of its submissions."""
+        texts = [text for submitted_texts, _ in batch for text in submitted_texts]
+        self.stats.record_batch(len(texts))
+
+        try:
+            values = self.w2n.parse_many(texts)
+        except Exception:
+            # Resolve each submission separately, so that a text that fails only fails its own submission.
+            for submitted_texts, future in batch:
+                try:
+                    future.set_result(self.w2n.parse_many(submitted_texts))
+                except Exception as error:
+                    future.set_exception(error)
+            return
+
+        start = 0
+        for submitted_texts, future in batch:
+            future.set_result(values[start : start + len(submitted_texts)])
+            start += len(submitted_texts)
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of a conversion server:
+
+    - `POST /parse` with a JSON body `{"text": "..."}` returns `{"value": ...}`,
+      and with `{"texts": [...]}` returns `{"values": [...]}`. The value is null for texts without a value,
+      and for texts whose value is too large for a float, since JSON has no infinity.
+    - `GET /stats` returns the request, batch and latency statistics of the server.
+    """
+
+    server_version = "word2num"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.stats.to_dict())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        if self.path != "/parse":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        start = perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            is_single = "text" in request
+            texts = [request["text"]] if is_single else request["texts"]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            self._send_json(400, {"error": 'Expected a JSON object with a "text" string or a "texts" list of strings'})
+            return
+
+        try:
+            values = self.server.batcher.submit(texts).result()
+        except Exception as error:
+            self._send_json(422, {"error": str(error)})
+            return
+
+        values = [value if value is None or math.isfinite(value) else None for value in values]
+        self.server.stats.record_request(perf_counter() - start)
+        self._send_json(200, {"value": values[0]} if is_single else {"values": values})
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        content = json.dumps(body, allow_nan=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address.
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _ConversionServerMixin:
+    """Holds the micro-batcher and statistics shared by the TCP and Unix socket servers."""
+
+    daemon_threads = True
+
+    def _initialize_batching(
+        self, w2n: Word2Num, max_batch_size: int, max_wait: float, verbose: bool
+    ) -> None:
+        self.stats = LatencyStats()
+        self.batcher = MicroBatcher(w2n, max_batch_size, max_wait, self.stats)
+        self.verbose = verbose
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.close()
+
+
+class ConversionServer(_ConversionServerMixin, ThreadingHTTPServer):
+    """An HTTP server that converts text representations of numbers, micro-batching concurrent requests."""
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        w2n: Word2Num,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        verbose: bool = False,
+    ):
+        """
+        :param address: Host and port to listen on. Port 0 picks a free port.
+        :param w2n: The Word2Num instance to parse with.
+        :param max_batch_size: Maximum number of texts in a batch (default: 64).
+        :param max_wait: Maximum time in seconds to wait for a batch to fill up (default: 0.002).
+        :param verbose: Whether to log every request (default: False).
+        """
+        super().__init__(address, ConversionRequestHandler)
+        self._initialize_batching(w2n, max_batch_size, max_wait, verbose)
+
+
+class UnixConversionServer(_ConversionServerMixin, socketserver.ThreadingUnixStreamServer):
+    """A conversion server that speaks HTTP over a Unix socket."""
+
+    def __init__(
+        self,
+        path: str,
+        w2n: Word2Num,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        verbose: bool = False,
+    ):
+        """
+        :param path: Path of the Unix socket to listen on.
+        :param w2n: The Word2Num instance to parse with.
+        :param max_batch_size: Maximum number of texts in a batch (default: 64).
+        :param max_wait: Maximum time in seconds to wait for a batch to fill up (default: 0.002).
+        :param verbose: Whether to log every request (default: False).
+        """
+        super().__init__(path, ConversionRequestHandler)
+        self._initialize_batching(w2n, max_batch_size, max_wait, verbose)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser(
+        description="Serves number conversion over HTTP/JSON, micro-batching concurrent requests."
+    )
+    argument_parser.add_argument("--language", default="en", choices=[*sorted(parsers), AUTO_LANGUAGE_CODE])
+    argument_parser.add_argument("--fuzzy-threshold", type=int, default=80)
+    argument_parser.add_argument("--host", default="127.0.0.1")
+    argument_parser.add_argument("--port", type=int, default=8000)
+    argument_parser.add_argument("--unix-socket", help="Listen on this Unix socket instead of a TCP port.")
+    argument_parser.add_argument("--max-batch-size", type=int, default=64)
+    argument_parser.add_argument("--max-wait", type=float, default=0.002, help="Seconds to wait for a batch to fill up.")
+    argument_parser.add_argument("--verbose", action="store_true")
+    arguments = argument_parser.parse_args()
+
+    w2n = Word2Num(language_code=arguments.language, fuzzy_threshold=arguments.fuzzy_threshold)
+    options = dict(
+        w2n=w2n,
+        max_batch_size=arguments.max_batch_size,
+        max_wait=arguments.max_wait,
+        verbose=arguments.verbose,
+    )
+    if arguments.unix_socket:
+        server = UnixConversionServer(arguments.unix_socket, **options)
+    else:
+        server = ConversionServer((arguments.host, arguments.port), **options)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,18 +2,20 @@ import re
 
 from .base_tokenizer import BaseTokenizer
 
+# Match numerals, with a leading minus sign unless it joins two words (as in "twenty-3"),
+# and all alphabetic words including accented characters.
+# See https://stackoverflow.com/questions/20690499 for details on the alphabetic part of the regex
+TOKEN_PATTERN = re.compile(r"(?:(?<!\w)-)?\d+(?:[.,]\d+)*|[A-Za-zÀ-ÖØ-öø-ÿ]+")
+
 
 class SimpleTokenizer(BaseTokenizer):
     """
     SimpleTokenizer splits the input text into individual words.
 
     It converts the text to lowercase and uses regular expressions
-    to extract alphabetic words including accented characters.
+    to extract alphabetic words including accented characters, and numerals
+    such as "42", "-7" or "1,234.5" including their sign, decimal and grouping marks.
     """
 
     def tokenize(self, text):
-        text = text.lower()
-
-        # Match all alphabetic words including accented characters.
-        # See https://stackoverflow.com/questions/20690499 for details on the regex
-        return re.findall(r"[A-Za-zÀ-ÖØ-öø-ÿ]+", text)
+        return TOKEN_PATTERN.findall(text.lower())
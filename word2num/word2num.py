@@ -1,42 +1,559 @@
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
-from .languages.es.parser import SpanishParser
-from .languages.en import EnglishParser
+from .languages import parsers
+from .languages.detection import LanguageDetector
+from .languages.packs import LanguagePack
+from .parsing.budget import ParseBudget
+from .parsing.incremental_parser import IncrementalParser
+from .parsing.nbest import NBestParser, Reading
+from .parsing.standard_parser import StandardParser
+from .parsing.trace import ParseTrace
+from .word_matching.aliases import AliasTable
+from .word_matching.score_cache import RankedScoreCache, shared_score_cache
+from .word_matching.scorers import Scorer, scorers
+from .word_matching.vocabulary_registry import VocabularyRegistry, shared_vocabulary_registry
 
-parsers = {
-    "en": EnglishParser,
-    "es": SpanishParser,
-}
+# Language code that makes Word2Num detect the language of each phrase among all supported languages.
+AUTO_LANGUAGE_CODE = "auto"
+
+
+class _Parsers(NamedTuple):
+    """The parsers of a Word2Num instance, which are replaced all at once when words are added to its vocabulary."""
+
+    exact: StandardParser
+    fuzzy: Optional[StandardParser]
+    # The parsers of each language and the detector that picks one, if the language is detected.
+    converters: Optional[Dict[str, Tuple[StandardParser, Optional[StandardParser]]]] = None
+    language_detector: Optional[LanguageDetector] = None
+    # The version of the vocabulary registry the parsers were built for, or None if they haven't been checked against it.
+    version: Optional[int] = None
 
 
 class Word2Num:
-    def __init__(self, language_code: str = "en", fuzzy_threshold: int = 80):
-        self.exact_converter, self.fuzzy_converter = self._initialize_parsers(
-            language_code, fuzzy_threshold)
+    """
+    Parses numbers from their text representations in a given language.
+
+    A single instance can be shared by many threads (including on free-threaded Python builds) without a lock.
+    Each call reads the instance's parsers once, and metered and traced parses use copies of them, so no call
+    changes what another call parses with. What calls do write to is shared, and each part guards itself:
+    the matchers build their indexes and remember prefilter verdicts as described by WordMatcher,
+    the score cache stores rankings without replacing them, and alias tables count matches under their own lock.
+    When words are added, through this instance or another one with the same vocabulary registry, the instance
+    builds new parsers under a module lock and replaces its parsers with them in a single assignment,
+    so a call that is under way finishes with the old ones.
+    """
+
+    def __init__(
+        self,
+        language_code: str = "en",
+        fuzzy_threshold: int = 80,
+        language_pack: Optional[LanguagePack] = None,
+        budget: Optional[ParseBudget] = None,
+        scorer: Union[str, Scorer, None] = None,
+        phonetic: bool = False,
+        score_cache: Union[bool, RankedScoreCache] = False,
+        aliases: Union[bool, AliasTable, Mapping[str, AliasTable]] = False,
+        vocabulary_registry: Optional[VocabularyRegistry] = None,
+    ):
+        """
+        :param language_code: The language of the text representations, or "auto" to detect the language of each one.
+        :param fuzzy_threshold: The minimum score for fuzzy string matching (default: 80).
+        :param language_pack: A compiled language pack of the language to build the parsers from, instead of building them from scratch.
+        :param budget: Limits on the work of each parse, which raises ParseBudgetExceeded when one is exceeded (default: no limits).
+        :param scorer: The fuzzy scorer, or the name of one of the supported scorers (default: "thefuzz"). All scorers give the same results.
+        :param phonetic: Whether fuzzy matching first tries the words that sound like a misheard word, such as "eight" for "ate",
+            which suits speech transcripts (default: False).
+        :param score_cache: True to look fuzzy scores up in the process-wide cache of ranked scores, which is shared by
+            every instance at every fuzzy threshold, or a cache of ranked scores to use instead (default: no cache).
+        :param aliases: True to learn the misspellings that are fuzzy matched often and look them up as aliases instead,
+            an alias table to learn them in, such as one loaded with `AliasTable.load`, or alias tables keyed by
+            language code when the language is detected (default: no aliases).
+        :param vocabulary_registry: The registry of the words added at runtime, which the instance switches to and
+            publishes words added to it in (default: the process-wide registry, shared by every instance).
+        """
+        self.language_code = language_code
+        self.budget = budget
+        self.vocabulary_registry = vocabulary_registry or shared_vocabulary_registry
+        scorer = self._initialize_scorer(scorer)
+        score_cache = self._initialize_score_cache(score_cache)
+        alias_tables = self._initialize_alias_tables(aliases, language_code)
+
+        if language_pack:
+            if language_pack.language_code != language_code:
+                raise ValueError(
+                    f"Language pack is for {language_pack.language_code}, not {language_code}"
+                )
+            self._parsers = _Parsers(*self._initialize_parsers_from_pack(
+                language_pack, fuzzy_threshold, scorer, phonetic, score_cache, alias_tables.get(language_code)))
+        elif language_code == AUTO_LANGUAGE_CODE:
+            converters = {
+                code: self._initialize_parsers(
+                    code, fuzzy_threshold, scorer, phonetic, score_cache, alias_tables.get(code))
+                for code in parsers
+            }
+            language_detector = LanguageDetector(
+                {
+                    code: (fuzzy or exact).matcher
+                    for code, (exact, fuzzy) in converters.items()
+                },
+                fuzzy_threshold,
+                scorer,
+            )
+            # Parsers of the preferred language, used when no language can be detected.
+            self._parsers = _Parsers(*next(iter(converters.values())), converters, language_detector)
+        else:
+            self._parsers = _Parsers(*self._initialize_parsers(
+                language_code, fuzzy_threshold, scorer, phonetic, score_cache, alias_tables.get(language_code)))
+        # Words added to the language before the instance was created are added to it now rather than in its first parse.
+        self._current_parsers()
+
+    @property
+    def exact_converter(self) -> StandardParser:
+        """The parser that only accepts exact matches, of the preferred language if the language is detected."""
+        return self._current_parsers().exact
+
+    @property
+    def fuzzy_converter(self) -> Optional[StandardParser]:
+        """The parser used when the exact parser fails, or None if the fuzzy threshold is 100."""
+        return self._current_parsers().fuzzy
+
+    @property
+    def converters(self) -> Dict[str, Tuple[StandardParser, Optional[StandardParser]]]:
+        """The exact and fuzzy parsers of each language, keyed by language code, when the language is detected."""
+        parsers = self._current_parsers()
+        if parsers.converters is None:
+            raise AttributeError("Only instances that detect the language have parsers for each language")
+        return parsers.converters
+
+    @property
+    def language_detector(self) -> Optional[LanguageDetector]:
+        """The detector that picks the language of each phrase, or None if the language is fixed."""
+        return self._current_parsers().language_detector
+
+    @property
+    def alias_tables(self) -> Dict[str, AliasTable]:
+        """
+        The alias tables of the fuzzy parsers, keyed by language code, such as for saving the aliases they have learned.
+        Adding words to a language replaces its table with a copy that leaves out the categories the words were added to.
+        """
+        parsers = self._current_parsers()
+        converters = parsers.converters or {self.language_code: (parsers.exact, parsers.fuzzy)}
+        return {
+            code: fuzzy_parser.matcher.aliases
+            for code, (_, fuzzy_parser) in converters.items()
+            if fuzzy_parser and fuzzy_parser.matcher.aliases is not None
+        }
+
+    @staticmethod
+    def _initialize_scorer(scorer: Union[str, Scorer, None]) -> Optional[Scorer]:
+        if not isinstance(scorer, str):
+            return scorer
+        elif scorer in scorers.keys():
+            return scorers[scorer]()
+        else:
+            raise ValueError(f"Unsupported scorer: {scorer}")
+
+    @staticmethod
+    def _initialize_score_cache(
+        score_cache: Union[bool, RankedScoreCache]
+    ) -> Optional[RankedScoreCache]:
+        if isinstance(score_cache, RankedScoreCache):
+            return score_cache
+        return shared_score_cache if score_cache else None
+
+    @staticmethod
+    def _initialize_alias_tables(
+        aliases: Union[bool, AliasTable, Mapping[str, AliasTable]], language_code: str
+    ) -> Dict[str, AliasTable]:
+        language_codes = list(parsers) if language_code == AUTO_LANGUAGE_CODE else [language_code]
+        if isinstance(aliases, AliasTable):
+            if language_code == AUTO_LANGUAGE_CODE:
+                raise ValueError("Alias tables have to be keyed by language code when the language is detected")
+            return {language_code: aliases}
+        elif isinstance(aliases, Mapping):
+            return dict(aliases)
+        return {code: AliasTable() for code in language_codes} if aliases else {}
 
     @staticmethod
-    def _initialize_parsers(language_code: str, fuzzy_threshold: int):
+    def _initialize_parsers(
+        language_code: str,
+        fuzzy_threshold: int,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
         if language_code in parsers.keys():
             parser_class = parsers[language_code]
-            exact_parser = parser_class(fuzzy_threshold=100)
+            exact_parser = parser_class(fuzzy_threshold=100, scorer=scorer)
+            # The fuzzy parser shares the exact parser's snapshot of the vocabulary.
             fuzzy_parser = parser_class(
-                fuzzy_threshold) if fuzzy_threshold < 100 else None
+                fuzzy_threshold,
+                vocabulary=exact_parser.matcher.vocabulary,
+                scorer=scorer,
+                phonetic=phonetic,
+                score_cache=score_cache,
+                aliases=aliases,
+            ) if fuzzy_threshold < 100 else None
             return exact_parser, fuzzy_parser
         else:
             raise ValueError(f"Unsupported language: {language_code}")
 
-    def parse(self, text: str) -> Optional[float]:
+    @classmethod
+    def from_language_pack(
+        cls,
+        language_pack: Union[LanguagePack, str],
+        fuzzy_threshold: int = 80,
+        budget: Optional[ParseBudget] = None,
+        scorer: Union[str, Scorer, None] = None,
+        phonetic: bool = False,
+        score_cache: Union[bool, RankedScoreCache] = False,
+        aliases: Union[bool, AliasTable, Mapping[str, AliasTable]] = False,
+        vocabulary_registry: Optional[VocabularyRegistry] = None,
+    ) -> "Word2Num":
+        """
+        Creates a Word2Num instance from a compiled language pack, skipping the work of building its vocabulary and indexes.
+        The other options are those of the constructor.
+
+        :param language_pack: A language pack, or the path of a language pack file.
+        :param fuzzy_threshold: The minimum score for fuzzy string matching (default: 80).
+        :param budget: Limits on the work of each parse (default: no limits).
+        :param scorer: The fuzzy scorer, or the name of one of the supported scorers (default: "thefuzz").
+        :param phonetic: Whether fuzzy matching first tries the words that sound like a misheard word (default: False).
+        :param score_cache: True to use the process-wide cache of ranked scores, or a cache to use instead (default: no cache).
+        :param aliases: True to learn aliases of frequent misspellings, or an alias table to learn them in (default: no aliases).
+        :param vocabulary_registry: The registry of the words added at runtime (default: the process-wide registry).
+        :return: A Word2Num instance for the language of the pack.
+        """
+        if not isinstance(language_pack, LanguagePack):
+            language_pack = LanguagePack.load(language_pack)
+
+        return cls(
+            language_code=language_pack.language_code,
+            fuzzy_threshold=fuzzy_threshold,
+            language_pack=language_pack,
+            budget=budget,
+            scorer=scorer,
+            phonetic=phonetic,
+            score_cache=score_cache,
+            aliases=aliases,
+            vocabulary_registry=vocabulary_registry,
+        )
+
+    @staticmethod
+    def _initialize_parsers_from_pack(
+        language_pack: LanguagePack,
+        fuzzy_threshold: int,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
+        exact_parser = language_pack.create_parser(fuzzy_threshold=100, scorer=scorer)
+        fuzzy_parser = language_pack.create_parser(
+            fuzzy_threshold, scorer=scorer, phonetic=phonetic, score_cache=score_cache, aliases=aliases
+        ) if fuzzy_threshold < 100 else None
+        return exact_parser, fuzzy_parser
+
+    def add_words(
+        self,
+        category: str,
+        words: Union[Mapping[str, int], Iterable[str]],
+        language_code: Optional[str] = None,
+    ) -> None:
+        """
+        Adds words to a category of the vocabulary of a language, such as domain aliases like {"grand": 1000} for the units.
+        Digits and units are added to the whole numbers as well.
+
+        The extended vocabulary is published in the instance's vocabulary registry, and every instance of the language
+        that uses the registry, including existing ones, switches to it before its next parse. Only the entries of
+        the matchers' indexes and caches that the new words affect are updated, on copies of the parsers, and each
+        instance switches to its new parsers all at once. So every parse, including parses in other threads, uses
+        either the old or the new vocabulary. Incremental parsers created before keep the old one.
+
+        :param category: Name of the vocabulary category, such as "units" or "negative_signifiers".
+        :param words: The words and their values for a category of numbers (digits, whole numbers, units or
+            irregular denominators), or the words for any other category.
+        :param language_code: The language whose vocabulary to extend, which is required if the language is detected.
+        :raises ValueError: If the language or category isn't supported, a word isn't a single lowercase word,
+            or a word is already in the category with another value.
+        """
+        parsers = self._current_parsers()
+        if parsers.converters is None:
+            if language_code is not None and language_code != self.language_code:
+                raise ValueError(f"Unsupported language: {language_code}")
+            language_code, exact_parser = self.language_code, parsers.exact
+        elif language_code is None:
+            raise ValueError("The language to add words to is required when the language is detected")
+        elif language_code in parsers.converters:
+            exact_parser = parsers.converters[language_code][0]
+        else:
+            raise ValueError(f"Unsupported language: {language_code}")
+
+        self.vocabulary_registry.add_words(language_code, exact_parser.matcher.vocabulary, category, words)
+        # This instance updates its indexes now rather than in its next parse.
+        self._current_parsers()
+
+    def _current_parsers(self) -> _Parsers:
+        """The parsers to parse with, switched to the vocabularies published in the registry since they were built."""
+        parsers = self._parsers
+        if parsers.version != self.vocabulary_registry.version:
+            parsers = self._switch_to_published_vocabularies()
+        return parsers
+
+    def _switch_to_published_vocabularies(self) -> _Parsers:
+        """Replaces the parsers with copies that use the vocabularies published in the registry, updating their indexes."""
+        with _switch_lock:
+            parsers = self._parsers
+            # The version is read first, so that a vocabulary published meanwhile makes the next parse switch again.
+            version = self.vocabulary_registry.version
+            if parsers.version == version:
+                return parsers
+
+            converters = dict(parsers.converters or {self.language_code: (parsers.exact, parsers.fuzzy)})
+            language_detector = parsers.language_detector
+            for code, (exact_parser, fuzzy_parser) in converters.items():
+                vocabulary = self.vocabulary_registry.vocabulary(code)
+                if vocabulary is None or vocabulary is exact_parser.matcher.vocabulary:
+                    continue
+
+                exact_parser = exact_parser.extended(vocabulary)
+                fuzzy_parser = fuzzy_parser.extended(vocabulary) if fuzzy_parser else None
+                converters[code] = exact_parser, fuzzy_parser
+                if language_detector:
+                    language_detector = language_detector.extended(code, (fuzzy_parser or exact_parser).matcher)
+
+            if parsers.converters is None:
+                self._parsers = _Parsers(*converters[self.language_code], version=version)
+            else:
+                self._parsers = _Parsers(
+                    *next(iter(converters.values())), converters, language_detector, version
+                )
+            return self._parsers
+
+    def parse(self, text: str, budget: Optional[ParseBudget] = None) -> Optional[float]:
         """
         Parses a number from the given text representation.
 
         :param text: A text representation of a number.
+        :param budget: Limits on the work of this parse, instead of the instance's budget.
         :return: The numerical value of the text representation or None if parsing fails.
+        :raises ParseBudgetExceeded: If the parse exceeds a limit of its budget.
+        """
+        return self.parse_tokens(self.exact_converter.tokenizer.tokenize(text), budget)
+
+    def parse_tokens(
+        self, tokens: Sequence[str], budget: Optional[ParseBudget] = None
+    ) -> Optional[float]:
         """
-        result = self.exact_converter.parse(text)
-        if result or not self.fuzzy_converter:
+        Parses a number from text that has already been tokenized and lowercased, skipping tokenization.
+        The given sequence is never modified.
+
+        :param tokens: Lowercase tokens of a text representation, as produced by SimpleTokenizer.
+        :param budget: Limits on the work of this parse, instead of the instance's budget.
+        :return: The numerical value of the tokens or None if parsing fails.
+        :raises ParseBudgetExceeded: If the parse exceeds a limit of its budget.
+        """
+        budget = budget or self.budget
+        if budget:
+            return self._parse_within_budget(tokens, budget)
+
+        # The parsers are read once, so that the whole parse uses the same vocabulary even if words are being added.
+        parsers = self._current_parsers()
+        exact_converter, fuzzy_converter = parsers.exact, parsers.fuzzy
+
+        if parsers.language_detector:
+            language_code = parsers.language_detector.detect_words(tokens)
+            if language_code is None:
+                return None
+            exact_converter, fuzzy_converter = parsers.converters[language_code]
+
+        result = exact_converter.parse_tokens(tokens)
+        if result or not fuzzy_converter:
+            return result
+
+        return fuzzy_converter.parse_tokens(tokens)
+
+    def _parse_within_budget(self, tokens: Sequence[str], budget: ParseBudget) -> Optional[float]:
+        """Parses a number like the parse_tokens method, using metered copies of the parsers that enforce the budget."""
+        meter = budget.start()
+        parsers = self._current_parsers()
+        exact_converter, fuzzy_converter = parsers.exact, parsers.fuzzy
+
+        if parsers.language_detector:
+            meter.check_tokens(tokens)
+            language_code = meter.metered_detector(parsers.language_detector).detect_words(tokens)
+            if language_code is None:
+                return None
+            exact_converter, fuzzy_converter = parsers.converters[language_code]
+
+        result = meter.metered(exact_converter).parse_tokens(tokens)
+        if result or not fuzzy_converter:
             return result
 
-        return self.fuzzy_converter.parse(text)
+        return meter.metered(fuzzy_converter).parse_tokens(tokens)
+
+    def parse_nbest(
+        self, hypotheses: Iterable[str], budget: Optional[ParseBudget] = None
+    ) -> List[Reading]:
+        """
+        Parses the alternative transcripts of one utterance, such as the n-best hypotheses of a speech recognizer.
+        Each distinct word is matched once for all hypotheses, and each part the hypotheses are split into on units
+        is parsed once, so the more words they share, the less each one costs. Each value is the one the parse method
+        returns, together with a confidence from 0 to 100: the mean over the hypothesis's words of how well each matches
+        the vocabulary word it was read as, which is 100 for hypotheses the exact parser parses and 0 for hypotheses
+        without a value. Pick the best reading with `max(readings, key=lambda reading: reading.confidence)`.
+
+        :param hypotheses: Alternative text representations of one number.
+        :param budget: Limits on the work of all hypotheses together, instead of the instance's budget.
+        :return: The text, value and confidence of each hypothesis, in the order they were given.
+        :raises ParseBudgetExceeded: If parsing the hypotheses exceeds a limit of the budget.
+        """
+        budget = budget or self.budget
+        # The parsers are read once, so that every hypothesis is parsed with the same vocabulary.
+        parsers = self._current_parsers()
+        return NBestParser(
+            parsers.exact,
+            parsers.fuzzy,
+            parsers.converters,
+            parsers.language_detector,
+            budget.start() if budget else None,
+        ).parse(hypotheses)
+
+    def trace(self, text: str) -> ParseTrace:
+        """
+        Parses a number like the parse method, recording how the parse went: the tokens, the timing of each stage,
+        every match decision with its fuzzy scores and where the phrase was split on units.
+        Tracing is much slower than parsing, so use it to explain individual results, not in bulk.
+
+        :param text: A text representation of a number.
+        :return: The trace of the parse, whose value is the result of the parse method.
+        """
+        start = perf_counter()
+        trace = ParseTrace(text)
+        parsers = self._current_parsers()
+        exact_converter, fuzzy_converter = parsers.exact, parsers.fuzzy
+
+        with trace.stage("tokenize") as recorder:
+            trace.tokens = recorder.stage.value = exact_converter.tokenizer.tokenize(text)
+
+        if parsers.language_detector:
+            with trace.stage("detect") as recorder:
+                trace.language_code = recorder.stage.value = recorder.traced_detector(
+                    parsers.language_detector
+                ).detect_words(trace.tokens)
+            if trace.language_code is not None:
+                exact_converter, fuzzy_converter = parsers.converters[trace.language_code]
+
+        if not parsers.language_detector or trace.language_code is not None:
+            with trace.stage("exact") as recorder:
+                trace.value = recorder.stage.value = recorder.traced(exact_converter).parse_tokens(trace.tokens)
+
+            if not trace.value and fuzzy_converter:
+                with trace.stage("fuzzy") as recorder:
+                    trace.value = recorder.stage.value = recorder.traced(fuzzy_converter).parse_tokens(trace.tokens)
+
+        trace.seconds = perf_counter() - start
+        return trace
+
+    def incremental(self) -> IncrementalParser:
+        """
+        Creates a parser that parses a phrase one word at a time, returning the current value after each word.
+        Incremental parsers hold the state of a single phrase, so create one per phrase or thread.
+
+        :return: An incremental parser that gives the same results as this instance's parse method.
+        """
+        parsers = self._current_parsers()
+        if parsers.language_detector:
+            raise ValueError("Incremental parsing requires a fixed language")
+
+        return IncrementalParser(parsers.exact, parsers.fuzzy)
+
+    def parse_many(
+        self,
+        texts: Iterable[str],
+        processes: Optional[int] = None,
+        threads: Optional[int] = None,
+    ) -> List[Optional[float]]:
+        """
+        Parses numbers from many text representations at once.
+        Each distinct text is only parsed once, no matter how often it is repeated.
+
+        :param texts: Text representations of numbers.
+        :param processes: Number of worker processes to spread the distinct texts across (default: parse in the current process).
+        :param threads: Number of threads sharing this instance to spread the distinct texts across (default: parse in the calling thread).
+        :return: The numerical values of the text representations, in order, with None where parsing fails.
+        :raises ParseBudgetExceeded: If parsing one of the texts exceeds the instance's budget.
+        """
+        return self._parse_distinct(list(texts), self.parse, _parse_in_worker, processes, threads)
+
+    def parse_many_tokens(
+        self,
+        token_sequences: Iterable[Sequence[str]],
+        processes: Optional[int] = None,
+        threads: Optional[int] = None,
+    ) -> List[Optional[float]]:
+        """
+        Parses numbers from many already tokenized, lowercase text representations at once, skipping tokenization.
+        Each distinct token sequence is only parsed once, no matter how often it is repeated.
+
+        :param token_sequences: Lowercase tokens of text representations, as produced by SimpleTokenizer.
+        :param processes: Number of worker processes to spread the distinct sequences across (default: parse in the current process).
+        :param threads: Number of threads sharing this instance to spread the distinct sequences across (default: parse in the calling thread).
+        :return: The numerical values of the token sequences, in order, with None where parsing fails.
+        :raises ParseBudgetExceeded: If parsing one of the sequences exceeds the instance's budget.
+        """
+        # Sequences are compared as tuples to find the distinct ones.
+        token_sequences = [tuple(tokens) for tokens in token_sequences]
+        return self._parse_distinct(
+            token_sequences, self.parse_tokens, _parse_tokens_in_worker, processes, threads
+        )
+
+    def _parse_distinct(
+        self,
+        inputs: list,
+        parse: Callable,
+        parse_in_worker: Callable,
+        processes: Optional[int],
+        threads: Optional[int],
+    ) -> List[Optional[float]]:
+        """Parses each distinct input once with the given function, in the current process, worker processes or threads."""
+        if processes and threads:
+            raise ValueError("Use either worker processes or threads, not both")
+
+        distinct_inputs = list(dict.fromkeys(inputs))
+
+        if processes and processes > 1 and len(distinct_inputs) > 1:
+            values = self._parse_in_processes(distinct_inputs, processes, parse_in_worker)
+        elif threads and threads > 1 and len(distinct_inputs) > 1:
+            values = self._parse_in_threads(distinct_inputs, threads, parse)
+        else:
+            values = [parse(item) for item in distinct_inputs]
+
+        values_by_input = dict(zip(distinct_inputs, values))
+        return [values_by_input[item] for item in inputs]
+
+    def _parse_in_processes(
+        self, inputs: list, processes: int, parse_in_worker: Callable
+    ) -> List[Optional[float]]:
+        """Parses the given inputs in a pool of worker processes that each hold a copy of this instance."""
+        chunksize = max(1, len(inputs) // (processes * 4))
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_initialize_worker,
+            initargs=(self,),
+        ) as executor:
+            return list(executor.map(parse_in_worker, inputs, chunksize=chunksize))
+
+    def _parse_in_threads(
+        self, inputs: list, threads: int, parse: Callable
+    ) -> List[Optional[float]]:
+        """Parses the given inputs in a pool of threads that all share this instance."""
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(parse, inputs))
 
     def __str__(self) -> str:
         return str(self.exact_converter)
@@ -45,6 +562,28 @@ class Word2Num:
         return repr(self.exact_converter)
 
 
+# Serializes switching to published vocabularies, so that instances switch once however many threads parse with them.
+_switch_lock = Lock()
+
+_worker_instance: Optional[Word2Num] = None
+
+
+def _initialize_worker(instance: Word2Num) -> None:
+    """Stores the Word2Num instance that a worker process parses with."""
+    global _worker_instance
+    _worker_instance = instance
+
+
+def _parse_in_worker(text: str) -> Optional[float]:
+    """Parses a single text in a worker process."""
+    return _worker_instance.parse(text)
+
+
+def _parse_tokens_in_worker(tokens: Sequence[str]) -> Optional[float]:
+    """Parses a single token sequence in a worker process."""
+    return _worker_instance.parse_tokens(tokens)
+
+
 def word2num(text: str, language_code: str = "en", fuzzy_threshold: int = 80) -> Optional[float]:
     """
     Converts a text representation of a number to its numerical value.
@@ -1,2 +1,10 @@
+from .aliases import AliasTable
+from .match_memo import MatchMemo
+from .phonetic import PhoneticIndex
+from .prefilter import VocabularyPrefilter
+from .score_cache import RankedScoreCache, shared_score_cache
+from .scorers import BitParallelScorer, RapidFuzzScorer, Scorer, TheFuzzScorer
 from .vocabulary import Vocabulary
+from .vocabulary_registry import VocabularyRegistry, shared_vocabulary_registry
+from .vocabulary_snapshot import VocabularySnapshot
 from .word_matcher import WordMatcher
@@ -0,0 +1,201 @@
+import json
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Number of times a misspelling has to be matched to the same word before it becomes an alias.
+DEFAULT_MIN_COUNT = 5
+# Fuzzy score a misspelling has to match its word with before it becomes an alias.
+DEFAULT_MIN_SCORE = 85
+# Number of misspellings whose matches are counted before the counts decay.
+MAX_TRACKED_MATCHES = 4096
+# Number of aliases the table keeps, beyond which it stops promoting matches.
+MAX_ALIASES = 65536
+
+_NO_ALIASES: Dict[str, Tuple[str, int]] = {}
+
+
+class AliasTable:
+    """
+    Learns the misspellings that keep being fuzzy matched to the same vocabulary word, such as "fourty" or "ninty",
+    and promotes them to aliases, which a matcher looks up as exactly as a vocabulary word instead of scanning
+    the vocabulary again. The aliases of a language can be saved and loaded at startup.
+
+    Matches are counted per vocabulary category in a bounded table: when it is full, every count is halved
+    and the misspellings that drop to zero are forgotten, so rare misspellings make way for frequent ones.
+    A misspelling becomes an alias once it has been matched `min_count` times with a score of at least `min_score`.
+    Each alias keeps its score, so a matcher only uses it if the score reaches the matcher's fuzzy threshold.
+
+    The best fuzzy match of a word in a category only depends on the words of the category, so a matcher
+    that learns aliases gives the same results as one that doesn't. Aliases that are loaded are trusted as they are.
+    Lookups don't lock, and counting is serialized, so a table is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        min_count: int = DEFAULT_MIN_COUNT,
+        min_score: int = DEFAULT_MIN_SCORE,
+        max_tracked: int = MAX_TRACKED_MATCHES,
+        max_aliases: int = MAX_ALIASES,
+    ):
+        """
+        :param min_count: Number of times a misspelling has to be matched to the same word before it becomes an alias.
+        :param min_score: Fuzzy score a match needs for it to count towards an alias.
+        :param max_tracked: Number of misspellings whose matches are counted before the counts decay.
+        :param max_aliases: Number of aliases the table keeps, beyond which it stops promoting matches.
+        """
+        if min_count < 1 or max_tracked < 1:
+            raise ValueError("The minimum count and the number of tracked matches must be positive")
+        self.min_count = min_count
+        self.min_score = min_score
+        self.max_tracked = max_tracked
+        self.max_aliases = max_aliases
+        # Aliases of each category, which map a misspelling to its vocabulary word and their fuzzy score.
+        self._aliases: Dict[str, Dict[str, Tuple[str, int]]] = {}
+        self._alias_count = 0
+        # Counts of the matches of misspellings that aren't aliases yet, keyed by category, misspelling and match.
+        self._counts: Dict[Tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Aliases are kept when the table is pickled, such as for worker processes, and counts start over.
+        return type(self).from_dict, (self.to_dict(),)
+
+    def __len__(self) -> int:
+        """The number of aliases in the table."""
+        return self._alias_count
+
+    def lookup(self, category: str, word: str, fuzzy_threshold: float) -> Optional[str]:
+        """
+        Looks up the vocabulary word a misspelling is an alias of.
+
+        :param category: Name of the vocabulary category the word is matched in.
+        :param word: The misspelling.
+        :param fuzzy_threshold: The fuzzy threshold of the matcher looking it up.
+        :return: The vocabulary word, or None if the word isn't an alias in the category at the threshold.
+        """
+        return self.lookup_with_score(category, word, fuzzy_threshold)[0]
+
+    def lookup_with_score(self, category: str, word: str, fuzzy_threshold: float) -> Tuple[Optional[str], int]:
+        """
+        Looks up the vocabulary word a misspelling is an alias of like `lookup`, together with their fuzzy score.
+
+        :param category: Name of the vocabulary category the word is matched in.
+        :param word: The misspelling.
+        :param fuzzy_threshold: The fuzzy threshold of the matcher looking it up.
+        :return: The vocabulary word and the score, or None and 0 if the word isn't an alias in the category at the threshold.
+        """
+        alias = self._aliases.get(category, _NO_ALIASES).get(word)
+        if alias is not None and alias[1] >= fuzzy_threshold:
+            return alias
+        return None, 0
+
+    def record(self, category: str, word: str, match: str, score: int) -> None:
+        """
+        Counts a fuzzy match of a misspelling, promoting it to an alias once it has been matched often enough.
+
+        :param category: Name of the vocabulary category the word was matched in.
+        :param word: The misspelling.
+        :param match: The vocabulary word it was matched to.
+        :param score: The fuzzy score of the match.
+        """
+        if score < self.min_score:
+            return
+
+        key = (category, word, match)
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            if count >= self.min_count:
+                self._counts.pop(key, None)
+                self._promote(category, word, match, score)
+                return
+
+            if count == 1 and len(self._counts) >= self.max_tracked:
+                self._decay()
+            self._counts[key] = count
+
+    def _promote(self, category: str, word: str, match: str, score: int) -> None:
+        """Makes a misspelling an alias, replacing the category's aliases so that lookups never see a dictionary change."""
+        aliases = self._aliases.get(category, _NO_ALIASES)
+        if word not in aliases:
+            if self._alias_count >= self.max_aliases:
+                return
+            self._alias_count += 1
+        self._aliases = {**self._aliases, category: {**aliases, word: (match, score)}}
+
+    def _decay(self) -> None:
+        """Halves every count and forgets the misspellings whose counts drop to zero."""
+        self._counts = {key: count // 2 for key, count in self._counts.items() if count > 1}
+
+    def without(self, categories: Iterable[str]) -> "AliasTable":
+        """
+        Creates a copy of the table without the aliases and counts of some categories,
+        such as those whose words changed so that misspellings may now match other words.
+
+        :param categories: Names of the vocabulary categories to leave out.
+        :return: The copy of the table.
+        """
+        categories = set(categories)
+        table = type(self)(self.min_count, self.min_score, self.max_tracked, self.max_aliases)
+        with self._lock:
+            table._aliases = {
+                category: aliases for category, aliases in self._aliases.items() if category not in categories
+            }
+            table._counts = {key: count for key, count in self._counts.items() if key[0] not in categories}
+        table._alias_count = sum(len(aliases) for aliases in table._aliases.values())
+        return table
+
+    def clear(self) -> None:
+        """Forgets every alias and count."""
+        with self._lock:
+            self._aliases = {}
+            self._alias_count = 0
+            self._counts = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exports the table's settings and aliases as a JSON-serializable dictionary."""
+        return {
+            "min_count": self.min_count,
+            "min_score": self.min_score,
+            "max_tracked": self.max_tracked,
+            "max_aliases": self.max_aliases,
+            "aliases": {
+                category: {word: list(alias) for word, alias in aliases.items()}
+                for category, aliases in self._aliases.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AliasTable":
+        """
+        Creates a table from a dictionary exported by `to_dict`.
+
+        :param data: The exported table.
+        :return: The table, with the exported aliases and no counts.
+        """
+        table = cls(data["min_count"], data["min_score"], data["max_tracked"], data["max_aliases"])
+        table._aliases = {
+            category: {word: (match, score) for word, (match, score) in aliases.items()}
+            for category, aliases in data["aliases"].items()
+        }
+        table._alias_count = sum(len(aliases) for aliases in table._aliases.values())
+        return table
+
+    def save(self, path: str) -> None:
+        """
+        Saves the table's settings and aliases to a JSON file.
+
+        :param path: Path of the file to write.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path: str) -> "AliasTable":
+        """
+        Loads a table saved with `save`.
+
+        :param path: Path of the file to read.
+        :return: The table, with the saved aliases and no counts.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,68 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# A match decision: the matched word, or None, and its fuzzy score.
+Decision = Tuple[Optional[str], int]
+
+
+class MatchMemo:
+    """
+    Remembers the fuzzy match decisions of a matcher for a batch of related phrases, such as the n-best hypotheses
+    of one utterance, so that a word is fuzzy matched against each vocabulary category once for the whole batch.
+    It also keeps the best score each word of the phrases was fuzzy matched with.
+
+    A matcher uses a memo when one is set as its `match_memo`, which is only done on a copy of the matcher made for
+    the batch. A memo holds the decisions of one batch, so it is not shared between threads.
+    """
+
+    def __init__(self):
+        # Decisions keyed by the word and its vocabulary category, or the words of the phrase it was matched in.
+        self._decisions: Dict[Tuple[str, object], Decision] = {}
+        self._denominators: Dict[str, Optional[float]] = {}
+        # Best fuzzy score of each word of the phrases that was matched to a vocabulary word other than itself.
+        self.best_scores: Dict[str, int] = {}
+
+    def decide(
+        self,
+        word: str,
+        iterable: Iterable[str],
+        category: Optional[str],
+        match_fuzzily: Callable[[str, Iterable[str], Optional[str]], Decision],
+    ) -> Decision:
+        """
+        Looks up the fuzzy match decision of a word, making it with `match_fuzzily` the first time.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :param category: Name of the vocabulary category the iterable holds, or None if the iterable holds
+            the words of a phrase, as in the search for units, where the match is a word of the phrase.
+        :param match_fuzzily: The matcher's fuzzy match of a word that isn't in the iterable.
+        :return: The match, or None, and its fuzzy score.
+        """
+        key = (word, category if category is not None else tuple(iterable))
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = self._decisions[key] = match_fuzzily(word, iterable, category)
+            match, score = decision
+            if match is not None and match != word:
+                self.record_score(match if category is None else word, score)
+        return decision
+
+    def denominator(self, word: str, score_denominator: Callable[[str], Tuple[Optional[float], int]]) -> Optional[float]:
+        """
+        Looks up the denominator value of a word, matching it with `score_denominator` the first time.
+
+        :param word: The word to match.
+        :param score_denominator: The matcher's denominator match, which returns the value and its fuzzy score.
+        :return: The denominator value, or None.
+        """
+        if word not in self._denominators:
+            value, score = score_denominator(word)
+            self._denominators[word] = value
+            if value is not None:
+                self.record_score(word, score)
+        return self._denominators[word]
+
+    def record_score(self, word: str, score: int) -> None:
+        """Keeps the fuzzy score of a word of a phrase if it is the best one so far."""
+        if score > self.best_scores.get(word, -1):
+            self.best_scores[word] = score
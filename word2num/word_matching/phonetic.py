@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, List, Tuple
+
+
+class PhoneticIndex:
+    """
+    Groups the words of a vocabulary into blocks of words with the same phonetic key, so that a misheard word,
+    such as "ate" in a speech transcript, maps straight to the few vocabulary words that sound like it ("eight").
+
+    The index is only read after it has been built, so it is safe to share between threads.
+    """
+
+    def __init__(self, keyed_words: Iterable[Tuple[str, str]]):
+        """
+        :param keyed_words: Pairs of a vocabulary word and its phonetic key. Words with an empty key are left out.
+        """
+        self._blocks: Dict[str, List[str]] = {}
+        for word, key in keyed_words:
+            if key:
+                block = self._blocks.setdefault(key, [])
+                if word not in block:
+                    block.append(word)
+
+    def updated(
+        self, keyed_words: Iterable[Tuple[str, str]], positions: Dict[str, int]
+    ) -> "PhoneticIndex":
+        """
+        Creates an index of a changed vocabulary, which shares the blocks the changed words aren't in with this index.
+        The blocks of the changed words are kept in vocabulary order, and lose the words that are no longer in the vocabulary.
+
+        :param keyed_words: Pairs of a word that was added to or removed from the vocabulary and its phonetic key.
+        :param positions: The position of each word of the changed vocabulary in vocabulary order.
+        :return: The updated index.
+        """
+        index = PhoneticIndex(())
+        index._blocks = dict(self._blocks)
+        for word, key in keyed_words:
+            if key:
+                words = {*index._blocks.get(key, ()), word}
+                block = sorted((word for word in words if word in positions), key=positions.__getitem__)
+                if block:
+                    index._blocks[key] = block
+                else:
+                    index._blocks.pop(key, None)
+        return index
+
+    def block(self, key: str) -> List[str]:
+        """
+        Finds the vocabulary words with the given phonetic key.
+
+        :param key: Phonetic key of a word.
+        :return: The vocabulary words with the key, in vocabulary order, or an empty list if there are none.
+        """
+        return self._blocks.get(key, []) if key else []
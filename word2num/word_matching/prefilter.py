@@ -0,0 +1,270 @@
+import copy
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Number of token verdicts remembered before the memo is cleared.
+MAX_REMEMBERED_TOKENS = 8192
+
+
+class VocabularyPrefilter:
+    """
+    Cheaply rules out tokens that can't reach a fuzzy threshold against any word of a vocabulary,
+    so that text which can't be a number is rejected before any fuzzy scores are calculated.
+
+    The fuzzy score of two words is 200 * L / (len(a) + len(b)), rounded, where L is the length of their
+    longest common subsequence. L can't exceed the length of the shorter word, nor the number of characters
+    the two words have in common. The prefilter compares tokens against those upper bounds using word lengths
+    and character count signatures, so it never rejects a token that could have matched.
+
+    A signature stores the count of each character in unary, in a fixed-width bit field per character,
+    so the number of characters two words have in common is the popcount of their signatures' intersection.
+
+    Verdicts are remembered for a bounded number of recent tokens. The memo is only ever replaced or extended
+    with verdicts that are the same for every thread, so the prefilter is safe to share between threads.
+    """
+
+    # Token verdicts returned by `classify`.
+    REJECTED = 0
+    ACCEPTED = 1
+    DENOMINATOR = 2
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        denominator_words: Iterable[str],
+        fuzzy_threshold: float,
+    ):
+        """
+        :param words: Every word of the vocabulary, in any category.
+        :param denominator_words: The denominator forms of the vocabulary, both regular and irregular.
+        :param fuzzy_threshold: The minimum fuzzy score of a match.
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.words = frozenset(words)
+        self.denominator_words = frozenset(denominator_words)
+
+        all_words = self.words | self.denominator_words
+        characters = sorted({character for word in all_words for character in word})
+        self._field_width = max(
+            (word.count(character) for word in all_words for character in set(word)),
+            default=1,
+        )
+        self._field_offsets = {
+            character: i * self._field_width for i, character in enumerate(characters)
+        }
+
+        self._words_by_length = self._index_by_length(all_words)
+        self._denominators_by_length = self._index_by_length(self.denominator_words)
+        self._verdicts: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the prefilter's index, independent of its fuzzy threshold, as plain data."""
+        return {
+            "words": sorted(self.words),
+            "denominator_words": sorted(self.denominator_words),
+            "field_width": self._field_width,
+            "field_offsets": self._field_offsets,
+            "words_by_length": self._words_by_length,
+            "denominators_by_length": self._denominators_by_length,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], fuzzy_threshold: float) -> "VocabularyPrefilter":
+        """
+        Restores a prefilter from the plain data returned by `to_dict`, without rebuilding its index.
+
+        :param data: The prefilter's index as plain data.
+        :param fuzzy_threshold: The minimum fuzzy score of a match.
+        :return: The restored prefilter.
+        """
+        prefilter = cls.__new__(cls)
+        prefilter.fuzzy_threshold = fuzzy_threshold
+        prefilter.words = frozenset(data["words"])
+        prefilter.denominator_words = frozenset(data["denominator_words"])
+        prefilter._field_width = data["field_width"]
+        prefilter._field_offsets = dict(data["field_offsets"])
+        prefilter._words_by_length = [
+            (length, list(signatures)) for length, signatures in data["words_by_length"]
+        ]
+        prefilter._denominators_by_length = [
+            (length, list(signatures))
+            for length, signatures in data["denominators_by_length"]
+        ]
+        prefilter._verdicts = {}
+        return prefilter
+
+    def extended(
+        self, words: Iterable[str], denominator_words: Iterable[str]
+    ) -> "VocabularyPrefilter":
+        """
+        Creates a prefilter that also accepts tokens which could match the given extra words.
+        Only the signatures of the extra words are calculated, and only the remembered verdicts of tokens
+        that could match them are changed. The index is rebuilt only if an extra word repeats a character
+        more often than any word so far, since that widens every signature.
+
+        :param words: Extra words of the vocabulary, in any category.
+        :param denominator_words: Extra denominator forms of the vocabulary.
+        :return: The extended prefilter, which shares the unchanged parts of this prefilter's index.
+        """
+        new_words = frozenset(words) - self.words
+        new_denominator_words = frozenset(denominator_words) - self.denominator_words
+        new_all_words = new_words | new_denominator_words
+
+        field_width = max(
+            (word.count(character) for word in new_all_words for character in set(word)),
+            default=1,
+        )
+        if field_width > self._field_width:
+            prefilter = VocabularyPrefilter(
+                self.words | new_words, self.denominator_words | new_denominator_words, self.fuzzy_threshold
+            )
+            prefilter._verdicts = {
+                token: prefilter.classify(token) for token in self._verdicts
+            }
+            return prefilter
+
+        prefilter = copy.copy(self)
+        prefilter.words = self.words | new_words
+        prefilter.denominator_words = self.denominator_words | new_denominator_words
+        prefilter._field_offsets = dict(self._field_offsets)
+        for character in sorted({character for word in new_all_words for character in word}):
+            if character not in prefilter._field_offsets:
+                prefilter._field_offsets[character] = len(prefilter._field_offsets) * self._field_width
+
+        new_words_index = prefilter._index_by_length(new_all_words - self.words - self.denominator_words)
+        new_denominators_index = prefilter._index_by_length(new_denominator_words)
+        prefilter._words_by_length = self._merge_indexes(self._words_by_length, new_words_index)
+        prefilter._denominators_by_length = self._merge_indexes(
+            self._denominators_by_length, new_denominators_index
+        )
+
+        # More words can only turn rejected tokens into accepted ones, and accepted ones into denominators.
+        prefilter._verdicts = {}
+        for token, verdict in self._verdicts.items():
+            if verdict != self.DENOMINATOR and prefilter._may_match_any(
+                token, new_denominator_words, new_denominators_index, plural=True
+            ):
+                verdict = self.DENOMINATOR
+            elif verdict == self.REJECTED and prefilter._may_match_any(
+                token, new_all_words, new_words_index
+            ):
+                verdict = self.ACCEPTED
+            prefilter._verdicts[token] = verdict
+        return prefilter
+
+    @staticmethod
+    def _merge_indexes(
+        index: List[Tuple[int, List[int]]], other: List[Tuple[int, List[int]]]
+    ) -> List[Tuple[int, List[int]]]:
+        """Merges two indexes of signatures by word length, copying only the signature lists of the lengths both have."""
+        merged = dict(index)
+        for length, signatures in other:
+            merged[length] = [*merged.get(length, ()), *signatures]
+        return sorted(merged.items())
+
+    def _may_match_any(
+        self,
+        token: str,
+        words: frozenset,
+        index: List[Tuple[int, List[int]]],
+        plural: bool = False,
+    ) -> bool:
+        """Checks if the token, or its singular form if plurals count, could match any of the given words."""
+        tokens = (token, token.rstrip("s")) if plural else (token,)
+        return any(
+            token in words or self._may_reach_threshold(token, index) for token in tokens
+        )
+
+    def classify(self, token: str) -> int:
+        """
+        Classifies a token by whether it could match a word of the vocabulary.
+
+        :param token: Token to classify.
+        :return: DENOMINATOR if the token could be a denominator, ACCEPTED if it could match any other word, else REJECTED.
+        """
+        verdict = self._verdicts.get(token)
+        if verdict is None:
+            if self.may_match_denominator(token):
+                verdict = self.DENOMINATOR
+            elif self.may_match(token):
+                verdict = self.ACCEPTED
+            else:
+                verdict = self.REJECTED
+
+            if len(self._verdicts) >= MAX_REMEMBERED_TOKENS:
+                self._verdicts = {}
+            self._verdicts[token] = verdict
+
+        return verdict
+
+    def _signature(self, word: str) -> int:
+        """Encodes the character counts of a word, ignoring characters that no vocabulary word contains."""
+        signature = 0
+        counts: Dict[str, int] = {}
+        for character in word:
+            offset = self._field_offsets.get(character)
+            if offset is None:
+                continue
+            count = counts.get(character, 0)
+            if count < self._field_width:
+                signature |= 1 << (offset + count)
+                counts[character] = count + 1
+        return signature
+
+    def _index_by_length(self, words: Iterable[str]) -> List[Tuple[int, List[int]]]:
+        """Groups the signatures of the words by word length."""
+        index: Dict[int, List[int]] = {}
+        for word in words:
+            index.setdefault(len(word), []).append(self._signature(word))
+        return sorted(index.items())
+
+    def may_match(self, token: str) -> bool:
+        """
+        Checks if the token could reach the fuzzy threshold against any word of the vocabulary.
+
+        :param token: Token to check.
+        :return: False if the token certainly doesn't match any word, else True.
+        """
+        if token in self.words or token in self.denominator_words:
+            return True
+        return self._may_reach_threshold(token, self._words_by_length)
+
+    def may_match_denominator(self, token: str) -> bool:
+        """
+        Checks if the token could reach the fuzzy threshold against any denominator form, in singular or plural.
+
+        :param token: Token to check.
+        :return: False if the token certainly isn't a denominator, else True.
+        """
+        singular_token = token.rstrip("s")
+        if token in self.denominator_words or singular_token in self.denominator_words:
+            return True
+        return self._may_reach_threshold(
+            token, self._denominators_by_length
+        ) or self._may_reach_threshold(singular_token, self._denominators_by_length)
+
+    def _may_reach_threshold(
+        self, token: str, index: List[Tuple[int, List[int]]]
+    ) -> bool:
+        """Checks the upper bound of the token's fuzzy score against each indexed word."""
+        if not token:
+            return False
+
+        token_length = len(token)
+        token_signature = None
+        # A rounded score reaches the threshold once the unrounded score is within half a point of it,
+        # i.e. once 400 * L >= (2 * threshold - 1) * (len(a) + len(b)).
+        threshold_factor = 2 * self.fuzzy_threshold - 1
+
+        for length, signatures in index:
+            required = threshold_factor * (token_length + length)
+            if 400 * min(token_length, length) < required:
+                continue
+
+            if token_signature is None:
+                token_signature = self._signature(token)
+
+            for signature in signatures:
+                if 400 * bin(token_signature & signature).count("1") >= required:
+                    return True
+
+        return False
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .scorers import Scorer
+
+# Number of rankings the cache keeps before it starts over.
+MAX_CACHED_RANKINGS = 65536
+
+
+@dataclass(frozen=True)
+class Ranking:
+    """The fuzzy scores of a word against a set of candidate words, best first."""
+
+    # Candidates that score more than 0 and their scores, in decreasing order of score,
+    # candidates with equal scores in the order they were given.
+    scores: Tuple[Tuple[str, int], ...]
+
+    def best_match(self, threshold: float) -> Optional[Tuple[str, int]]:
+        """
+        Finds the best candidate, which is the first one with the highest score, if its score reaches the threshold.
+
+        :param threshold: The minimum score of a match.
+        :return: The best candidate and its score, or None if no candidate reaches the threshold.
+        """
+        if self.scores and self.scores[0][1] >= threshold:
+            return self.scores[0]
+        return None
+
+
+class RankedScoreCache:
+    """
+    Remembers the ranked fuzzy scores of words against the candidate words of each vocabulary category,
+    so that each word is scored once, however many matchers at however many fuzzy thresholds look it up.
+
+    A ranking holds the score of every candidate, whatever the threshold of the matcher that first needs it,
+    so that it serves matchers at every threshold and a word is never scored twice against the same candidates.
+    Every scorer gives the same scores, so rankings are shared between matchers with different scorers.
+
+    Rankings are never replaced, and the cache is cleared by replacing its dictionary,
+    so it is safe to share between threads.
+    """
+
+    def __init__(self, max_rankings: int = MAX_CACHED_RANKINGS):
+        """
+        :param max_rankings: Number of rankings to keep before the cache starts over.
+        """
+        self.max_rankings = max_rankings
+        self._rankings: Dict[Tuple[str, ...], Dict[str, Ranking]] = {}
+        self._size = 0
+
+    def __reduce__(self):
+        # The process-wide cache stays process-wide when pickled, such as for worker processes, and other caches start empty.
+        if self is shared_score_cache:
+            return "shared_score_cache"
+        return type(self), (self.max_rankings,)
+
+    def __len__(self) -> int:
+        """The number of rankings in the cache."""
+        return sum(len(rankings) for rankings in self._rankings.values())
+
+    def clear(self) -> None:
+        """Forgets every ranking."""
+        self._rankings = {}
+        self._size = 0
+
+    def rank(self, word: str, candidates: Tuple[str, ...], scorer: Scorer) -> Ranking:
+        """
+        Looks up the ranking of a word against the candidates, calculating it if there is none.
+
+        :param word: The word to rank the candidates for.
+        :param candidates: The candidate words, such as the words of one vocabulary category.
+        :param scorer: The scorer to calculate the scores with if the ranking isn't cached.
+        :return: The ranking.
+        """
+        rankings = self._rankings.get(candidates)
+        if rankings is None:
+            rankings = self._rankings.setdefault(candidates, {})
+
+        ranking = rankings.get(word)
+        if ranking is None:
+            if self._size >= self.max_rankings:
+                self.clear()
+                rankings = self._rankings.setdefault(candidates, {})
+            self._size += 1
+            ranking = self._calculate_ranking(word, candidates, scorer)
+            rankings[word] = ranking
+        return ranking
+
+    @staticmethod
+    def _calculate_ranking(word: str, candidates: Tuple[str, ...], scorer: Scorer) -> Ranking:
+        """Scores the word against every candidate."""
+        score = scorer.score
+        scored = []
+        for position, candidate in enumerate(candidates):
+            ratio = score(word, candidate)
+            if ratio:
+                scored.append((-ratio, position, candidate))
+
+        scored.sort()
+        return Ranking(tuple((candidate, -ratio) for ratio, _, candidate in scored))
+
+
+# Cache shared by every matcher in the process that caches scores.
+shared_score_cache = RankedScoreCache()
@@ -0,0 +1,139 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+from thefuzz import fuzz
+
+# Number of strings whose character masks the bit-parallel scorer keeps before it starts over.
+MAX_REMEMBERED_MASKS = 4096
+
+
+def ratio_from_lcs(lcs: int, length_a: int, length_b: int) -> int:
+    """
+    Calculates thefuzz's `ratio` score of two strings from the length of their longest common subsequence,
+    with the same floating-point operations and rounding, so that the scores are identical.
+
+    :param lcs: Length of the longest common subsequence of the strings.
+    :param length_a: Length of the first string.
+    :param length_b: Length of the second string.
+    :return: A score between 0 and 100.
+    """
+    length_sum = length_a + length_b
+    if not length_sum:
+        return 100
+    distance = length_sum - 2 * lcs
+    return int(round(100 * (1.0 - distance / length_sum)))
+
+
+def max_possible_score(length_a: int, length_b: int) -> int:
+    """The highest score two strings of the given lengths can have, which is reached if one contains the other."""
+    return ratio_from_lcs(min(length_a, length_b), length_a, length_b)
+
+
+class Scorer(ABC):
+    """
+    Calculates fuzzy match scores between two strings, from 0 for no similarity to 100 for identical strings.
+    Every scorer gives the same scores as thefuzz's `ratio`, so they only differ in speed.
+
+    Scorers may keep caches, but never anything that changes their scores, so they are safe to share between threads.
+    """
+
+    @abstractmethod
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        """
+        Calculates the fuzzy match score between two strings.
+
+        :param a: First string.
+        :param b: Second string.
+        :param cutoff: Scores below the cutoff are reported as 0, which lets scorers stop early (default: 0).
+        :return: The score between 0 and 100, or 0 if it is below the cutoff.
+        """
+        pass
+
+
+class TheFuzzScorer(Scorer):
+    """Scores strings with thefuzz's `ratio`. This is the default scorer."""
+
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        score = fuzz.ratio(a, b)
+        return score if score >= cutoff else 0
+
+
+class RapidFuzzScorer(Scorer):
+    """Scores strings with rapidfuzz's `ratio`, passing the cutoff on so that hopeless comparisons stop early."""
+
+    def __init__(self):
+        try:
+            from rapidfuzz import fuzz as rapidfuzz_fuzz
+        except ImportError as error:
+            raise ImportError(
+                "The rapidfuzz scorer requires rapidfuzz. Install it with `pip install word2num[rapidfuzz]`."
+            ) from error
+
+        self._ratio = rapidfuzz_fuzz.ratio
+
+    def __getstate__(self):
+        # The rapidfuzz function is imported again when unpickled, such as in worker processes.
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        # Scores that round up to the cutoff are up to half a point below it.
+        score = int(round(self._ratio(a, b, score_cutoff=max(0, cutoff - 1))))
+        return score if score >= cutoff else 0
+
+
+class BitParallelScorer(Scorer):
+    """
+    Scores strings without any native extension, computing the length of their longest common subsequence with
+    a bit-parallel algorithm (Hyyrö, 2004) that handles one character of one string per step for all characters of the other.
+    The character masks of the second string, usually a vocabulary word, are remembered between calls.
+    """
+
+    def __init__(self):
+        self._masks: Dict[str, Dict[str, int]] = {}
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    def score(self, a: str, b: str, cutoff: int = 0) -> int:
+        if max_possible_score(len(a), len(b)) < cutoff:
+            return 0
+
+        score = ratio_from_lcs(self._lcs_length(a, b), len(a), len(b))
+        return score if score >= cutoff else 0
+
+    def _lcs_length(self, a: str, b: str) -> int:
+        """The length of the longest common subsequence of the strings."""
+        if not a or not b:
+            return 0
+
+        masks = self._masks.get(b)
+        if masks is None:
+            masks = {}
+            for position, character in enumerate(b):
+                masks[character] = masks.get(character, 0) | (1 << position)
+            if len(self._masks) >= MAX_REMEMBERED_MASKS:
+                self._masks = {}
+            self._masks[b] = masks
+
+        all_bits = (1 << len(b)) - 1
+        row = all_bits
+        for character in a:
+            matches = row & masks.get(character, 0)
+            row = ((row + matches) | (row - matches)) & all_bits
+
+        # Each zero bit of the row is a character of the longest common subsequence.
+        return len(b) - bin(row).count("1")
+
+
+# Supported scorers, keyed by name.
+scorers = {
+    "thefuzz": TheFuzzScorer,
+    "rapidfuzz": RapidFuzzScorer,
+    "bitparallel": BitParallelScorer,
+}
@@ -0,0 +1,65 @@
+from threading import Lock
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from .vocabulary_snapshot import VocabularySnapshot
+
+
+class VocabularyRegistry:
+    """
+    The vocabularies that words have been added to at runtime, keyed by language code.
+    Every Word2Num instance of a language that uses the registry switches to the language's published vocabulary
+    before its next parse, so words added through one instance are seen by all of them.
+
+    Each publication replaces the dictionary of vocabularies and then increases the version, and instances compare
+    the version with the one their parsers were built for, so that the check costs one attribute read per parse.
+    """
+
+    def __init__(self):
+        # Increased whenever a vocabulary is published.
+        self.version = 0
+        self._vocabularies: Dict[str, VocabularySnapshot] = {}
+        self._lock = Lock()
+
+    def __reduce__(self):
+        # The process-wide registry stays process-wide when pickled, such as for worker processes, and other registries
+        # start empty, since instances keep the vocabularies they have switched to.
+        if self is shared_vocabulary_registry:
+            return "shared_vocabulary_registry"
+        return type(self), ()
+
+    def vocabulary(self, language_code: str) -> Optional[VocabularySnapshot]:
+        """
+        Looks up the published vocabulary of a language.
+
+        :param language_code: The code of the language.
+        :return: The vocabulary, or None if no words have been added to the language.
+        """
+        return self._vocabularies.get(language_code)
+
+    def add_words(
+        self,
+        language_code: str,
+        vocabulary: VocabularySnapshot,
+        category: str,
+        words: Union[Mapping[str, int], Iterable[str]],
+    ) -> VocabularySnapshot:
+        """
+        Publishes a vocabulary of the language with extra words in one category.
+
+        :param language_code: The code of the language.
+        :param vocabulary: The vocabulary to extend if none has been published for the language yet.
+        :param category: Name of the vocabulary category, such as "units".
+        :param words: The words and their values for a category of numbers, or the words for any other category.
+        :return: The published vocabulary.
+        :raises ValueError: If the category doesn't exist, a word isn't a single lowercase word,
+            or a word is already in the category with another value.
+        """
+        with self._lock:
+            vocabulary = self._vocabularies.get(language_code, vocabulary).extended(category, words)
+            self._vocabularies = {**self._vocabularies, language_code: vocabulary}
+            self.version += 1
+        return vocabulary
+
+
+# Registry shared by every Word2Num instance in the process that isn't given another one.
+shared_vocabulary_registry = VocabularyRegistry()
@@ -0,0 +1,130 @@
+from typing import Any, Dict, Iterable, List, Mapping, Union
+
+from word2num.tokenization.simple_tokenizer import TOKEN_PATTERN
+from .vocabulary import Vocabulary
+
+# The vocabulary categories a snapshot holds, in the order they are declared by Vocabulary.
+CATEGORIES = (
+    "digits",
+    "whole_numbers",
+    "units",
+    "irregular_denominators",
+    "fraction_separators",
+    "decimal_separators",
+    "negative_signifiers",
+    "indefinite_articles",
+)
+
+# Categories whose words are mapped to numerical values, rather than listed.
+VALUED_CATEGORIES = CATEGORIES[:4]
+
+# Categories whose words are whole numbers too, as in the vocabularies of every supported language.
+WHOLE_NUMBER_CATEGORIES = ("digits", "units")
+
+
+class VocabularySnapshot(Vocabulary):
+    """
+    Vocabulary whose words are stored rather than defined in code, such as a vocabulary loaded from a language pack.
+    Each category is built once, and the same dictionary or list is returned on every access,
+    so callers must not modify what they get.
+    """
+
+    def __init__(self, categories: Dict[str, Any]):
+        """
+        :param categories: The words of each vocabulary category, keyed by the name of the category.
+        """
+        missing = [category for category in CATEGORIES if category not in categories]
+        if missing:
+            raise ValueError(f"Missing vocabulary categories: {', '.join(missing)}")
+
+        self._categories = {category: categories[category] for category in CATEGORIES}
+
+    @classmethod
+    def of(cls, vocabulary: Vocabulary) -> "VocabularySnapshot":
+        """
+        Takes a snapshot of the current words of a vocabulary.
+
+        :param vocabulary: The vocabulary to take a snapshot of.
+        :return: A vocabulary with the same words.
+        """
+        return cls({category: getattr(vocabulary, category) for category in CATEGORIES})
+
+    def extended(
+        self, category: str, words: Union[Mapping[str, int], Iterable[str]]
+    ) -> "VocabularySnapshot":
+        """
+        Creates a snapshot with extra words in one category, which shares the unchanged categories with this snapshot.
+        Digits and units are whole numbers too, so they are also added to the whole numbers.
+
+        :param category: Name of the category, such as "units".
+        :param words: The words and their values for a category of numbers (such as {"grand": 1000}),
+            or the words for any other category (such as ["below"] for the negative signifiers).
+        :return: The extended snapshot.
+        :raises ValueError: If the category doesn't exist, a word isn't a single lowercase word,
+            or a word is already in the category with another value.
+        """
+        if category not in CATEGORIES:
+            raise ValueError(f"Unsupported vocabulary category: {category}")
+
+        if category in VALUED_CATEGORIES:
+            if not isinstance(words, Mapping):
+                raise ValueError(f"Words of the {category} category must be mapped to their values")
+            words = dict(words)
+        else:
+            if isinstance(words, (str, Mapping)):
+                raise ValueError(f"Words of the {category} category must be given as a list of words")
+            words = dict.fromkeys(words)
+
+        for word in words:
+            if not isinstance(word, str) or word != word.lower() or not TOKEN_PATTERN.fullmatch(word) or word[:1].isdecimal():
+                raise ValueError(f"Not a single lowercase word: {word!r}")
+
+        categories = dict(self._categories)
+        changed_categories = (category, "whole_numbers") if category in WHOLE_NUMBER_CATEGORIES else (category,)
+        for name in changed_categories:
+            existing = categories[name]
+            if name in VALUED_CATEGORIES:
+                conflicts = [word for word, value in words.items() if existing.get(word, value) != value]
+                if conflicts:
+                    raise ValueError(f"Already in the {name} category with another value: {', '.join(conflicts)}")
+                categories[name] = {**existing, **words}
+            else:
+                categories[name] = [*existing, *(word for word in words if word not in existing)]
+
+        return VocabularySnapshot(categories)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the words of each category, keyed by the name of the category."""
+        return dict(self._categories)
+
+    @property
+    def digits(self) -> Dict[str, int]:
+        return self._categories["digits"]
+
+    @property
+    def whole_numbers(self) -> Dict[str, int]:
+        return self._categories["whole_numbers"]
+
+    @property
+    def units(self) -> Dict[str, int]:
+        return self._categories["units"]
+
+    @property
+    def irregular_denominators(self) -> Dict[str, int]:
+        return self._categories["irregular_denominators"]
+
+    @property
+    def fraction_separators(self) -> List[str]:
+        return self._categories["fraction_separators"]
+
+    @property
+    def decimal_separators(self) -> List[str]:
+        return self._categories["decimal_separators"]
+
+    @property
+    def negative_signifiers(self) -> List[str]:
+        return self._categories["negative_signifiers"]
+
+    @property
+    def indefinite_articles(self) -> List[str]:
+        return self._categories["indefinite_articles"]
@@ -1,30 +1,276 @@
+import copy
 from abc import ABC, abstractclassmethod
-from typing import Iterable, Optional
-
-from thefuzz import fuzz
-
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .aliases import AliasTable
+from .match_memo import MatchMemo
+from .phonetic import PhoneticIndex
+from .prefilter import VocabularyPrefilter
+from .score_cache import RankedScoreCache
+from .scorers import Scorer, TheFuzzScorer
 from .vocabulary import Vocabulary
+from .vocabulary_snapshot import CATEGORIES, VocabularySnapshot
 
 
 class WordMatcher(ABC):
     """
     Matches words with different number-related definitions based on a fuzzy threshold
     ranging from 0 to 100, where 0 means no match and 100 means an exact match.
+
+    Matching never changes the matcher's vocabulary, threshold or scorer; words are added to copies made by `extended`.
+    It does write to state that other threads share, none of which changes a match: the indexes are built on first use,
+    and threads that build one at the same time build equal ones, of which one is kept; the prefilter remembers
+    the verdicts of tokens, which are the same for every thread; the score cache only adds rankings;
+    and the alias table counts matches under its own lock. So a matcher is safe to share between threads.
+    The matcher keeps a snapshot of the vocabulary it is given, so that every word lookup reads the same dictionaries
+    instead of building them again.
     """
 
-    def __init__(self, vocabulary: Vocabulary, fuzzy_threshold: float):
-        self.vocabulary = vocabulary
+    def __init__(
+        self,
+        vocabulary: Vocabulary,
+        fuzzy_threshold: float,
+        scorer: Optional[Scorer] = None,
+        phonetic: bool = False,
+        score_cache: Optional[RankedScoreCache] = None,
+        aliases: Optional[AliasTable] = None,
+    ):
+        self.vocabulary = (
+            vocabulary if isinstance(vocabulary, VocabularySnapshot) else VocabularySnapshot.of(vocabulary)
+        )
         self.fuzzy_threshold = fuzzy_threshold
+        self.scorer = scorer or TheFuzzScorer()
+        # Whether fuzzy matching first tries the vocabulary words that sound like the word, as for speech transcripts.
+        self.phonetic = phonetic
+        # Cache of ranked fuzzy scores, which may be shared with matchers at other thresholds, or None to always score.
+        self.score_cache = score_cache
+        # Table that learns the misspellings this matcher keeps matching, and looks them up instead, or None to always match them.
+        self.aliases = aliases
+        # Memo of the fuzzy match decisions of a batch of related phrases, set on a copy of the matcher for the batch.
+        self.match_memo: Optional[MatchMemo] = None
+        self._prefilter = None
+        self._phonetic_index = None
+        self._denominator_forms = None
+        self._units_by_value = None
+        self._unit_words = tuple(self.vocabulary.units)
+
+    def restore_indexes(
+        self,
+        denominator_forms: Dict[str, str],
+        units_by_value: List[str],
+        prefilter: VocabularyPrefilter,
+    ) -> None:
+        """
+        Uses previously built indexes of this matcher's vocabulary, such as those of a language pack, instead of building them.
+
+        :param denominator_forms: Dictionary that maps each whole number word to its denominator form.
+        :param units_by_value: Unit words sorted in decreasing order of their numerical value.
+        :param prefilter: Prefilter of the vocabulary at this matcher's fuzzy threshold.
+        """
+        self._denominator_forms = denominator_forms
+        self._units_by_value = units_by_value
+        self._prefilter = prefilter
+
+    def extended(self, vocabulary: VocabularySnapshot) -> "WordMatcher":
+        """
+        Creates a copy of the matcher for a vocabulary that extends this matcher's vocabulary with extra words,
+        such as one made by `VocabularySnapshot.extended`. The indexes that have been built are updated with
+        the extra words only, sharing what they don't change with this matcher, which is left untouched.
+        Score cache rankings are keyed by the words of a category, so the rankings of unchanged categories stay in use,
+        and so do the aliases of unchanged categories, while those of changed categories are dropped from a copy of the table.
+
+        :param vocabulary: The extended vocabulary.
+        :return: A matcher of the extended vocabulary.
+        """
+        old_vocabulary = self.vocabulary
+        added_words = {
+            category: [
+                word
+                for word in getattr(vocabulary, category)
+                if word not in getattr(old_vocabulary, category)
+            ]
+            for category in CATEGORIES
+        }
+
+        matcher = copy.copy(self)
+        matcher.vocabulary = vocabulary
+        matcher._unit_words = tuple(vocabulary.units)
+        if self.aliases is not None:
+            matcher.aliases = self.aliases.without(category for category, words in added_words.items() if words)
+
+        added_denominator_words = list(added_words["irregular_denominators"])
+        replaced_denominator_words = []
+        if self._denominator_forms is not None:
+            # New whole numbers get denominator forms, and new irregular denominators replace the forms of whole numbers with their value.
+            irregular_denominator_values_to_words = {
+                v: k for k, v in vocabulary.irregular_denominators.items()
+            }
+            new_irregular_values = {
+                vocabulary.irregular_denominators[word] for word in added_words["irregular_denominators"]
+            }
+            affected_words = [*added_words["whole_numbers"], *(
+                word for word, value in vocabulary.whole_numbers.items() if value in new_irregular_values
+            )]
+
+            matcher._denominator_forms = dict(self._denominator_forms)
+            for word in affected_words:
+                value = vocabulary.whole_numbers[word]
+                if value in irregular_denominator_values_to_words:
+                    form = irregular_denominator_values_to_words[value]
+                else:
+                    form = self._whole_number_to_regular_denominator(word)
+                replaced_denominator_words.append(self._denominator_forms.get(word))
+                matcher._denominator_forms[word] = form
+                added_denominator_words.append(form)
+
+        if self._units_by_value is not None and added_words["units"]:
+            # Units of equal value stay in vocabulary order, as in a stable sort.
+            units_by_value = list(self._units_by_value)
+            for unit in added_words["units"]:
+                value = vocabulary.units[unit]
+                position = next(
+                    (i for i, other in enumerate(units_by_value) if vocabulary.units[other] < value),
+                    len(units_by_value),
+                )
+                units_by_value.insert(position, unit)
+            matcher._units_by_value = units_by_value
+
+        added_vocabulary_words = [word for words in added_words.values() for word in words]
+        if self._prefilter is not None:
+            # Replaced denominator forms stay in the prefilter, which only makes it accept a few more tokens.
+            matcher._prefilter = self._prefilter.extended(added_vocabulary_words, added_denominator_words)
+        if self._phonetic_index is not None:
+            changed_words = [*added_vocabulary_words, *added_denominator_words, *filter(None, replaced_denominator_words)]
+            positions: Dict[str, int] = {}
+            for position, word in enumerate([*matcher._vocabulary_words(), *matcher._denominator_words()]):
+                positions.setdefault(word, position)
+            matcher._phonetic_index = self._phonetic_index.updated(
+                ((word, self.phonetic_key(word)) for word in changed_words), positions
+            )
+        return matcher
+
+    def build_indexes(self) -> None:
+        """
+        Builds every index of the vocabulary that is otherwise built on first use,
+        such as before forking worker processes that should share them.
+        """
+        self.denominator_forms
+        self.units_by_value
+        self.prefilter
+        if self.phonetic:
+            self.phonetic_index
+
+    @property
+    def denominator_forms(self) -> Dict[str, str]:
+        """
+        Dictionary that maps each whole number word to its denominator form, irregular or regular.
+        It is built on first use.
+        """
+        if self._denominator_forms is None:
+            self._denominator_forms = self._build_denominator_forms()
+        return self._denominator_forms
 
-    def get_match_score(self, a: str, b: str) -> int:
+    def _build_denominator_forms(self) -> Dict[str, str]:
+        """Converts every whole number word to its denominator form."""
+        # Irregular denominator forms take precedence over the language's default rules for forming denominators.
+        irregular_denominator_values_to_words = {
+            v: k for k, v in self.vocabulary.irregular_denominators.items()
+        }
+
+        denominator_forms = {}
+        for word, value in self.vocabulary.whole_numbers.items():
+            if value in irregular_denominator_values_to_words:
+                denominator_forms[word] = irregular_denominator_values_to_words[value]
+            else:
+                denominator_forms[word] = self._whole_number_to_regular_denominator(word)
+        return denominator_forms
+
+    @property
+    def units_by_value(self) -> List[str]:
+        """
+        Unit words sorted in decreasing order of their numerical value, which is the order the parser splits phrases in.
+        It is built on first use.
+        """
+        if self._units_by_value is None:
+            self._units_by_value = [
+                unit
+                for unit, _ in sorted(
+                    self.vocabulary.units.items(), key=lambda x: -x[1]
+                )
+            ]
+        return self._units_by_value
+
+    @property
+    def prefilter(self) -> VocabularyPrefilter:
+        """
+        Prefilter that cheaply rules out tokens which can't match any word of the vocabulary at this matcher's threshold.
+        It is built on first use.
+        """
+        if self._prefilter is None:
+            self._prefilter = self._build_prefilter()
+        return self._prefilter
+
+    def _build_prefilter(self) -> VocabularyPrefilter:
+        """Builds a prefilter from every word of the vocabulary and every denominator form it can produce."""
+        return VocabularyPrefilter(
+            self._vocabulary_words(), self._denominator_words(), self.fuzzy_threshold
+        )
+
+    def _vocabulary_words(self) -> List[str]:
+        """Every word of the vocabulary, in any category."""
+        vocabulary = self.vocabulary
+        return [
+            *vocabulary.digits,
+            *vocabulary.whole_numbers,
+            *vocabulary.units,
+            *vocabulary.irregular_denominators,
+            *vocabulary.fraction_separators,
+            *vocabulary.decimal_separators,
+            *vocabulary.negative_signifiers,
+            *vocabulary.indefinite_articles,
+        ]
+
+    def _denominator_words(self) -> List[str]:
+        """Every denominator form the vocabulary can produce, regular and irregular."""
+        return [
+            *self.vocabulary.irregular_denominators,
+            *self.denominator_forms.values(),
+        ]
+
+    @property
+    def phonetic_index(self) -> PhoneticIndex:
+        """
+        Index of the vocabulary's words by their phonetic key, used for phonetic matching.
+        It is built on first use.
+        """
+        if self._phonetic_index is None:
+            words = [*self._vocabulary_words(), *self._denominator_words()]
+            self._phonetic_index = PhoneticIndex(
+                (word, self.phonetic_key(word)) for word in words
+            )
+        return self._phonetic_index
+
+    def may_match_phonetically(self, word: str) -> bool:
+        """
+        Checks if phonetic matching is enabled and some vocabulary word sounds like the word.
+
+        :param word: Word to check.
+        :return: True if the word has phonetic matches, else False.
+        """
+        return self.phonetic and self.fuzzy_threshold < 100 and bool(
+            self.phonetic_index.block(self.phonetic_key(word))
+        )
+
+    def get_match_score(self, a: str, b: str, cutoff: float = 0) -> int:
         """
         Calculates the fuzzy match score between two strings.
 
         :param a: First string.
         :param b: Second string.
+        :param cutoff: Scores below the cutoff may be reported as 0, which lets the scorer stop early (default: 0).
         :return: A fuzzy match score between 0 and 100, where 0 means no match and 100 means an exact match.
         """
-        return fuzz.ratio(a, b)
+        return self.scorer.score(a, b, cutoff)
 
     def _find_exact_match(
         self, word: str, iterable: Iterable[str]
@@ -48,30 +294,57 @@ class WordMatcher(ABC):
         :param iterable: The iterable to match in.
         :return: The best match if there is one above the fuzzy threshold, else None.
         """
+        return self._score_best_fuzzy_match(word, iterable)[0]
+
+    def _score_best_fuzzy_match(
+        self, word: str, iterable: Iterable[str]
+    ) -> Tuple[Optional[str], int]:
+        """
+        Finds the best fuzzy match for the word in the iterable like `_find_best_fuzzy_match`, together with its score.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :return: The best match and its score if there is one above the fuzzy threshold, else None and 0.
+        """
         best_ratio = 0
         best_match = None
+        threshold = self.fuzzy_threshold
+        score = self.scorer.score
+        word_length = len(word)
+        # Only a score that reaches the threshold and beats the best one so far can change the match,
+        # so lower scores are cut off, and keys whose length rules out such a score are skipped.
+        cutoff = max(threshold, 1)
 
         for key in iterable:
-            ratio = fuzz.ratio(word, key)
+            # The best score of two strings is 200 * shorter length / total length, which rounds up by at most half a point.
+            key_length = len(key)
+            shorter_length = key_length if key_length < word_length else word_length
+            if 200 * shorter_length < (cutoff - 1) * (word_length + key_length):
+                continue
+
+            ratio = score(word, key, cutoff)
 
             if ratio == 100:
-                return word
+                return word, ratio
 
             if ratio > best_ratio:
                 best_ratio = ratio
                 best_match = key
+                cutoff = max(threshold, ratio + 1)
 
         if best_ratio >= self.fuzzy_threshold:
-            return best_match
+            return best_match, best_ratio
         else:
-            return None
+            return None, 0
 
-    def match(self, word: str, iterable: Iterable[str]) -> Optional[str]:
+    def match(self, word: str, iterable: Iterable[str], category: Optional[str] = None) -> Optional[str]:
         """
         Finds a match for the word in the iterable.
 
         :param word: The word to match.
         :param iterable: The iterable to match in.
+        :param category: Name of the vocabulary category the iterable holds, under which the matcher's alias table
+            looks the word up and learns its fuzzy match (default: none, for iterables that aren't a category).
         :return: The match if there is one, else None.
         """
         # In most cases, the word will be an exact match, so we check for that first since it's faster.
@@ -79,10 +352,127 @@ class WordMatcher(ABC):
             return word
 
         if self.fuzzy_threshold < 100:
-            return self._find_best_fuzzy_match(word, iterable)
+            return self._match_fuzzily(word, iterable, category)[0]
         else:
             return None
 
+    def match_with_score(
+        self, word: str, iterable: Iterable[str], category: Optional[str] = None
+    ) -> Tuple[Optional[str], int]:
+        """
+        Finds a match for the word in the iterable like `match`, together with its fuzzy score,
+        which is 100 for exact matches and the fuzzy threshold for phonetic matches, as sounding alike is what makes them match.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :param category: Name of the vocabulary category the iterable holds (default: none).
+        :return: The match and its score if there is one, else None and 0.
+        """
+        if self._find_exact_match(word, iterable):
+            return word, 100
+
+        if self.fuzzy_threshold < 100:
+            return self._match_fuzzily(word, iterable, category)
+        else:
+            return None, 0
+
+    def _match_fuzzily(
+        self, word: str, iterable: Iterable[str], category: Optional[str]
+    ) -> Tuple[Optional[str], int]:
+        """Matches a word that isn't in the iterable, through the match memo if one is set."""
+        if self.match_memo is not None:
+            return self.match_memo.decide(word, iterable, category, self._decide_fuzzy_match)
+        return self._decide_fuzzy_match(word, iterable, category)
+
+    def _decide_fuzzy_match(
+        self, word: str, iterable: Iterable[str], category: Optional[str]
+    ) -> Tuple[Optional[str], int]:
+        """Matches a word that isn't in the iterable by its alias, its sound or its fuzzy score, learning aliases."""
+        aliases = self.aliases if category is not None else None
+        if aliases is not None:
+            alias, score = aliases.lookup_with_score(category, word, self.fuzzy_threshold)
+            if alias is not None and alias in iterable:
+                return alias, score
+        if self.phonetic:
+            phonetic_match = self._find_phonetic_match(word, iterable)
+            if phonetic_match:
+                return phonetic_match, self.fuzzy_threshold
+        if self.score_cache is not None:
+            fuzzy_match, score = self._score_cached_fuzzy_match(word, iterable)
+        else:
+            fuzzy_match, score = self._score_best_fuzzy_match(word, iterable)
+        if aliases is not None and fuzzy_match is not None and fuzzy_match != word:
+            aliases.record(category, word, fuzzy_match, score)
+        return fuzzy_match, score
+
+    def _find_cached_fuzzy_match(
+        self, word: str, iterable: Iterable[str]
+    ) -> Optional[str]:
+        """
+        Finds the best fuzzy match for the word in the iterable like `_find_best_fuzzy_match`,
+        using the word's ranking in the score cache.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :return: The best match if there is one above the fuzzy threshold, else None.
+        """
+        return self._score_cached_fuzzy_match(word, iterable)[0]
+
+    def _score_cached_fuzzy_match(
+        self, word: str, iterable: Iterable[str]
+    ) -> Tuple[Optional[str], int]:
+        """
+        Finds the best fuzzy match for the word in the iterable like `_find_cached_fuzzy_match`, together with its score.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :return: The best match and its score if there is one above the fuzzy threshold, else None and 0.
+        """
+        ranking = self.score_cache.rank(word, tuple(iterable), self.scorer)
+        best_match = ranking.best_match(self.fuzzy_threshold)
+        if best_match is None:
+            return None, 0
+
+        key, score = best_match
+        return (word if score == 100 else key), score
+
+    def rank_units(self, word: str) -> Dict[str, int]:
+        """
+        Looks up the fuzzy scores of a word against the units in the score cache.
+        Fuzzy scores are symmetric, so they also tell how well each unit matches the word.
+
+        :param word: The word to score.
+        :return: Scores of the units that score more than 0, keyed by unit.
+        """
+        ranking = self.score_cache.rank(word, self._unit_words, self.scorer)
+        return dict(ranking.scores)
+
+    def _find_phonetic_match(
+        self, word: str, iterable: Iterable[str]
+    ) -> Optional[str]:
+        """
+        Finds the vocabulary word that sounds like the word, if it is in the iterable.
+        Of several vocabulary words that sound alike, the one with the highest fuzzy score is the match, in any category,
+        so that a word matches the same vocabulary word whichever category is tried first.
+        Sounding alike is what makes it a match, so the fuzzy threshold doesn't apply.
+
+        :param word: The word to match.
+        :param iterable: The iterable to match in.
+        :return: The vocabulary word that sounds like the word if it is in the iterable, else None.
+        """
+        block = self.phonetic_index.block(self.phonetic_key(word))
+        if not block:
+            return None
+
+        if len(block) == 1:
+            closest = block[0]
+        else:
+            score = self.scorer.score
+            # The first of equally close words wins, as in the fuzzy match.
+            closest = max(block, key=lambda key: score(word, key))
+
+        return closest if closest in iterable else None
+
     def match_unit(self, word: str) -> Optional[str]:
         """
         Matches a word with a unit word.
@@ -90,7 +480,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched unit word or None.
         """
-        return self.match(word, self.vocabulary.units)
+        return self.match(word, self.vocabulary.units, "units")
 
     def match_digit(self, word: str) -> Optional[str]:
         """
@@ -99,7 +489,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched digit word or None.
         """
-        return self.match(word, self.vocabulary.digits)
+        return self.match(word, self.vocabulary.digits, "digits")
 
     def match_whole_number(self, word: str) -> Optional[str]:
         """
@@ -108,7 +498,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched whole number word or None.
         """
-        return self.match(word, self.vocabulary.whole_numbers)
+        return self.match(word, self.vocabulary.whole_numbers, "whole_numbers")
 
     def match_negative_signifier(self, word: str) -> Optional[str]:
         """
@@ -117,7 +507,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched negative signifier or None.
         """
-        return self.match(word, self.vocabulary.negative_signifiers)
+        return self.match(word, self.vocabulary.negative_signifiers, "negative_signifiers")
 
     def match_decimal_separator(self, word: str) -> Optional[str]:
         """
@@ -126,7 +516,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched decimal separator word or None.
         """
-        return self.match(word, self.vocabulary.decimal_separators)
+        return self.match(word, self.vocabulary.decimal_separators, "decimal_separators")
 
     def match_indefinite_article(self, word: str) -> Optional[str]:
         """
@@ -135,7 +525,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched indefinite article or None.
         """
-        return self.match(word, self.vocabulary.indefinite_articles)
+        return self.match(word, self.vocabulary.indefinite_articles, "indefinite_articles")
 
     def match_fraction_separator(self, word: str) -> Optional[str]:
         """
@@ -144,7 +534,7 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched fraction separator or None.
         """
-        return self.match(word, self.vocabulary.fraction_separators)
+        return self.match(word, self.vocabulary.fraction_separators, "fraction_separators")
 
     def _match_regular_denominator(self, word: str) -> tuple:
         """
@@ -162,7 +552,7 @@ class WordMatcher(ABC):
         if base_word:
             denominator_value = self.vocabulary.whole_numbers[base_word]
             correct_form = self._whole_number_to_denominator(base_word)
-            match_score = self.get_match_score(word, correct_form)
+            match_score = self.get_match_score(word, correct_form, self.fuzzy_threshold)
 
         if match_score < self.fuzzy_threshold:
             # It's possible that we found a matching base word but the denominator form fails the fuzzy score requirement.
@@ -182,7 +572,7 @@ class WordMatcher(ABC):
         match_score = 0
         irregular_value = None
         irregular_denominators = self.vocabulary.irregular_denominators
-        match = self.match(word, irregular_denominators)
+        match = self.match(word, irregular_denominators, "irregular_denominators")
 
         if match:
             irregular_value = irregular_denominators[match]
@@ -201,6 +591,16 @@ class WordMatcher(ABC):
         """
         pass
 
+    @abstractclassmethod
+    def phonetic_key(self, word: str) -> str:
+        """
+        Calculates the phonetic key of a word using the language's rules, which is the same for words that sound alike.
+
+        :param word: Word to calculate the key of.
+        :return: Phonetic key of the word, or an empty string if it has none.
+        """
+        pass
+
     @abstractclassmethod
     def _whole_number_to_regular_denominator(self, word: str) -> str:
         """
@@ -220,18 +620,7 @@ class WordMatcher(ABC):
         :param word: Whole number word to convert.
         :return: Denominator form of the word.
         """
-        # First check if the word has an irregular denominator form.
-        irregular_denominator_values_to_words = {
-            v: k for k, v in self.vocabulary.irregular_denominators.items()
-        }
-
-        # Get the numerical form of the word to check if it has an irregular denominator form.
-        whole_number_value = self.vocabulary.whole_numbers[word]
-        if whole_number_value in irregular_denominator_values_to_words:
-            return irregular_denominator_values_to_words[whole_number_value]
-
-        # A matching irregular denominator wasn't found, so use the language's default rules for forming the denominator word.
-        return self._whole_number_to_regular_denominator(word)
+        return self.denominator_forms[word]
 
     def match_denominator(self, word: str) -> float:
         """
@@ -241,6 +630,12 @@ class WordMatcher(ABC):
         :param word: Word to match.
         :return: Matched denominator value or None.
         """
+        if self.match_memo is not None:
+            return self.match_memo.denominator(word, self._score_denominator)
+        return self._score_denominator(word)[0]
+
+    def _score_denominator(self, word: str) -> Tuple[Optional[float], int]:
+        """Matches the word to a denominator like `match_denominator`, returning the value and its fuzzy score."""
         irregular_match = self._match_irregular_denominator(word)
         irregular_value, irregular_score = irregular_match
 
@@ -250,13 +645,13 @@ class WordMatcher(ABC):
         if irregular_score and regular_score:
             # We found both a regular and irregular denominator match, so return the one with the higher score.
             return (
-                irregular_value
+                irregular_match
                 if irregular_score > regular_score
-                else regular_value
+                else regular_match
             )
         elif irregular_score:
-            return irregular_value
+            return irregular_match
         elif regular_score:
-            return regular_value
+            return regular_match
         else:
-            return None
+            return None, 0